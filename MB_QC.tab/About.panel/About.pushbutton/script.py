@@ -1,38 +1,13 @@
 # dependencies
-import clr
-clr.AddReference('System.Windows.Forms')
-# clr.AddReference('IronPython.Wpf')
-
-import sys, os
+# Only what the window needs: no Dynamo (RevitNodes), RevitServices or RevitAPI star imports.
+import os
 import webbrowser
 
-#Importing external libraries
-clr.AddReference("RevitNodes")
-import Revit
-clr.ImportExtensions(Revit.Elements)
-clr.AddReference("RevitServices")
-import RevitServices
-from RevitServices.Persistence import DocumentManager
-clr.AddReference("RevitAPI")
-import Autodesk
-from Autodesk.Revit.DB import *
 import System
-from System.Collections.Generic import *
-
-import re
-from collections import namedtuple
-
-from pyrevit import forms
-from pyrevit import revit, DB
 
-#Defining our current Revit document as 'doc'
-uidoc = __revit__.ActiveUIDocument
-doc = __revit__.ActiveUIDocument.Document
+__doc__ = 'MB-QC toolbar'
 
-__doc__ = 'MB-QC toolbar'\
-          
 # find the path of ui.xaml
-from pyrevit import UI
 from pyrevit import script
 
 
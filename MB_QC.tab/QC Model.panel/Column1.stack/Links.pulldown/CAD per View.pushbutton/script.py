@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+__title__ = "CAD per View"                    # Name of the button displayed in Revit UI
+__doc__ = """Version = 1.0
+Date    = 18.10.2026
+_____________________________________________________________________
+Description:
+
+Count the Linked and Imported CAD instances of the model:
+- per View (with the number of CAD files in it)
+- per CAD file (with the number of Views it's placed in)
+Every CAD instance is read once for both tables.
+
+_____________________________________________________________________
+How-to:
+
+- Click Button
+_____________________________________________________________________
+Last update:
+- [18.10.2026] - 1 RELEASE
+_____________________________________________________________________
+Author: Nattalie Mor"""# Button Description shown in Revit UI
+
+# EXTRA: You can remove them.
+__author__ = "Nattalie Mor"                                       # Script's Author
+__min_revit_ver__ = 2019                                        # Limit your Scripts to certain Revit versions if it's not compatible due to RevitAPI Changes.
+__max_revit_ver = 2024                                          # Limit your Scripts to certain Revit versions if it's not compatible due to RevitAPI Changes.
+# __context__     = ['Walls', 'Floors', 'Roofs']                # Make your button available only when certain categories are selected. Or Revit/View Types.
+
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+# pyRevit
+from pyrevit import script                                      # import pyRevit modules. (Lots of useful features)
+
+# Custom Imports
+from Snippets._checks  import run_check                         # lib import
+from Snippets._incremental import get_model_data
+from Snippets._report import print_result, print_footer
+from Snippets._profiling import profile_script
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+doc    = __revit__.ActiveUIDocument.Document    # Document   class from RevitAPI that represents project. Used to Create, Delete, Modify and Query elements from the project.
+output = script.get_output()
+
+# ╔╦╗╔═╗╦╔╗╔
+# ║║║╠═╣║║║║
+# ╩ ╩╩ ╩╩╝╚╝ MAIN
+# ==================================================
+with profile_script(__title__):
+    data    = get_model_data(doc)
+    by_view = run_check('cad_by_view', data)
+    if by_view.is_empty:
+        print_result(output, by_view, alert_title="CAD per View")
+    else:
+        print_result(output, by_view)
+        print_result(output, run_check('cad_by_file', data))
+        print_footer()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+__title__ = "Link Sources"                    # Name of the button displayed in Revit UI
+__doc__ = """Version = 1.0
+Date    = 18.10.2026
+_____________________________________________________________________
+Description:
+
+Check the source files of the Revit and CAD links on disk:
+Missing files, files that don't answer (slow or offline server),
+Size, Modified date, and sources saved after the model file
+("Newer than Model": the model may show an older version).
+Files are checked in parallel, nothing is loaded.
+
+_____________________________________________________________________
+How-to:
+
+- Click Button
+_____________________________________________________________________
+Last update:
+- [18.10.2026] - 1 RELEASE
+_____________________________________________________________________
+Author: Nattalie Mor"""# Button Description shown in Revit UI
+
+# EXTRA: You can remove them.
+__author__ = "Nattalie Mor"                                       # Script's Author
+__min_revit_ver__ = 2019                                        # Limit your Scripts to certain Revit versions if it's not compatible due to RevitAPI Changes.
+__max_revit_ver = 2024                                          # Limit your Scripts to certain Revit versions if it's not compatible due to RevitAPI Changes.
+# __context__     = ['Walls', 'Floors', 'Roofs']                # Make your button available only when certain categories are selected. Or Revit/View Types.
+
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+# pyRevit
+from pyrevit import script                                      # import pyRevit modules. (Lots of useful features)
+
+# Custom Imports
+from Snippets._file_audit import audit_external_files            # lib import
+from Snippets._incremental import get_model_data
+from Snippets._report import print_result, print_footer
+from Snippets._profiling import profile_script
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+doc    = __revit__.ActiveUIDocument.Document    # Document   class from RevitAPI that represents project. Used to Create, Delete, Modify and Query elements from the project.
+output = script.get_output()
+
+# ╔╦╗╔═╗╦╔╗╔
+# ║║║╠═╣║║║║
+# ╩ ╩╩ ╩╩╝╚╝ MAIN
+# ==================================================
+# Not part of "Run All Checks": the file server is asked on every click, results are never cached.
+with profile_script(__title__):
+    result = audit_external_files(get_model_data(doc))
+    print_result(output, result, alert_title="Link Sources")
+    if not result.is_empty:
+        print_footer()
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+__title__ = "Ceilings Structure"
+__author__ = "Nattalie Mor"
+__version__ = 'Version: 1'
+__doc__ = """Version: 1
+Date    = 18.10.2026
+_____________________________________________________________________
+Description:
+
+List the Compound Ceiling types of the project with their width, function,
+structural material and a table of their layers.
+
+_____________________________________________________________________
+How-to:
+
+- Click Button
+_____________________________________________________________________
+Last update:
+- [18.10.2026] - 1 RELEASE
+_____________________________________________________________________
+Author: Nattalie Mor"""
+
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+# pyRevit
+from pyrevit import script                                      # import pyRevit modules. (Lots of useful features)
+
+# Custom Imports
+from Snippets._checks  import run_check                         # lib import
+from Snippets._incremental import get_model_data
+from Snippets._report import print_result, print_footer
+from Snippets._profiling import profile_script
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+doc    = __revit__.ActiveUIDocument.Document    # Document   class from RevitAPI that represents project. Used to Create, Delete, Modify and Query elements from the project.
+output = script.get_output()
+
+# ╔╦╗╔═╗╦╔╗╔
+# ║║║╠═╣║║║║
+# ╩ ╩╩ ╩╩╝╚╝ MAIN
+# ==================================================
+with profile_script(__title__):
+    result = run_check('ceiling_structure', get_model_data(doc))
+    print_result(output, result, alert_title="Ceiling Types")
+    if not result.is_empty:
+        print_footer()
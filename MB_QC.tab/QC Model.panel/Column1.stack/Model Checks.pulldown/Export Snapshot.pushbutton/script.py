@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+__title__ = "Export Snapshot"                           # Name of the button displayed in Revit UI
+__doc__ = """Version = 1.0
+Date    = 18.10.2026
+_____________________________________________________________________
+Description:
+
+Export the data read by the QC checks (Levels, Grids, Scope Boxes,
+Links and Base Points, CAD instances, Wall/Floor layers) into an
+offline snapshot file (.mbqc).
+
+Snapshots can be checked without Revit:
+QCSession(load_snapshot(path)).run()
+_____________________________________________________________________
+How-to:
+
+- Click Button
+- Choose where to save the snapshot
+_____________________________________________________________________
+Last update:
+- [18.10.2026] - 1 RELEASE
+_____________________________________________________________________
+Author: Nattalie Mor"""# Button Description shown in Revit UI
+
+# EXTRA: You can remove them.
+__author__ = "Nattalie Mor"                                       # Script's Author
+__min_revit_ver__ = 2019                                        # Limit your Scripts to certain Revit versions if it's not compatible due to RevitAPI Changes.
+
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+# pyRevit
+from pyrevit import forms                                       # import pyRevit modules. (Lots of useful features)
+
+# Custom Imports
+from Snippets._extract  import export_snapshot                  # lib import
+from Snippets._snapshot import SNAPSHOT_EXT
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+doc = __revit__.ActiveUIDocument.Document       # Document   class from RevitAPI that represents project. Used to Create, Delete, Modify and Query elements from the project.
+
+# ╔╦╗╔═╗╦╔╗╔
+# ║║║╠═╣║║║║
+# ╩ ╩╩ ╩╩╝╚╝ MAIN
+# ==================================================
+path = forms.save_file(file_ext=SNAPSHOT_EXT, default_name=doc.Title)
+if not path:
+    forms.alert("No file was selected.", "Export Snapshot", exitscript=True)
+
+export_snapshot(doc, path)
+forms.alert("Snapshot saved:\n{}".format(path), "Export Snapshot", 'Tool has been developed by Miss BIM.')
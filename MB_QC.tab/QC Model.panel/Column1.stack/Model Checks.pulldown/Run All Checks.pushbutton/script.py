@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+__title__ = "Run All Checks"                           # Name of the button displayed in Revit UI
+__doc__ = """Version = 1.0
+Date    = 18.10.2026
+_____________________________________________________________________
+Description:
+
+Run every QC check (Base Point, Levels, Grids, Scope Boxes, Links,
+Linked/Imported CAD, Walls/Floors/Roofs/Ceilings Structure) in one
+session and get a single report with the time spent on each check.
+
+The model is scanned once and all checks share the same index.
+_____________________________________________________________________
+How-to:
+
+- Click Button
+- Shift+Click to re-read the whole model instead of
+  only the elements changed since the previous run
+_____________________________________________________________________
+Last update:
+- [18.10.2026] - 1 RELEASE
+- [18.10.2026] - Roofs and Ceilings Structure checks
+- [18.10.2026] - Nested Links check (link tree)
+- [18.10.2026] - External References check (links not loaded)
+- [18.10.2026] - CAD per View and CAD per File checks
+_____________________________________________________________________
+Author: Nattalie Mor"""# Button Description shown in Revit UI
+
+# EXTRA: You can remove them.
+__author__ = "Nattalie Mor"                                       # Script's Author
+__min_revit_ver__ = 2019                                        # Limit your Scripts to certain Revit versions if it's not compatible due to RevitAPI Changes.
+
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+# pyRevit
+from pyrevit import script, EXEC_PARAMS                         # import pyRevit modules. (Lots of useful features)
+
+# Custom Imports
+from Snippets._qc_runner   import QCSession                     # lib import
+from Snippets._incremental import get_model_data
+from Snippets._report      import print_report
+from Snippets._profiling   import profile_script
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+doc    = __revit__.ActiveUIDocument.Document    # Document   class from RevitAPI that represents project. Used to Create, Delete, Modify and Query elements from the project.
+output = script.get_output()
+
+# ╔╦╗╔═╗╦╔╗╔
+# ║║║╠═╣║║║║
+# ╩ ╩╩ ╩╩╝╚╝ MAIN
+# ==================================================
+# Shift+Click: forget cached tables and results and read the whole model again.
+with profile_script(__title__):
+    session = QCSession(get_model_data(doc, rebuild=EXEC_PARAMS.config_mode))
+    results = session.run()
+    print_report(output, results, session.scan_time)
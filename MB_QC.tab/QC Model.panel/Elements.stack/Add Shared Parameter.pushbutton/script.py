@@ -20,6 +20,8 @@ _____________________________________________________________________
 Last update:
 - [27.06.2024] - 1 REALESE
 - [23.10.2024] - 1 REALESE
+- [18.10.2026] - Both parameters added in one Undo step, with a report of what was added
+- [18.10.2026] - In projects, bound to Project Information (set in param_categories)
 _____________________________________________________________________
 Author: Nattalie Mor"""# Button Description shown in Revit UI
 
@@ -32,69 +34,45 @@ __max_revit_ver = 2024                                          # Limit your Scr
 # __context__     = ['Walls', 'Floors', 'Roofs']                # Make your button available only when certain categories are selected. Or Revit/View Types.
 
 
-# Import necessary modules
-from pyrevit import revit, DB
-from pyrevit import forms, script
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+from pyrevit import revit
+from pyrevit import script
 
+# Custom Imports
+from Snippets._shared_params import SharedParameterFile, ParameterSpec, bind_parameters
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
 # File path to the shared parameters file
 shared_param_file = r'C:\Users\natim\Dropbox\Miss BIM\Template\MissBIM_Shared Parameters.txt'
 # Shared parameters names
 param_1 = "Copy Rights"
 param_2 = "Copy Rights®Miss BIM"
+# Categories the parameters are bound to in projects (BuiltInCategory or category names).
+# Before, they were bound to an empty category set: present in the project, but on no element.
+param_categories = ['OST_ProjectInformation']
 
-# Open shared parameters file
-app = revit.doc.Application
-app.SharedParametersFilename = shared_param_file
-shared_param_file = app.OpenSharedParameterFile()
-
-# Find the parameters in the shared parameters file
-def get_shared_parameter_definition(param_name):
-    for group in shared_param_file.Groups:
-        for defn in group.Definitions:
-            if defn.Name == param_name:
-                return defn
-    return None
-
-# Add shared parameters to the document
-def add_shared_parameter(param_def, param_group, is_instance=False):
-    with revit.Transaction('Add Shared Parameter'):
-        # Set up the binding
-        param_binding = revit.doc.FamilyManager if revit.doc.IsFamilyDocument else revit.doc.ParameterBindings
-        if not revit.doc.IsFamilyDocument:
-            # Create binding for project documents
-            binding = DB.InstanceBinding(app.Create.NewCategorySet())
-            revit.doc.ParameterBindings.Insert(param_def, binding, param_group)
-        else:
-            # Create parameter for family documents
-            family_manager = revit.doc.FamilyManager
-            family_manager.AddParameter(param_def, param_group, is_instance)
-
-# Add the formula to the shared parameter in family or project
-def set_parameter_formula(param_name, formula):
-    if revit.doc.IsFamilyDocument:
-        with revit.Transaction("Set Parameter Formula"):
-            param = revit.doc.FamilyManager.get_Parameter(param_name)
-            if param:
-                revit.doc.FamilyManager.SetFormula(param, formula)
-    else:
-        with revit.Transaction("Set Parameter Formula"):
-            param = revit.doc.GetElement(param_name)
-            if param:
-                param.SetFormula(formula)
-
-
-# Get shared parameters definitions
-param_1_def = get_shared_parameter_definition(param_1)
-param_2_def = get_shared_parameter_definition(param_2)
+# Manifest: both parameters under 'Identity Data'. Projects bind them as Instance parameters,
+# families add them as Type parameters with their formulas.
+is_instance = not revit.doc.IsFamilyDocument
+manifest = [ParameterSpec(param_1, param_categories, 'PG_IDENTITY_DATA', is_instance, formula=param_2),
+            ParameterSpec(param_2, param_categories, 'PG_IDENTITY_DATA', is_instance, formula='"Miss BIM"')]
 
-if param_1_def and param_2_def:
-    # Add shared parameters to the document under 'Identity Data' group
-    group = DB.BuiltInParameterGroup.PG_IDENTITY_DATA
-    add_shared_parameter(param_1_def, group)
-    add_shared_parameter(param_2_def, group)
+# ╔╦╗╔═╗╦╔╗╔
+# ║║║╠═╣║║║║
+# ╩ ╩╩ ╩╩╝╚╝ MAIN
+# ==================================================
+# The shared parameter file is read once, everything is added in a single Undo step.
+index   = SharedParameterFile(revit.doc.Application, shared_param_file)
+missing = [spec.name for spec in manifest if spec.name not in index]
+if missing:
+    script.exit('Shared parameters not found.')
 
-    # Set formulas
-    set_parameter_formula(param_1, 'Copy Rights®Miss BIM')
-    set_parameter_formula(param_2, '"Miss BIM"')
-else:
-    script.exit('Shared parameters not found.')
\ No newline at end of file
+report = bind_parameters(revit.doc, index, manifest, name="Add Shared Parameters")
+script.get_output().print_table(table_data=[list(row) for row in report], title="Shared Parameters",
+                                columns=["Parameter", "Status"])
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+__title__ = "Batch Family Parameters"                   # Name of the button displayed in Revit UI
+__doc__ = """Version = 1.0
+Date    = 18.10.2026
+_____________________________________________________________________
+Description:
+
+Add the same Shared Parameters (and formulas) to every family
+of a folder and its sub folders. Families are opened in the
+background, changed in a single transaction, saved and closed.
+
+Progress is kept in the folder (mbqc_family_batch.jsonl):
+run it again to continue where it stopped.
+_____________________________________________________________________
+How-to:
+
+- Click Button
+- Choose the folder of families
+- Choose the parameter manifest (.json), e.g.
+  [{"name": "Copy Rights", "group": "PG_IDENTITY_DATA",
+    "is_instance": true, "formula": "\\"Miss BIM\\""}]
+- Choose Dry Run (nothing is saved) or Apply
+_____________________________________________________________________
+Last update:
+- [18.10.2026] - 1 RELEASE
+_____________________________________________________________________
+Author: Nattalie Mor"""# Button Description shown in Revit UI
+
+# EXTRA: You can remove them.
+__author__ = "Nattalie Mor"                                       # Script's Author
+__min_revit_ver__ = 2019                                        # Limit your Scripts to certain Revit versions if it's not compatible due to RevitAPI Changes.
+__max_revit_ver = 2024                                          # Limit your Scripts to certain Revit versions if it's not compatible due to RevitAPI Changes.
+
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import os
+
+# pyRevit
+from pyrevit import forms, script                               # import pyRevit modules. (Lots of useful features)
+
+# Custom Imports
+from Snippets._shared_params import SharedParameterFile, load_manifest    # lib import
+from Snippets._family_batch  import FamilyBatch, find_families, CHECKPOINT_NAME
+from Snippets._profiling     import profile_script
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+app    = __revit__.Application                  # Application class from RevitAPI. Opens the families in the background.
+output = script.get_output()
+
+# ╔╦╗╔═╗╦╔╗╔
+# ║║║╠═╣║║║║
+# ╩ ╩╩ ╩╩╝╚╝ MAIN
+# ==================================================
+folder = forms.pick_folder(title="Folder of Families")
+if not folder:
+    forms.alert("No folder was selected.", __title__, exitscript=True)
+
+manifest_path = forms.pick_file(file_ext='json', title="Parameter Manifest")
+if not manifest_path:
+    forms.alert("No manifest was selected.", __title__, exitscript=True)
+
+mode = forms.alert("Check the families first, or apply the parameters?", __title__,
+                   options=["Dry Run", "Apply"])
+if not mode:
+    script.exit()
+
+# The shared parameter file set in Revit is read once for every family.
+try:
+    index = SharedParameterFile(app)
+except IOError:
+    forms.alert("Set a Shared Parameter file in Revit first (Manage > Shared Parameters).", __title__, exitscript=True)
+
+batch = FamilyBatch(app, index, load_manifest(manifest_path),
+                    checkpoint=os.path.join(folder, CHECKPOINT_NAME), dry_run=mode == "Dry Run")
+paths = find_families(folder)
+
+with profile_script(__title__):
+    with forms.ProgressBar(title="Families: {value} of {max_value}", cancellable=True) as pb:
+        def progress(done, total):
+            pb.update_progress(done, total)
+            return pb.cancelled     # Stop: the next run continues from the checkpoint.
+        summary = batch.run(paths, progress=progress)
+
+output.print_table(table_data=[[status, count] for status, count in summary.items() if count],
+                   title="{} ({} families in the folder)".format(mode, len(paths)), columns=["Status", "Families"])
+if batch.failures:
+    output.print_table(table_data=[[os.path.relpath(r['path'], folder), (r['error'] or 'Failed').strip().splitlines()[-1]]
+                                   for r in batch.failures],
+                       title="Failed", columns=["Family", "Error"])
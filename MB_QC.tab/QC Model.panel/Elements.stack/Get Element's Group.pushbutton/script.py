@@ -1,12 +1,63 @@
-from pyrevit import script, revit, DB
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+# pyRevit
+from pyrevit import forms, script, EXEC_PARAMS                  # import pyRevit modules. (Lots of useful features)
 
-selection = revit.get_selection()
+# Custom Imports
+from Snippets._groups    import GroupIndex, find_copies, group_types_result, group_instances_result, copies_result
+from Snippets._scanner   import id_int
+from Snippets._selection import set_selection
+from Snippets._report    import print_result, print_footer
+from Snippets._profiling import profile_script
 
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+TITLE  = "Get the Group"
+uidoc  = __revit__.ActiveUIDocument
+doc    = uidoc.Document
+output = script.get_output()
 
-if not selection.is_empty:
-    el = revit.doc.GetElement(selection.first.Id)
-    try:
-        group_id = el.GroupId
-        selection = selection.set_to(group_id)
-    except AttributeError:
-        print ("Element is not part of any Group.")
\ No newline at end of file
+# ╔╦╗╔═╗╦╔╗╔
+# ║║║╠═╣║║║║
+# ╩ ╩╩ ╩╩╝╚╝ MAIN
+# ==================================================
+selected_ids = [id_int(e_id) for e_id in uidoc.Selection.GetElementIds()]
+
+# Click: select the Groups of the selected elements.
+# Shift+Click, or nothing selected: choose between selecting the Groups, their members, or an audit report.
+with profile_script(TITLE):
+    index = GroupIndex(doc)      # Every group and its members, read once.
+    if not index:
+        forms.alert("There are no Groups in the model.", TITLE, exitscript=True)
+
+    if selected_ids:
+        group_ids = index.groups_of(selected_ids, top=True)
+        if not group_ids:
+            forms.alert("Elements are not part of any Group.", TITLE, exitscript=True)
+    else:
+        group_ids = [g for g, record in index.groups.items() if record.parent_id is None]
+
+    if selected_ids and not EXEC_PARAMS.config_mode:
+        action = "Select Groups"
+    else:
+        action = forms.alert("{} Group(s) found.".format(len(group_ids)), TITLE,
+                             options=["Select Groups", "Select Members", "Audit Report"])
+
+    if action == "Select Groups":
+        set_selection(group_ids, uidoc)
+
+    elif action == "Select Members":
+        set_selection([m for m in index.members(group_ids) if m not in index.groups], uidoc)
+
+    elif action == "Audit Report":
+        nested_ids = [m for m in index.members(group_ids) if m in index.groups]
+        type_ids   = set(index.groups[g].type_id for g in group_ids + nested_ids)
+        print_result(output, group_types_result(index, group_ids + nested_ids))
+        print_result(output, group_instances_result(index, group_ids + nested_ids))
+        print_result(output, copies_result(index, find_copies(doc, index, type_ids)))
+        print_footer()
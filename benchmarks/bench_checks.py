@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""Time every QC check on synthetic models, outside Revit.
+
+For each model size:
+- button:      a single check on a fresh LiveModelData (what one button click does, cold caches)
+- warm:        the same, with the process-level caches of a previous click (rocket mode, Snippets._cache)
+- offline:     the same check on a snapshot of the model (pure Python, no extraction)
+- Run All:     every check in one QCSession, including the shared model scan
+- incremental: Run All again after editing a few elements (IncrementalModelData)
+
+Usage (from the repository root):
+    python benchmarks/bench_checks.py [--sizes 1k,10k,100k] [--repeat 3] [--json bench.json]"""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import io
+import os
+import sys
+import json
+import time
+import argparse
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [HERE, os.path.join(os.path.dirname(HERE), 'lib')]
+
+import revit_stub
+revit_stub.install()
+
+from synthetic import build_model, SIZES
+
+from Snippets._cache       import clear_caches
+from Snippets._checks      import CHECKS, run_check
+from Snippets._extract     import LiveModelData
+from Snippets._snapshot    import ModelData
+from Snippets._qc_runner   import QCSession
+from Snippets._incremental import get_model_data
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def best_of(repeat, func):
+    """Fastest wall-clock time of `repeat` calls. Returns (seconds, last return value)."""
+    best, value = None, None
+    for _ in range(repeat):
+        start   = time.time()
+        value   = func()
+        elapsed = time.time() - start
+        best    = elapsed if best is None else min(best, elapsed)
+    return best, value
+
+
+def cold_live_data(doc):
+    """LiveModelData as a first button click sees it: no cached resolver, material or base point names."""
+    clear_caches()
+    return LiveModelData(doc)
+
+
+def edit_some_elements(doc, count=10):
+    """Rename a few wall types and levels and report them like a committed transaction."""
+    levels     = [el for el in doc.elements() if isinstance(el, revit_stub.Level)]
+    wall_types = [el for el in doc.elements() if isinstance(el, revit_stub.WallType)]
+    edited     = levels[:count // 2] + wall_types[:count - count // 2]
+    for el in edited:
+        el.Name += u' (edited)'
+        name = el.get_Parameter(revit_stub.BuiltInParameter.SYMBOL_NAME_PARAM)
+        if name:
+            name.value += u' (edited)'
+    doc.notify_changed(modified=[el.Id.Value for el in edited])
+    return len(edited)
+
+
+def bench_size(label, size, repeat):
+    build_time, doc = best_of(1, lambda: build_model(size))
+    result = {'model': label, 'elements': len(doc._elements), 'build': build_time, 'checks': {}}
+
+    snapshot = ModelData.from_dict(cold_live_data(doc).extract_all().to_dict())
+    for name in CHECKS:
+        button,  res = best_of(repeat, lambda: run_check(name, cold_live_data(doc)))
+        warm,    _   = best_of(repeat, lambda: run_check(name, LiveModelData(doc)))
+        offline, _   = best_of(repeat, lambda: CHECKS[name].func(snapshot))
+        result['checks'][name] = {'button': button, 'warm': warm, 'offline': offline, 'rows': len(res.rows)}
+
+    def run_all():
+        session = QCSession(cold_live_data(doc))
+        session.run()
+        return session
+    result['run_all'], session = best_of(repeat, run_all)
+    result['scan'] = session.scan_time
+
+    # Incremental: first run fills the cache, the re-run only reads the edited elements.
+    get_model_data(doc, rebuild=True)
+    QCSession(get_model_data(doc)).run()
+    edited = edit_some_elements(doc)
+    start   = time.time()
+    patched = QCSession(get_model_data(doc)).run()
+    rerun   = time.time() - start
+
+    # The patched tables must give the same rows as a full extraction.
+    fresh   = QCSession(cold_live_data(doc)).run()
+    matches = all(a.rows == b.rows for a, b in zip(patched, fresh))
+    result['incremental'] = {'edited': edited, 'rerun': rerun, 'matches_full_run': matches}
+    return result
+
+
+def print_result(result):
+    print(u'\n{model} model: {elements} elements (built in {build:.2f}s)'.format(**result))
+    print(u'{:<26} {:>8} {:>12} {:>12} {:>12}'.format('Check', 'Rows', 'Button (s)', 'Warm (s)', 'Offline (s)'))
+    for name, timing in result['checks'].items():
+        print(u'{:<26} {:>8} {:>12.4f} {:>12.4f} {:>12.4f}'.format(name, timing['rows'], timing['button'],
+                                                                  timing['warm'], timing['offline']))
+    print(u'{:<26} {:>8} {:>12.4f}   (scan {:.4f}s)'.format('Run All Checks', '', result['run_all'], result['scan']))
+    incremental = result['incremental']
+    print(u'{:<26} {:>8} {:>12.4f}   ({} elements edited, {})'.format(
+        'Incremental re-run', '', incremental['rerun'], incremental['edited'],
+        'same rows as a full run' if incremental['matches_full_run'] else 'ROWS DIFFER FROM A FULL RUN'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark MB_QC checks on synthetic models.')
+    parser.add_argument('--sizes',  default='1k,10k,100k', help='Comma separated: {}'.format(', '.join(SIZES)))
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement, the fastest is kept.')
+    parser.add_argument('--json',   default=None, help='Also write the results to this file.')
+    args = parser.parse_args(argv)
+
+    results = []
+    for label in args.sizes.split(','):
+        label = label.strip()
+        size  = SIZES[label] if label in SIZES else int(label)
+        results.append(bench_size(label, size, args.repeat))
+        print_result(results[-1])
+
+    if args.json:
+        with io.open(args.json, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(results, indent=1))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""Run the family batch (Snippets._family_batch) on a folder of family stand-ins, outside Revit.
+
+Families are the JSON stand-ins of revit_stub.FamilyDocument, written to a temporary folder with
+a shared parameter file. Some already have the parameters, one is not readable (it fails).
+1. dry run:  every family is checked, no file may change
+2. run:      stopped after half of the families (--stop), progress in the checkpoint file
+3. resume:   the same run again only processes the rest
+4. again:    nothing left to do
+Each step prints the family statuses, the largest number of open documents and of transactions per family.
+
+Usage (from the repository root):
+    python benchmarks/bench_family_batch.py [--families 500] [--stop 250]"""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [HERE, os.path.join(os.path.dirname(HERE), 'lib')]
+
+import revit_stub
+revit_stub.install()
+
+from Snippets._shared_params import SharedParameterFile, ParameterSpec
+from Snippets._family_batch  import FamilyBatch, find_families, CHECKPOINT_NAME
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+SHARED_PARAMETERS = [('4a1b2c3d-0000-4000-8000-000000000001', u'Copy Rights'),
+                     ('4a1b2c3d-0000-4000-8000-000000000002', u'Copy Rights®Miss BIM'),
+                     ('4a1b2c3d-0000-4000-8000-000000000003', u'Fire Rating')]
+
+MANIFEST = [ParameterSpec(u'Copy Rights',          group='PG_IDENTITY_DATA', formula=u'Copy Rights®Miss BIM'),
+            ParameterSpec(u'Copy Rights®Miss BIM', group='PG_IDENTITY_DATA', formula=u'"Miss BIM"'),
+            ParameterSpec(u'Fire Rating',          group='PG_DATA', is_instance=False)]
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def write_shared_parameter_file(path):
+    lines = [u'# This is a Revit shared parameter file.', u'*META\tVERSION\tMINVERSION', u'META\t2\t1',
+             u'*GROUP\tID\tNAME', u'GROUP\t1\tMiss BIM',
+             u'*PARAM\tGUID\tNAME\tDATATYPE\tDATACATEGORY\tGROUP\tVISIBLE\tDESCRIPTION\tUSERMODIFIABLE']
+    lines += [u'PARAM\t{}\t{}\tTEXT\t\t1\t1\t\t1'.format(guid, name) for guid, name in SHARED_PARAMETERS]
+    with io.open(path, 'w', encoding='utf-8') as f:
+        f.write(u'\n'.join(lines) + u'\n')
+
+
+def write_families(folder, count):
+    """count family stand-ins in sub folders, 1 in 5 already complete, the last one unreadable."""
+    for i in range(count):
+        sub  = os.path.join(folder, 'Category {}'.format(i % 4))
+        path = os.path.join(sub, 'Family {:04d}.rfa'.format(i))
+        if not os.path.isdir(sub):
+            os.makedirs(sub)
+        params = {}
+        if i % 5 == 0:
+            params = dict((spec.name, {'guid': guid, 'is_instance': spec.is_instance, 'formula': spec.formula})
+                          for spec, (guid, _) in zip(MANIFEST, SHARED_PARAMETERS))
+        with io.open(path, 'w', encoding='utf-8') as f:
+            f.write(u'{}'.format(json.dumps({'parameters': params})) if i < count - 1 else u'not a family')
+    # A Revit backup, never processed.
+    with io.open(os.path.join(folder, 'Family 0000.0001.rfa'), 'w', encoding='utf-8') as f:
+        f.write(u'{}')
+
+
+def folder_hash(paths):
+    digest = hashlib.md5()
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class Monitor(object):
+    """Wraps Application.OpenDocumentFile to count open documents and transactions per family."""
+
+    def __init__(self, app):
+        self.app, self.docs, self.max_open = app, [], 0
+        self._open = app.OpenDocumentFile
+        app.OpenDocumentFile = self.open
+
+    def open(self, path):
+        doc = self._open(path)
+        self.docs.append(doc)
+        self.max_open = max(self.max_open, len(self.app.Documents))
+        return doc
+
+    def reset(self):
+        self.docs, self.max_open = [], 0
+
+    @property
+    def max_transactions(self):
+        return max([len([t for t in d.transactions if not t.startswith('group')]) for d in self.docs] or [0])
+
+
+def step(name, batch, paths, monitor, limit=None):
+    monitor.reset()
+    start   = time.time()
+    summary = batch.run(paths, limit=limit)
+    elapsed = time.time() - start
+    counts  = u', '.join(u'{} {}'.format(status, n) for status, n in summary.items() if n)
+    print(u'{:<10} {:>6} {:>9.2f} {:>6} {:>6}   {}'.format(name, sum(summary.values()), elapsed, monitor.max_open,
+                                                        monitor.max_transactions, counts or u'-'))
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the family batch on family stand-ins.')
+    parser.add_argument('--families', type=int, default=500, help='Number of families.')
+    parser.add_argument('--stop',     type=int, default=None, help='Families of the interrupted run (half by default).')
+    args = parser.parse_args(argv)
+
+    folder = tempfile.mkdtemp(prefix='mbqc_families_')
+    try:
+        shared_file = os.path.join(folder, 'Shared Parameters.txt')
+        write_shared_parameter_file(shared_file)
+        write_families(folder, args.families)
+
+        app        = revit_stub.APPLICATION
+        monitor    = Monitor(app)
+        index      = SharedParameterFile(app, shared_file)
+        paths      = find_families(folder)
+        checkpoint = os.path.join(folder, CHECKPOINT_NAME)
+
+        print(u'{} families, {} shared parameters'.format(len(paths), len(index)))
+        print(u'{:<10} {:>6} {:>9} {:>6} {:>6}   {}'.format('Step', 'Files', 'Time (s)', 'Open', 'Trans.', 'Statuses'))
+        before = folder_hash(paths)
+        step('dry run', FamilyBatch(app, index, MANIFEST, checkpoint, dry_run=True), paths, monitor)
+        print(u'           files unchanged by the dry run: {}'.format(folder_hash(paths) == before))
+
+        batch = FamilyBatch(app, index, MANIFEST, checkpoint, retry_failed=False)
+        step('run', batch, paths, monitor, limit=args.stop or len(paths) // 2)
+        step('resume', batch, paths, monitor)
+        step('again', batch, paths, monitor)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Time the link source audit (Snippets._file_audit) against a simulated slow file server.
+
+Real files are created in a temporary folder and every stat is delayed by --latency seconds,
+like a stat over a slow SMB share. A few paths don't exist and one hangs longer than the timeout.
+- sequential: one stat after the other (workers=1)
+- pool:       stat_files with --workers threads
+
+Usage (from the repository root):
+    python benchmarks/bench_file_audit.py [--files 200] [--latency 0.05] [--workers 16] [--timeout 2]"""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [HERE, os.path.join(os.path.dirname(HERE), 'lib')]
+
+import revit_stub
+revit_stub.install()
+
+from Snippets._file_audit import stat_files
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def make_files(folder, count):
+    """count paths in folder: most exist, every 10th is missing, the last one hangs."""
+    paths = []
+    for i in range(count):
+        path = os.path.join(folder, 'link_{:04d}.dwg'.format(i))
+        if i % 10 != 9:
+            with open(path, 'wb') as f:
+                f.write(b'\0' * (i * 100))
+        paths.append(path)
+    return paths
+
+
+def slow_stat(latency, hanging, hang_time):
+    def stat(path):
+        time.sleep(hang_time if path == hanging else latency)
+        return os.stat(path)
+    return stat
+
+
+def run(paths, workers, timeout, stat):
+    start   = time.time()
+    results = stat_files(paths, workers=workers, timeout=timeout, stat=stat)
+    elapsed = time.time() - start
+    counts  = (len([r for r in results.values() if r.exists]),
+               len([r for r in results.values() if not r.exists and not r.timed_out and not r.error]),
+               len([r for r in results.values() if r.timed_out]))
+    return elapsed, counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the parallel link source audit.')
+    parser.add_argument('--files',   type=int,   default=200,  help='Number of linked files.')
+    parser.add_argument('--latency', type=float, default=0.05, help='Seconds added to every stat.')
+    parser.add_argument('--workers', type=int,   default=16,   help='Threads of the pool.')
+    parser.add_argument('--timeout', type=float, default=2.0,  help='Per-file timeout (seconds).')
+    args = parser.parse_args(argv)
+
+    folder = tempfile.mkdtemp(prefix='mbqc_audit_')
+    try:
+        paths = make_files(folder, args.files)
+        stat  = slow_stat(args.latency, paths[-1], args.timeout * 3)
+
+        print(u'{:<12} {:>8} {:>10} {:>8} {:>8} {:>10}'.format('Mode', 'Workers', 'Time (s)', 'Found', 'Missing', 'Timed Out'))
+        for mode, workers in (('sequential', 1), ('pool', args.workers)):
+            elapsed, (found, missing, timed_out) = run(paths, workers, args.timeout, stat)
+            print(u'{:<12} {:>8} {:>10.2f} {:>8} {:>8} {:>10}'.format(mode, workers, elapsed, found, missing, timed_out))
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Time the group audit (Snippets._groups) on a synthetic model of groups, outside Revit.
+
+The model has --types group types of --members members each, placed until there are --elements grouped
+elements. Every 4th type is nested in a parent group, and --copies ungrouped copies of groups are left around.
+- per element: GetElement(id).GroupId for every grouped element, then its groups up to the outermost one
+               (what Get Element's Group did for a single element)
+- index:       GroupIndex, one pass over the Group instances, then a lookup per element
+- copies:      find_copies over the whole model
+Both membership columns must agree, and every planted copy must be found.
+
+Usage (from the repository root):
+    python benchmarks/bench_groups.py [--elements 50000] [--types 40] [--members 10] [--copies 25]"""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import os
+import sys
+import time
+import argparse
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [HERE, os.path.join(os.path.dirname(HERE), 'lib')]
+
+import revit_stub
+revit_stub.install()
+from revit_stub import Document, Element, ElementId, Group, GroupType, LocationPoint, XYZ, BuiltInCategory
+
+from Snippets._groups import GroupIndex, find_copies
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+class Counter(object):
+    """Wraps Document.GetElement to count the calls."""
+
+    def __init__(self, doc):
+        self.calls = 0
+        self._get  = doc.GetElement
+        doc.GetElement = self.get
+
+    def get(self, element_id):
+        self.calls += 1
+        return self._get(element_id)
+
+
+def build_model(elements, types, members, copies):
+    """(doc, grouped element ids, planted copies) of a model of furniture groups on a 100 ft grid."""
+    doc     = Document('Groups')
+    next_id = [1000]
+
+    def new_id():
+        next_id[0] += 1
+        return next_id[0]
+
+    group_types = [doc.add(GroupType(new_id(), u'Apartment {:02d}'.format(t))) for t in range(types)]
+    floor_types = [doc.add(GroupType(new_id(), u'Floor {:02d}'.format(t))) for t in range(types)]
+    layouts     = [[(5000 + t * members + m, XYZ(m * 2.0, (m % 3) * 1.5, 0.0)) for m in range(members)]
+                   for t in range(types)]
+
+    def place(t, origin, grouped=True):
+        ids = []
+        for type_id, offset in layouts[t]:
+            point = XYZ(origin.X + offset.X, origin.Y + offset.Y, origin.Z + offset.Z)
+            el    = doc.add(Element(new_id(), category=BuiltInCategory.OST_Furniture, type_id=type_id,
+                                    location=LocationPoint(point)))
+            ids.append(el.Id.Value)
+        if not grouped:
+            return ids, None
+        group = doc.add(Group(new_id(), group_types[t], ids, origin))
+        for el_id in ids:
+            doc.GetElement(ElementId(el_id)).GroupId = group.Id
+        return ids, group
+
+    grouped, planted, n = [], [], 0
+    while len(grouped) < elements:
+        t      = n % types
+        origin = XYZ((n % 100) * 100.0, (n // 100) * 100.0, 0.0)
+        ids, group = place(t, origin)
+        grouped.extend(ids)
+        if t % 4 == 3:
+            # Nested: the group is the member of a one-member parent group.
+            parent = doc.add(Group(new_id(), floor_types[t], [group.Id.Value], origin))
+            group.GroupId = parent.Id
+            grouped.append(group.Id.Value)
+        n += 1
+    for c in range(copies):
+        ids, _ = place(c % types, XYZ(-500.0 - c * 100.0, -500.0, 0.0), grouped=False)
+        planted.append(set(ids))
+    return doc, grouped, planted
+
+
+def per_element(doc, element_ids):
+    """Outermost group of each element, read one GetElement/GroupId at a time."""
+    found = {}
+    for el_id in element_ids:
+        group_id = doc.GetElement(ElementId(el_id)).GroupId
+        top      = None
+        while group_id != ElementId.InvalidElementId:
+            top      = group_id.Value
+            group_id = doc.GetElement(group_id).GroupId
+        found[el_id] = top
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the group audit.')
+    parser.add_argument('--elements', type=int, default=50000, help='Grouped elements.')
+    parser.add_argument('--types',    type=int, default=40,    help='Group types.')
+    parser.add_argument('--members',  type=int, default=10,    help='Members per group type.')
+    parser.add_argument('--copies',   type=int, default=25,    help='Ungrouped copies of groups.')
+    args = parser.parse_args(argv)
+
+    doc, grouped, planted = build_model(args.elements, args.types, args.members, args.copies)
+    counter = Counter(doc)
+    print(u'{} grouped elements, {} elements in the model'.format(len(grouped), len(doc.elements())))
+    print(u'{:<12} {:>10} {:>12}'.format('Mode', 'Time (s)', 'GetElement'))
+
+    start    = time.time()
+    expected = per_element(doc, grouped)
+    print(u'{:<12} {:>10.3f} {:>12}'.format('per element', time.time() - start, counter.calls))
+
+    counter.calls = 0
+    start = time.time()
+    index = GroupIndex(doc)
+    found = dict((el_id, index.group_of(el_id, top=True)) for el_id in grouped)
+    print(u'{:<12} {:>10.3f} {:>12}'.format('index', time.time() - start, counter.calls))
+
+    counter.calls = 0
+    start  = time.time()
+    copies = find_copies(doc, index)
+    print(u'{:<12} {:>10.3f} {:>12}'.format('copies', time.time() - start, counter.calls))
+
+    print(u'same groups as per element: {}'.format(found == expected))
+    print(u'copies found: {} of {} planted, {} exact'.format(
+        len(copies), len(planted), len([c for c in copies if set(c.element_ids) in planted])))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
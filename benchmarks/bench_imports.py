@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Time the library imports of every button script, outside Revit.
+
+- cold: a fresh interpreter imports the Snippets modules of the button (first click in a session)
+- warm: the same imports again in that interpreter (every later click: pyRevit rocket mode keeps
+        lib modules loaded between runs)
+The pyRevit imports of the scripts are left out: they cost the same for every button.
+
+Usage (from the repository root):
+    python benchmarks/bench_imports.py [--repeat 5] [--json imports.json]"""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import io
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+TAB  = os.path.join(ROOT, 'MB_QC.tab')
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+LIB_IMPORT = re.compile(r'^from Snippets\.\w+\s+import .+$', re.MULTILINE)
+
+# Runs in the child interpreter: time the import lines once (cold), then again (warm).
+CHILD = u"""
+import sys, time, json
+sys.path[:0] = {paths!r}
+import revit_stub
+revit_stub.install()
+code = compile({source!r}, 'imports', 'exec')
+start = time.time(); exec(code, {{}}); cold = time.time() - start
+start = time.time(); exec(code, {{}}); warm = time.time() - start
+print(json.dumps({{'cold': cold, 'warm': warm, 'modules': sorted(m for m in sys.modules if m.startswith('Snippets.'))}}))
+"""
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def button_imports():
+    """(button name, lib import lines) of every script.py that imports from Snippets."""
+    buttons = []
+    for folder, _, files in sorted(os.walk(TAB)):
+        if 'script.py' not in files:
+            continue
+        with io.open(os.path.join(folder, 'script.py'), encoding='utf-8') as f:
+            lines = LIB_IMPORT.findall(f.read())
+        if lines:
+            parent, button = [part.rsplit('.', 1)[0] for part in folder.split(os.sep)[-2:]]
+            buttons.append((u'{} / {}'.format(parent, button), u'\n'.join(lines)))
+    return buttons
+
+
+def time_imports(source, repeat):
+    """Fastest cold and warm import time of `repeat` fresh interpreters."""
+    child = CHILD.format(paths=[HERE, os.path.join(ROOT, 'lib')], source=source)
+    best  = None
+    for _ in range(repeat):
+        out    = subprocess.check_output([sys.executable, '-c', child], cwd=ROOT)
+        result = json.loads(out.decode('utf-8').strip().splitlines()[-1])
+        if best is None:
+            best = result
+        else:
+            best['cold'] = min(best['cold'], result['cold'])
+            best['warm'] = min(best['warm'], result['warm'])
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the library imports of MB_QC buttons.')
+    parser.add_argument('--repeat', type=int, default=5, help='Fresh interpreters per button, the fastest is kept.')
+    parser.add_argument('--json',   default=None, help='Also write the results to this file.')
+    args = parser.parse_args(argv)
+
+    results = []
+    print(u'{:<48} {:>10} {:>10} {:>8}'.format('Button', 'Cold (ms)', 'Warm (ms)', 'Modules'))
+    for name, source in button_imports():
+        timing = time_imports(source, args.repeat)
+        timing['button'] = name
+        results.append(timing)
+        print(u'{:<48} {:>10.2f} {:>10.3f} {:>8}'.format(name, timing['cold'] * 1000, timing['warm'] * 1000,
+                                                        len(timing['modules'])))
+
+    if args.json:
+        with io.open(args.json, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(results, indent=1))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Time the scope box spatial index (Snippets._spatial) against pairwise comparisons, outside Revit.
+
+A campus of --boxes scope boxes (some overlapping their neighbour) and --grids grid lines, each grid
+running through a few boxes.
+- overlaps: every pair of boxes compared, vs GridHash.overlapping_pairs
+- grids:    every grid against every box, vs ScopeBoxIndex.crossed_by
+Both ways must give the same answers.
+
+Usage (from the repository root):
+    python benchmarks/bench_spatial.py [--boxes 500] [--grids 5000]"""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import os
+import sys
+import time
+import random
+import argparse
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [HERE, os.path.join(os.path.dirname(HERE), 'lib')]
+
+import revit_stub
+revit_stub.install()
+
+from Snippets._spatial import ScopeBoxIndex, rects_overlap, segment_crosses_rect
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def campus(boxes, grids, seed=0):
+    """('scope_boxes' records, grid segments) on rows of 20 buildings."""
+    rnd     = random.Random(seed)
+    records = []
+    for i in range(boxes):
+        x, y  = (i % 20) * 150.0, (i // 20) * 120.0
+        width = 170.0 if i % 5 == 4 else 140.0
+        records.append({'id': i, 'name': u'Scope Box {}'.format(i), 'min_x': x, 'min_y': y, 'min_z': -20.0,
+                        'max_x': x + width, 'max_y': y + 100.0, 'max_z': 200.0})
+    segments = []
+    for _ in range(grids):
+        sb = rnd.choice(records)
+        y  = rnd.uniform(sb['min_y'], sb['max_y'])
+        segments.append((sb['min_x'] - 5, y, sb['max_x'] + rnd.uniform(5, 300), y))
+    return records, segments
+
+
+def pairwise(records, segments):
+    rects    = [(r['id'], (r['min_x'], r['min_y'], r['max_x'], r['max_y'])) for r in records]
+    overlaps = sorted((a, b) for n, (a, ra) in enumerate(rects) for b, rb in rects[n + 1:] if rects_overlap(ra, rb))
+    crossed  = [sorted(i for i, rect in rects if segment_crosses_rect(x0, y0, x1, y1, rect))
+                for x0, y0, x1, y1 in segments]
+    return overlaps, crossed
+
+
+def indexed(records, segments):
+    index    = ScopeBoxIndex(records)
+    overlaps = index.overlaps()
+    crossed  = [sorted(index.crossed_by(*segment)) for segment in segments]
+    return overlaps, crossed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the scope box spatial index.')
+    parser.add_argument('--boxes', type=int, default=500,  help='Scope boxes.')
+    parser.add_argument('--grids', type=int, default=5000, help='Grid lines.')
+    args = parser.parse_args(argv)
+
+    records, segments = campus(args.boxes, args.grids)
+    print(u'{} scope boxes, {} grids'.format(len(records), len(segments)))
+    print(u'{:<10} {:>10} {:>10} {:>14}'.format('Mode', 'Time (s)', 'Overlaps', 'Grid x Box'))
+    results = []
+    for name, run in (('pairwise', pairwise), ('index', indexed)):
+        start    = time.time()
+        overlaps, crossed = run(records, segments)
+        elapsed  = time.time() - start
+        results.append((overlaps, crossed))
+        print(u'{:<10} {:>10.3f} {:>10} {:>14}'.format(name, elapsed, len(overlaps), sum(len(c) for c in crossed)))
+    print(u'same answers: {}'.format(results[0] == results[1]))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
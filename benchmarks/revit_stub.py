@@ -0,0 +1,1039 @@
+# -*- coding: utf-8 -*-
+"""Pure-Python stand-in for the parts of the Revit API used by lib/Snippets.
+Only meant to run the QC code outside Revit (benchmarks). It mimics behaviour, not performance:
+a FilteredElementCollector here is a Python loop over all elements of the document.
+
+    import revit_stub
+    revit_stub.install()             # before importing anything from Snippets
+    from Autodesk.Revit.DB import Level"""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import io
+import os
+import sys
+import json
+import math
+import types
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+#>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> .NET
+class Event(object):
+    """Supports `app.DocumentChanged += handler` like a .NET event."""
+
+    def __init__(self):
+        self.handlers = []
+
+    def __iadd__(self, handler):
+        self.handlers.append(handler)
+        return self
+
+    def __isub__(self, handler):
+        if handler in self.handlers:
+            self.handlers.remove(handler)
+        return self
+
+    def fire(self, sender, args):
+        for handler in list(self.handlers):
+            handler(sender, args)
+
+
+class GenericList(list):
+    def Add(self, item):
+        self.append(item)
+
+    @property
+    def Count(self):
+        return len(self)
+
+
+class _GenericListType(object):
+    """List[ElementFilter]() -> GenericList"""
+    def __getitem__(self, item_type):
+        return GenericList
+
+
+class _Domain(object):
+    def __init__(self):
+        self._data = {}
+
+    def GetData(self, key):
+        return self._data.get(key)
+
+    def SetData(self, key, value):
+        self._data[key] = value
+
+
+class AppDomain(object):
+    CurrentDomain = _Domain()
+
+
+#>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> IDS / ENUMS
+class ElementId(object):
+    __slots__ = ('Value',)
+
+    def __init__(self, value):
+        self.Value = int(value)
+
+    @property
+    def IntegerValue(self):
+        return self.Value
+
+    def __eq__(self, other):
+        return isinstance(other, ElementId) and other.Value == self.Value
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.Value)
+
+    def __repr__(self):
+        return 'ElementId({})'.format(self.Value)
+
+ElementId.InvalidElementId = ElementId(-1)
+
+
+class WorksetId(ElementId):
+    __slots__ = ()
+
+
+class BuiltInCategory(object):
+    OST_VolumeOfInterest   = -2006000
+    OST_ProjectBasePoint   = -2001271
+    OST_Levels             = -2000240
+    OST_Grids              = -2000220
+    OST_RvtLinks           = -2001352
+    OST_Walls              = -2000011
+    OST_Floors             = -2000032
+    OST_Roofs              = -2000035
+    OST_Ceilings           = -2000038
+    OST_Materials          = -2000700
+    OST_Views              = -2000279
+    OST_GenericModel       = -2000151
+    OST_ProjectInformation = -2003101
+    OST_IOSModelGroups     = -2000095
+    OST_Furniture          = -2000080
+
+
+class BuiltInParameter(str):
+    """Members are instances, like the .NET enum. (str, so they stay usable as dict keys)"""
+    INVALID                            = 'INVALID'
+    SYMBOL_NAME_PARAM                  = 'SYMBOL_NAME_PARAM'
+    FUNCTION_PARAM                     = 'FUNCTION_PARAM'
+    STRUCTURAL_MATERIAL_PARAM          = 'STRUCTURAL_MATERIAL_PARAM'
+    FLOOR_ATTR_DEFAULT_THICKNESS_PARAM = 'FLOOR_ATTR_DEFAULT_THICKNESS_PARAM'
+    DATUM_VOLUME_OF_INTEREST           = 'DATUM_VOLUME_OF_INTEREST'
+    VIEWER_VOLUME_OF_INTEREST_CROP     = 'VIEWER_VOLUME_OF_INTEREST_CROP'
+    BASEPOINT_NORTHSOUTH_PARAM         = 'BASEPOINT_NORTHSOUTH_PARAM'
+    BASEPOINT_EASTWEST_PARAM           = 'BASEPOINT_EASTWEST_PARAM'
+    BASEPOINT_ELEVATION_PARAM          = 'BASEPOINT_ELEVATION_PARAM'
+    BASEPOINT_ANGLETON_PARAM           = 'BASEPOINT_ANGLETON_PARAM'
+
+for _name in [n for n in vars(BuiltInParameter) if n.isupper()]:
+    setattr(BuiltInParameter, _name, BuiltInParameter(_name))
+
+
+class BuiltInParameterGroup(object):
+    PG_IDENTITY_DATA = 'PG_IDENTITY_DATA'
+    PG_DATA          = 'PG_DATA'
+
+
+class StorageType(object):
+    String    = 'String'
+    Double    = 'Double'
+    Integer   = 'Integer'
+    ElementId = 'ElementId'
+
+
+class MaterialFunctionAssignment(object):
+    def __init__(self, name):
+        self.name = name
+
+    def ToString(self):
+        return self.name
+
+for _name in ['Structure', 'Substrate', 'Insulation', 'Finish1', 'Finish2', 'Membrane', 'StructuralDeck']:
+    setattr(MaterialFunctionAssignment, _name, MaterialFunctionAssignment(_name))
+
+
+class WorksetKind(object):
+    UserWorkset = 'UserWorkset'
+
+
+# External file reference enums: str() of the .NET enum is its member name.
+class ExternalFileReferenceType(object):
+    RevitLink    = 'RevitLink'
+    CADLink      = 'CADLink'
+    KeynoteTable = 'KeynoteTable'
+
+
+class PathType(object):
+    Absolute = 'Absolute'
+    Relative = 'Relative'
+    Server   = 'Server'
+
+
+class LinkedFileStatus(object):
+    Loaded          = 'Loaded'
+    Unloaded        = 'Unloaded'
+    NotFound        = 'NotFound'
+    LocallyUnloaded = 'LocallyUnloaded'
+
+
+#>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> PARAMETERS
+class Guid(object):
+    """System.Guid"""
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = str(value).lower()
+
+    def __eq__(self, other):
+        return isinstance(other, Guid) and other.value == self.value
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def ToString(self):
+        return self.value
+
+
+class Definition(object):
+    def __init__(self, name, bip=None):
+        self.Name             = name
+        self.BuiltInParameter = bip or BuiltInParameter.INVALID
+
+
+class Parameter(object):
+    """value is a str, float, int or ElementId. value_string is what AsValueString returns.
+    guid makes it a shared parameter. Definition is set by the element that holds it."""
+
+    def __init__(self, value, value_string=None, guid=None):
+        self.value        = value
+        self.value_string = value_string
+        self.GUID         = Guid(guid) if guid else None
+        self.IsShared     = guid is not None
+        self.Definition   = None
+
+    @property
+    def StorageType(self):
+        if isinstance(self.value, ElementId):
+            return StorageType.ElementId
+        if isinstance(self.value, float):
+            return StorageType.Double
+        if isinstance(self.value, int) and not isinstance(self.value, bool):
+            return StorageType.Integer
+        return StorageType.String
+
+    def AsString(self):
+        return self.value
+
+    def AsDouble(self):
+        return self.value
+
+    def AsInteger(self):
+        return self.value
+
+    def AsElementId(self):
+        return self.value
+
+    def AsValueString(self):
+        return self.value_string if self.value_string is not None else u'{}'.format(self.value)
+
+
+#>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> GEOMETRY
+class XYZ(object):
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.X, self.Y, self.Z = x, y, z
+
+    def __repr__(self):
+        return 'XYZ({:.3f}, {:.3f}, {:.3f})'.format(self.X, self.Y, self.Z)
+
+
+class Transform(object):
+    """Rotation about Z plus translation, which is all a link placement needs here."""
+
+    def __init__(self, origin=None, angle=0.0):
+        self.Origin = origin or XYZ()
+        self._angle = angle
+        self.BasisX = XYZ(math.cos(angle), math.sin(angle), 0.0)
+        self.BasisY = XYZ(-math.sin(angle), math.cos(angle), 0.0)
+        self.BasisZ = XYZ(0.0, 0.0, 1.0)
+
+    @staticmethod
+    def CreateTranslation(vector):
+        return Transform(vector)
+
+    def OfPoint(self, point):
+        return XYZ(self.Origin.X + self.BasisX.X * point.X + self.BasisY.X * point.Y,
+                   self.Origin.Y + self.BasisX.Y * point.X + self.BasisY.Y * point.Y,
+                   self.Origin.Z + point.Z)
+
+    def Multiply(self, right):
+        return Transform(self.OfPoint(right.Origin), self._angle + right._angle)
+
+Transform.Identity = Transform()
+
+
+class Line(object):
+    def __init__(self, start, end):
+        self._ends = (start, end)
+
+    @staticmethod
+    def CreateBound(start, end):
+        return Line(start, end)
+
+    def GetEndPoint(self, index):
+        return self._ends[index]
+
+    def Tessellate(self):
+        return list(self._ends)
+
+
+class Arc(object):
+    """Arc in plan around center, counterclockwise from start_angle to end_angle (radians)."""
+
+    def __init__(self, center, radius, start_angle, end_angle):
+        self.center, self.radius, self._angles = center, radius, (start_angle, end_angle)
+
+    def _point(self, angle):
+        return XYZ(self.center.X + self.radius * math.cos(angle), self.center.Y + self.radius * math.sin(angle),
+                   self.center.Z)
+
+    def GetEndPoint(self, index):
+        return self._point(self._angles[index])
+
+    def Tessellate(self, segments=16):
+        start, end = self._angles
+        return [self._point(start + (end - start) * i / float(segments)) for i in range(segments + 1)]
+
+
+class BoundingBoxXYZ(object):
+    def __init__(self, minimum=None, maximum=None, transform=None):
+        self.Min       = minimum or XYZ()
+        self.Max       = maximum or XYZ()
+        self.Transform = transform or Transform.Identity
+
+
+#>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> EXTERNAL FILES
+class ModelPath(object):
+    def __init__(self, path):
+        self.path  = path
+        self.Empty = not path
+
+
+class ModelPathUtils(object):
+    @staticmethod
+    def ConvertModelPathToUserVisiblePath(model_path):
+        return model_path.path
+
+    @staticmethod
+    def ConvertUserVisiblePathToModelPath(path):
+        return ModelPath(path)
+
+
+class ExternalFileReference(object):
+    def __init__(self, kind, path, path_type=PathType.Absolute, status=LinkedFileStatus.Loaded):
+        self.ExternalFileReferenceType = kind
+        self.PathType                  = path_type
+        self._path                     = ModelPath(path)
+        self._status                   = status
+
+    def GetPath(self):
+        return self._path
+
+    def GetAbsolutePath(self):
+        return self._path
+
+    def GetLinkedFileStatus(self):
+        return self._status
+
+
+class ExternalFileUtils(object):
+    @staticmethod
+    def GetAllExternalFileReferences(doc):
+        return [el.Id for el in doc.elements() if el.IsExternalFileReference()]
+
+
+#>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> ELEMENTS
+class Category(object):
+    def __init__(self, bic):
+        self.Id = ElementId(bic)
+
+
+class _NameProperty(object):
+    """Element.Name as a property object, for Element.Name.GetValue(element)."""
+
+    def GetValue(self, element):
+        return element.__dict__['Name']
+
+
+class Element(object):
+    """Element with parameters by BuiltInParameter (params) and by name (named_params)."""
+    category = None
+    GroupId  = ElementId.InvalidElementId     # Set on the members of a Group
+    Name     = _NameProperty()                # Shadowed by the Name of each instance
+
+    def __init__(self, element_id, name=u'', params=None, named_params=None, workset_id=0, category=None,
+                 reference=None, type_id=None, location=None):
+        self.Id           = ElementId(element_id)
+        self.Name         = name
+        self.WorksetId    = WorksetId(workset_id)
+        self.Category     = Category(category or self.category) if (category or self.category) else None
+        self.params       = params or {}
+        self.named_params = named_params or {}
+        for bip, param in self.params.items():
+            param.Definition = Definition(bip, bip)
+        for name, param in self.named_params.items():
+            param.Definition = Definition(name)
+        self.Document     = None
+        self.reference    = reference
+        self.Location     = location
+        self._type_id     = ElementId(type_id) if type_id is not None else ElementId.InvalidElementId
+        self.bounding_box = None      # BoundingBoxXYZ returned by get_BoundingBox
+
+    def get_Parameter(self, key):
+        """By BuiltInParameter, Guid (shared) or Definition."""
+        if isinstance(key, Guid):
+            return next((p for p in self.named_params.values() if p.GUID == key), None)
+        if isinstance(key, Definition):
+            return self.params.get(key.BuiltInParameter) or self.named_params.get(key.Name)
+        return self.params.get(key)
+
+    def IsExternalFileReference(self):
+        return self.reference is not None
+
+    def GetExternalFileReference(self):
+        return self.reference
+
+    def LookupParameter(self, name):
+        return self.named_params.get(name)
+
+    def GetTypeId(self):
+        return self._type_id
+
+    def get_BoundingBox(self, view):
+        return self.bounding_box
+
+
+class ElementType(Element):
+    FamilyName = u''
+
+
+class View(Element):
+    category = BuiltInCategory.OST_Views
+
+
+class ViewPlan(View):
+    def __init__(self, element_id, name, crop_box=None, is_template=False, view_type='FloorPlan', **kwargs):
+        View.__init__(self, element_id, name, **kwargs)
+        self.CropBox       = crop_box or BoundingBoxXYZ()
+        self.CropBoxActive = crop_box is not None
+        self.IsTemplate    = is_template
+        self.ViewType      = view_type
+
+
+class ViewSheet(View):
+    pass
+
+
+class FilledRegionType(ElementType):
+    pass
+
+
+class Reference(object):
+    def __init__(self, element):
+        self.ElementId = element.Id
+
+
+class Material(Element):
+    category = BuiltInCategory.OST_Materials
+
+
+class Level(Element):
+    category = BuiltInCategory.OST_Levels
+
+    def __init__(self, element_id, name, elevation, monitored=None, base_elevation=0.0, **kwargs):
+        Element.__init__(self, element_id, name, **kwargs)
+        self.Elevation         = elevation
+        self.ProjectElevation  = elevation + base_elevation
+        self._monitored = monitored or []
+
+    def GetMonitoredLinkElementIds(self):
+        return self._monitored
+
+
+class Grid(Element):
+    category = BuiltInCategory.OST_Grids
+
+    def __init__(self, element_id, name, monitored=None, curve=None, **kwargs):
+        Element.__init__(self, element_id, name, **kwargs)
+        self._monitored = monitored or []
+        self.Curve      = curve or Line(XYZ(), XYZ(1.0, 0.0, 0.0))
+
+    def GetMonitoredLinkElementIds(self):
+        return self._monitored
+
+
+class RevitLinkType(ElementType):
+    category = BuiltInCategory.OST_RvtLinks
+
+
+class RevitLinkInstance(Element):
+    category = BuiltInCategory.OST_RvtLinks
+
+    def __init__(self, element_id, name, link_document=None, type_id=None, transform=None, **kwargs):
+        Element.__init__(self, element_id, name, **kwargs)
+        self._link_document = link_document
+        self._type_id       = type_id or ElementId.InvalidElementId
+        self._transform     = transform or Transform.Identity
+
+    def GetLinkDocument(self):
+        return self._link_document
+
+    def GetTypeId(self):
+        return self._type_id
+
+    def GetTotalTransform(self):
+        return self._transform
+
+
+class LocationPoint(object):
+    def __init__(self, point):
+        self.Point = point
+
+
+class GroupType(ElementType):
+    pass
+
+
+class Group(Element):
+    """Model group: its members are other elements of the document, a nested group is a member like any other."""
+    category = BuiltInCategory.OST_IOSModelGroups
+
+    def __init__(self, element_id, group_type, member_ids, origin, **kwargs):
+        Element.__init__(self, element_id, group_type.Name, type_id=group_type.Id.Value,
+                         location=LocationPoint(origin), **kwargs)
+        self.GroupType  = group_type
+        self._members   = [ElementId(m) for m in member_ids]
+
+    def GetMemberIds(self):
+        return list(self._members)
+
+
+class CADLinkType(ElementType):
+    pass
+
+
+class ImportInstance(Element):
+    def __init__(self, element_id, type_id, is_linked, owner_view_id, **kwargs):
+        Element.__init__(self, element_id, **kwargs)
+        self._type_id    = type_id
+        self.IsLinked    = is_linked
+        self.OwnerViewId = owner_view_id
+
+    def GetTypeId(self):
+        return self._type_id
+
+
+class CompoundStructureLayer(object):
+    def __init__(self, layer_id, function, material_id, width):
+        self.LayerId    = layer_id
+        self.Function   = function
+        self.MaterialId = material_id
+        self.Width      = width
+
+
+class CompoundStructure(object):
+    def __init__(self, layers, first_core, last_core):
+        self._layers     = layers
+        self._first_core = first_core
+        self._last_core  = last_core
+
+    def GetLayers(self):
+        return list(self._layers)
+
+    def GetWidth(self):
+        return sum(layer.Width for layer in self._layers)
+
+    def GetFirstCoreLayerIndex(self):
+        return self._first_core
+
+    def GetLastCoreLayerIndex(self):
+        return self._last_core
+
+
+class HostObjAttributes(ElementType):
+    def __init__(self, element_id, name, family_name, structure=None, **kwargs):
+        ElementType.__init__(self, element_id, name, **kwargs)
+        self.FamilyName = family_name
+        self._structure = structure
+
+    def GetCompoundStructure(self):
+        return self._structure
+
+    @property
+    def Width(self):
+        return self._structure.GetWidth() if self._structure else 0.0
+
+
+class WallType(HostObjAttributes):
+    category = BuiltInCategory.OST_Walls
+
+
+class FloorType(HostObjAttributes):
+    category = BuiltInCategory.OST_Floors
+
+
+class RoofType(HostObjAttributes):
+    category = BuiltInCategory.OST_Roofs
+
+
+class CeilingType(HostObjAttributes):
+    category = BuiltInCategory.OST_Ceilings
+
+
+class Workset(object):
+    def __init__(self, workset_id, name):
+        self.Id   = WorksetId(workset_id)
+        self.Name = name
+        self.Kind = WorksetKind.UserWorkset
+
+
+class WorksetTable(object):
+    def __init__(self, worksets):
+        self._worksets = dict((ws.Id, ws) for ws in worksets)
+
+    def GetWorkset(self, workset_id):
+        return self._worksets.get(workset_id)
+
+
+#>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> DOCUMENT / APPLICATION
+class Application(object):
+    def __init__(self, version_number='2024'):
+        self.VersionNumber            = version_number
+        self.DocumentChanged          = Event()
+        self.DocumentClosing          = Event()
+        self.SharedParametersFilename = u''
+        self.Documents                = []     # Documents opened with OpenDocumentFile and not closed yet
+
+    def OpenSharedParameterFile(self):
+        if not os.path.exists(self.SharedParametersFilename):
+            return None
+        return DefinitionFile(self.SharedParametersFilename)
+
+    def OpenDocumentFile(self, path):
+        """Only family stand-ins: see FamilyDocument."""
+        doc = FamilyDocument.open(path, self)
+        self.Documents.append(doc)
+        return doc
+
+    def PurgeReleasedAPIObjects(self):
+        pass
+
+
+# Revit runs a single Application per process. _events subscribes to it once.
+APPLICATION = Application()
+
+
+class DocumentChangedEventArgs(object):
+    def __init__(self, doc, added=(), modified=(), deleted=()):
+        self._doc      = doc
+        self._added    = [ElementId(i) for i in added]
+        self._modified = [ElementId(i) for i in modified]
+        self._deleted  = [ElementId(i) for i in deleted]
+
+    def GetDocument(self):
+        return self._doc
+
+    def _filtered(self, ids, element_filter):
+        if element_filter is None:
+            return GenericList(ids)
+        return GenericList(i for i in ids if element_filter.passes(self._doc.GetElement(i)))
+
+    def GetAddedElementIds(self, element_filter=None):
+        return self._filtered(self._added, element_filter)
+
+    def GetModifiedElementIds(self, element_filter=None):
+        return self._filtered(self._modified, element_filter)
+
+    def GetDeletedElementIds(self):
+        return self._deleted
+
+
+class DocumentClosingEventArgs(object):
+    def __init__(self, doc):
+        self.Document = doc
+
+
+class Transaction(object):
+    """Records its name on the document when committed. Only FamilyDocument undoes changes on RollBack."""
+
+    def __init__(self, doc, name):
+        self.doc, self.name, self._started = doc, name, False
+
+    def Start(self):
+        self._started = True
+        self.doc.begin_transaction(self)
+
+    def HasStarted(self):
+        return self._started
+
+    def Commit(self):
+        self._started = False
+        self.doc.end_transaction(self, commit=True)
+
+    def RollBack(self):
+        self._started = False
+        self.doc.end_transaction(self, commit=False)
+
+
+class TransactionGroup(object):
+    def __init__(self, doc, name):
+        self.doc, self.name, self._started = doc, name, False
+
+    def Start(self):
+        self._started = True
+
+    def HasStarted(self):
+        return self._started
+
+    def Assimilate(self):
+        self.doc.transactions.append(u'group: ' + self.name)
+        self._started = False
+
+    def RollBack(self):
+        self._started = False
+
+
+class ElementBinding(object):
+    def __init__(self, categories=None):
+        self.Categories = categories
+
+
+class InstanceBinding(ElementBinding):
+    pass
+
+
+class TypeBinding(ElementBinding):
+    pass
+
+
+class Document(object):
+    def __init__(self, title, application=None, is_workshared=False, path_name=u''):
+        self.Title            = title
+        self.PathName         = path_name
+        self.Application      = application or APPLICATION
+        self.IsWorkshared     = is_workshared
+        self.worksets         = []
+        self.transactions     = []    # Names of committed transactions, see Transaction
+        self.transaction      = None  # Open Transaction
+        self.IsFamilyDocument = False
+        self._elements        = {}    # int -> Element, in insertion order on CPython 3.7+
+
+    def add(self, element):
+        element.Document = self
+        self._elements[element.Id.Value] = element
+        return element
+
+    def remove(self, element_id):
+        #type: (int) -> Element
+        return self._elements.pop(element_id, None)
+
+    def elements(self):
+        return self._elements.values()
+
+    def GetElement(self, element_id):
+        return self._elements.get(element_id.Value)
+
+    def GetHashCode(self):
+        return id(self)
+
+    def GetWorksetTable(self):
+        return WorksetTable(self.worksets)
+
+    def notify_changed(self, added=(), modified=(), deleted=()):
+        """Fire DocumentChanged like Revit does at the end of a transaction."""
+        self.Application.DocumentChanged.fire(self.Application,
+                                              DocumentChangedEventArgs(self, added, modified, deleted))
+
+    def close(self):
+        """Fire DocumentClosing like Revit does before the document is closed."""
+        self.Application.DocumentClosing.fire(self.Application, DocumentClosingEventArgs(self))
+
+    def begin_transaction(self, transaction):
+        if self.transaction is not None:
+            raise RuntimeError('A transaction is already open: ' + self.transaction.name)
+        self.transaction = transaction
+
+    def end_transaction(self, transaction, commit):
+        self.transaction = None
+        if commit:
+            self.transactions.append(transaction.name)
+
+    def require_transaction(self):
+        if self.transaction is None:
+            raise RuntimeError('Modifying is forbidden because the document has no open transaction.')
+
+
+class FamilyDocument(Document):
+    """Family stand-in, stored as JSON in the .rfa file: {"parameters": {name: {"guid", "is_instance", "formula"}}}.
+    Opened with Application.OpenDocumentFile, written back by Save."""
+
+    def __init__(self, path, application, parameters):
+        Document.__init__(self, os.path.splitext(os.path.basename(path))[0], application, path_name=path)
+        self.IsFamilyDocument = True
+        self.FamilyManager    = FamilyManager(self, parameters)
+        self._before          = None
+
+    @classmethod
+    def open(cls, path, application):
+        with io.open(path, encoding='utf-8') as f:
+            content = json.load(f)
+        return cls(path, application, content.get('parameters', {}))
+
+    def begin_transaction(self, transaction):
+        Document.begin_transaction(self, transaction)
+        self._before = json.dumps(self.FamilyManager.state())
+
+    def end_transaction(self, transaction, commit):
+        Document.end_transaction(self, transaction, commit)
+        if not commit:
+            self.FamilyManager = FamilyManager(self, json.loads(self._before))
+
+    def Save(self):
+        if self.transaction is not None:
+            raise RuntimeError('Cannot save with an open transaction.')
+        with io.open(self.PathName, 'w', encoding='utf-8') as f:
+            f.write(u'{}'.format(json.dumps({'parameters': self.FamilyManager.state()})))
+
+    def Close(self, save_modified=True):
+        if save_modified:
+            self.Save()
+        self.close()
+        self.Application.Documents.remove(self)
+        return True
+
+
+class FamilyParameter(object):
+    def __init__(self, name, guid=None, is_instance=True, formula=None):
+        self.Definition = Definition(name)
+        self.GUID       = Guid(guid) if guid else None
+        self.IsShared   = guid is not None
+        self.IsInstance = is_instance
+        self.Formula    = formula
+
+
+class FamilyManager(object):
+    def __init__(self, doc, parameters):
+        self._doc    = doc
+        self._params = dict((name, FamilyParameter(name, p.get('guid'), p.get('is_instance', True), p.get('formula')))
+                            for name, p in parameters.items())
+
+    def state(self):
+        return dict((name, {'guid': p.GUID.value if p.GUID else None, 'is_instance': p.IsInstance,
+                            'formula': p.Formula}) for name, p in self._params.items())
+
+    def get_Parameter(self, name):
+        return self._params.get(name)
+
+    def AddParameter(self, definition, group, is_instance):
+        self._doc.require_transaction()
+        if definition.Name in self._params:
+            raise ValueError('Parameter already exists: ' + definition.Name)
+        param = self._params[definition.Name] = FamilyParameter(definition.Name, definition.GUID.value, is_instance)
+        return param
+
+    def SetFormula(self, param, formula):
+        self._doc.require_transaction()
+        param.Formula = formula
+
+
+#>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> SHARED PARAMETER FILE
+class ExternalDefinition(object):
+    def __init__(self, name, guid, owner_group):
+        self.Name       = name
+        self.GUID       = Guid(guid)
+        self.OwnerGroup = owner_group
+
+
+class DefinitionGroup(object):
+    def __init__(self, name):
+        self.Name        = name
+        self.Definitions = []
+
+
+class DefinitionFile(object):
+    """Reads the tab separated shared parameter file format: '*GROUP'/'*PARAM' headers, 'GROUP' and 'PARAM' rows."""
+
+    def __init__(self, path):
+        self.Filename = path
+        groups = {}
+        params = []
+        with io.open(path, encoding='utf-8') as f:
+            for line in f:
+                cells = line.rstrip('\r\n').split('\t')
+                if cells[0] == 'GROUP':
+                    groups[cells[1]] = DefinitionGroup(cells[2])
+                elif cells[0] == 'PARAM':
+                    params.append((cells[1], cells[2], cells[5]))
+        for guid, name, group_id in params:
+            group = groups[group_id]
+            group.Definitions.append(ExternalDefinition(name, guid, group))
+        self.Groups = list(groups.values())
+
+
+#>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> COLLECTORS / FILTERS
+class ElementFilter(object):
+    def passes(self, element):
+        raise NotImplementedError
+
+
+class ElementClassFilter(ElementFilter):
+    def __init__(self, cls):
+        self.cls = cls
+
+    def passes(self, element):
+        return isinstance(element, self.cls)
+
+
+class ElementCategoryFilter(ElementFilter):
+    def __init__(self, bic):
+        self.bic = bic.Value if isinstance(bic, ElementId) else bic
+
+    def passes(self, element):
+        return element.Category is not None and element.Category.Id.Value == self.bic
+
+
+class LogicalOrFilter(ElementFilter):
+    def __init__(self, filters):
+        self.filters = list(filters)
+
+    def passes(self, element):
+        return any(f.passes(element) for f in self.filters)
+
+
+class FilteredElementCollector(object):
+    def __init__(self, doc, view_id=None):
+        self.doc     = doc
+        self.filters = []
+
+    def _add(self, predicate):
+        self.filters.append(predicate)
+        return self
+
+    def WherePasses(self, element_filter):
+        return self._add(element_filter.passes)
+
+    def OfClass(self, cls):
+        return self._add(lambda el: isinstance(el, cls))
+
+    def OfCategory(self, bic):
+        return self._add(ElementCategoryFilter(bic).passes)
+
+    def WhereElementIsNotElementType(self):
+        return self._add(lambda el: not isinstance(el, ElementType))
+
+    def WhereElementIsElementType(self):
+        return self._add(lambda el: isinstance(el, ElementType))
+
+    def __iter__(self):
+        filters = self.filters
+        return (el for el in list(self.doc.elements()) if all(f(el) for f in filters))
+
+    def ToElements(self):
+        return list(self)
+
+    def ToElementIds(self):
+        return [el.Id for el in self]
+
+    def FirstElement(self):
+        return next(iter(self), None)
+
+    def GetElementCount(self):
+        return sum(1 for _ in self)
+
+
+class FilteredWorksetCollector(object):
+    def __init__(self, doc):
+        self.doc = doc
+
+    def OfKind(self, kind):
+        return self
+
+    def __iter__(self):
+        return iter(self.doc.worksets)
+
+    def ToWorksets(self):
+        return list(self.doc.worksets)
+
+
+class UnitUtils(object):
+    FACTORS = {'Meters': 0.3048, 'Centimeters': 30.48, 'Millimeters': 304.8, 'SquareMeters': 0.09290304}
+
+    @staticmethod
+    def ConvertFromInternalUnits(value, unit_id):
+        return value * UnitUtils.FACTORS[unit_id]
+
+    @staticmethod
+    def ConvertToInternalUnits(value, unit_id):
+        return value / UnitUtils.FACTORS[unit_id]
+
+
+class UnitTypeId(object):
+    Meters       = 'Meters'
+    Centimeters  = 'Centimeters'
+    Millimeters  = 'Millimeters'
+    SquareMeters = 'SquareMeters'
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def _module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    return module
+
+
+def install():
+    """Register the stand-in as Autodesk.Revit.DB (and .UI.Selection), System and clr in sys.modules.
+    Does nothing if a real (or stand-in) Autodesk module is already importable."""
+    if 'Autodesk.Revit.DB' in sys.modules:
+        return
+
+    db = _module('Autodesk.Revit.DB')
+    for name, value in list(globals().items()):
+        if isinstance(value, type) and value.__module__ == __name__:
+            setattr(db, name, value)
+    db.__all__ = [name for name in dir(db) if not name.startswith('_')]
+
+    # Autodesk.Revit.UI: only the names imported by Snippets._selection. (Nothing here picks or selects)
+    selection = _module('Autodesk.Revit.UI.Selection', ISelectionFilter=type('ISelectionFilter', (object,), {}),
+                        ObjectType=type('ObjectType', (object,), {'Element': 'Element'}))
+    ui      = _module('Autodesk.Revit.UI', Selection=selection)
+    revit   = _module('Autodesk.Revit', DB=db, UI=ui)
+    autodesk = _module('Autodesk', Revit=revit)
+    generic = _module('System.Collections.Generic', List=_GenericListType())
+    system  = _module('System', AppDomain=AppDomain, Guid=Guid, Collections=_module('System.Collections', Generic=generic))
+    clr     = _module('clr', AddReference=lambda *args: None)
+
+    sys.modules.update({'Autodesk':                   autodesk,
+                        'Autodesk.Revit':             revit,
+                        'Autodesk.Revit.DB':          db,
+                        'Autodesk.Revit.UI':          ui,
+                        'Autodesk.Revit.UI.Selection': selection,
+                        'System':                     system,
+                        'System.Collections':         system.Collections,
+                        'System.Collections.Generic': generic,
+                        'clr':                        clr})
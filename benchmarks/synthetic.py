@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""Synthetic Revit models built on the revit_stub stand-in.
+The element mix roughly follows a large production model: many CAD imports and types,
+fewer datums, a handful of links, plus elements that no check reads (they only cost collector time).
+
+    doc = build_model(10000)"""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import math
+import random
+
+import revit_stub as db
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+SIZES = {'1k': 1000, '10k': 10000, '100k': 100000}
+
+# Share of the elements of a model, per kind. The rest are unrelated elements.
+MIX = [('materials',     0.03),
+       ('views',         0.08),
+       ('levels',        0.01),
+       ('grids',         0.04),
+       ('scope_boxes',   0.005),
+       ('link_types',    0.002),
+       ('links',         0.004),
+       ('cad_types',     0.02),
+       ('imports',       0.30),
+       ('wall_types',    0.06),
+       ('floor_types',   0.02),
+       ('roof_types',    0.01),
+       ('ceiling_types', 0.01)]
+
+WORKSETS = 12
+FUNCTIONS = [db.MaterialFunctionAssignment.Finish1, db.MaterialFunctionAssignment.Substrate,
+             db.MaterialFunctionAssignment.Insulation, db.MaterialFunctionAssignment.Structure,
+             db.MaterialFunctionAssignment.Membrane, db.MaterialFunctionAssignment.Finish2]
+HOST_TYPES = [('wall_types',    db.WallType,    "Basic Wall",       "Curtain Wall"),
+              ('floor_types',   db.FloorType,   "Floor",            "Foundation Slab"),
+              ('roof_types',    db.RoofType,    "Basic Roof",       "Sloped Glazing"),
+              ('ceiling_types', db.CeilingType, "Compound Ceiling", "Basic Ceiling")]
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def _counts(size):
+    counts = dict((kind, max(1, int(size * share))) for kind, share in MIX)
+    counts['other'] = max(0, size - sum(counts.values()))
+    return counts
+
+
+def _base_point(element_id, ns=0.0, ew=0.0, elevation=0.0, angle=0.0):
+    named = {"N/S":                 db.Parameter(ns,        u'{:.3f}'.format(ns)),
+             "E/W":                 db.Parameter(ew,        u'{:.3f}'.format(ew)),
+             "Elev":                db.Parameter(elevation, u'{:.3f}'.format(elevation)),
+             "Elevation":           db.Parameter(elevation, u'{:.3f}'.format(elevation)),
+             "Angle to True North": db.Parameter(angle,     u'{:.2f}°'.format(angle))}
+    params = {db.BuiltInParameter.BASEPOINT_NORTHSOUTH_PARAM: named["N/S"],
+              db.BuiltInParameter.BASEPOINT_EASTWEST_PARAM:   named["E/W"],
+              db.BuiltInParameter.BASEPOINT_ELEVATION_PARAM:  named["Elevation"],
+              db.BuiltInParameter.BASEPOINT_ANGLETON_PARAM:   named["Angle to True North"]}
+    return db.Element(element_id, u'Project Base Point', params=params, named_params=named,
+                      category=db.BuiltInCategory.OST_ProjectBasePoint)
+
+
+def _link_document(title, rnd, children=()):
+    """Linked model with its own base point, and nested links to the given child documents."""
+    link_doc = db.Document(title, path_name=u'C:\\Links\\{}.rvt'.format(title))
+    link_doc.add(_base_point(1, rnd.uniform(-100, 100), rnd.uniform(-100, 100), 0.0, rnd.uniform(0, 90)))
+    for i, child in enumerate(children):
+        link_doc.add(db.RevitLinkInstance(2 + i, u'{}.rvt : {} : location Internal'.format(child.Title, i + 1),
+                                          link_document=child, transform=_placement(rnd)))
+    return link_doc
+
+
+def _reference(kind, file_name, rnd, loaded=True):
+    """External file reference: 1 in 4 relative paths, 1 in 20 loaded files not found."""
+    relative = rnd.random() < 0.25
+    path     = file_name if relative else u'C:\\Links\\' + file_name
+    status   = db.LinkedFileStatus.Unloaded if not loaded else \
+               db.LinkedFileStatus.NotFound if rnd.random() < 0.05 else db.LinkedFileStatus.Loaded
+    return db.ExternalFileReference(kind, path, db.PathType.Relative if relative else db.PathType.Absolute, status)
+
+
+def _placement(rnd):
+    return db.Transform(db.XYZ(rnd.uniform(-200, 200), rnd.uniform(-200, 200), 0.0), rnd.choice([0.0, math.pi / 2]))
+
+
+def _nested_documents(rnd):
+    """Consultant models linked inside the main links: 2 levels deep, shared by every parent."""
+    furniture  = _link_document(u'Furniture', rnd)
+    structure  = _link_document(u'Structure', rnd, [furniture])
+    mep        = _link_document(u'MEP', rnd, [structure])
+    return [structure, mep]
+
+
+def _scope_box_extents(i, top):
+    """Scope boxes of a campus: 10 buildings a row, every 5th box overlapping its neighbour."""
+    x, y  = (i % 10) * 150.0, (i // 10) * 120.0
+    width = 170.0 if i % 5 == 4 else 140.0
+    return db.BoundingBoxXYZ(db.XYZ(x, y, -20.0), db.XYZ(x + width, y + 100.0, top))
+
+
+def build_model(size, seed=0, workshared=True):
+    #type: (int, int, bool) -> db.Document
+    """Synthetic document with about `size` elements. The same size and seed give the same model."""
+    rnd    = random.Random(seed)
+    counts = _counts(size)
+    doc    = db.Document(u'Synthetic {}'.format(size), is_workshared=workshared,
+                         path_name=u'C:\\Models\\Synthetic {}.rvt'.format(size))
+    doc.worksets = [db.Workset(i + 1, u'Workset {:02d}'.format(i + 1)) for i in range(WORKSETS)]
+    next_id = [1000]
+
+    def new_id():
+        next_id[0] += 1
+        return next_id[0]
+
+    def workset():
+        return rnd.randint(1, WORKSETS) if workshared else 0
+
+    def ids_of(elements):
+        return [el.Id for el in elements]
+
+    doc.add(_base_point(new_id(), 12.5, -3.25, 0.0, 12.0))
+
+    materials = [doc.add(db.Material(new_id(), u'Material {}'.format(i))) for i in range(counts['materials'])]
+
+    # Geometry has its own random sequence, so the rest of the model doesn't depend on it.
+    geo         = random.Random(seed + 1)
+    top         = counts['levels'] * 10.5 * 0.8     # Upper levels are above every scope box.
+    scope_boxes = [doc.add(db.Element(new_id(), u'Scope Box {}'.format(i), workset_id=workset(),
+                                      category=db.BuiltInCategory.OST_VolumeOfInterest))
+                   for i in range(counts['scope_boxes'])]
+    for i, sb in enumerate(scope_boxes):
+        sb.bounding_box = _scope_box_extents(i, top)
+
+    # Half of the views are cropped plans: on a scope box, cropped by hand near one, or anywhere.
+    views = []
+    for i in range(counts['views']):
+        if i % 2 or not scope_boxes:
+            views.append(doc.add(db.View(new_id(), u'View {}'.format(i))))
+            continue
+        sb     = geo.choice(scope_boxes)
+        params = {}
+        crop   = sb.bounding_box
+        kind   = geo.random()
+        if kind < 0.4:
+            params = {db.BuiltInParameter.VIEWER_VOLUME_OF_INTEREST_CROP: db.Parameter(sb.Id)}
+        elif kind < 0.7:
+            shift = geo.choice([0.0, geo.uniform(0.1, 3.0)])
+            crop  = db.BoundingBoxXYZ(db.XYZ(crop.Min.X + shift, crop.Min.Y, 0.0), db.XYZ(crop.Max.X + shift, crop.Max.Y, 0.0))
+        else:
+            x, y = geo.uniform(-500, 1500), geo.uniform(-500, 1500)
+            crop = db.BoundingBoxXYZ(db.XYZ(x, y, 0.0), db.XYZ(x + geo.uniform(20, 80), y + geo.uniform(20, 80), 0.0))
+        views.append(doc.add(db.ViewPlan(new_id(), u'Plan {}'.format(i), crop_box=crop, params=params)))
+
+    # Links: 1 type in 10 is not loaded. Instances of a type share its link document, like in Revit.
+    # Every loaded link nests the same consultant models (see _nested_documents).
+    nested     = _nested_documents(rnd)
+    link_docs  = [None if rnd.random() < 0.1 else _link_document(u'Link {}'.format(i), rnd, nested)
+                  for i in range(counts['link_types'])]
+    link_types = [doc.add(db.RevitLinkType(new_id(), u'Link {}.rvt'.format(i), reference=_reference(
+                      db.ExternalFileReferenceType.RevitLink, u'Link {}.rvt'.format(i), rnd, loaded=link_doc is not None)))
+                  for i, link_doc in enumerate(link_docs)]
+    links = []
+    for i in range(counts['links']):
+        link_type = link_types[i % len(link_types)]
+        link_doc  = link_docs[i % len(link_types)]
+        links.append(doc.add(db.RevitLinkInstance(new_id(), u'{} : {} : location Internal'.format(link_type.Name, i),
+                                                  link_document=link_doc, type_id=link_type.Id,
+                                                  transform=_placement(rnd),
+                                                  workset_id=workset())))
+
+    def datum_params():
+        scope_box = rnd.choice(scope_boxes).Id if rnd.random() < 0.5 else db.ElementId.InvalidElementId
+        return {db.BuiltInParameter.DATUM_VOLUME_OF_INTEREST: db.Parameter(scope_box)}
+
+    def grid_line(params):
+        """Across the assigned scope box, 1 in 10 somewhere else."""
+        sb = doc.GetElement(params[db.BuiltInParameter.DATUM_VOLUME_OF_INTEREST].value)
+        if sb is None or geo.random() < 0.1:
+            y = geo.uniform(-2000, -1000)
+            return db.Line.CreateBound(db.XYZ(0.0, y, 0.0), db.XYZ(100.0, y, 0.0))
+        box = sb.bounding_box
+        y   = geo.uniform(box.Min.Y, box.Max.Y)
+        return db.Line.CreateBound(db.XYZ(box.Min.X - 5, y, 0.0), db.XYZ(box.Max.X + 5, y, 0.0))
+
+    def monitored():
+        return ids_of(rnd.sample(links, 1)) if links and rnd.random() < 0.3 else []
+
+    for i in range(counts['levels']):
+        doc.add(db.Level(new_id(), u'Level {:03d}'.format(i), elevation=i * 10.5 - 10.5, monitored=monitored(),
+                         params=datum_params(), workset_id=workset()))
+    for i in range(counts['grids']):
+        params = datum_params()
+        doc.add(db.Grid(new_id(), u'{}{}'.format(chr(65 + i % 26), i // 26), monitored=monitored(),
+                        params=params, curve=grid_line(params), workset_id=workset()))
+
+    # CAD: 60 % linked, 1 in 5 not placed in a view (3D link / model import).
+    cad_types = [doc.add(db.CADLinkType(new_id(), u'CAD {}.dwg'.format(i),
+                                        params={db.BuiltInParameter.SYMBOL_NAME_PARAM:
+                                                db.Parameter(u'CAD {}.dwg'.format(i))},
+                                        reference=_reference(db.ExternalFileReferenceType.CADLink,
+                                                             u'CAD {}.dwg'.format(i), rnd)))
+                 for i in range(counts['cad_types'])]
+    for i in range(counts['imports']):
+        view_id = db.ElementId.InvalidElementId if rnd.random() < 0.2 else rnd.choice(views).Id
+        doc.add(db.ImportInstance(new_id(), rnd.choice(cad_types).Id, rnd.random() < 0.6, view_id,
+                                  workset_id=workset()))
+
+    # Host types: 6-10 layers, 1 in 10 of another family (not reported).
+    for bucket, cls, basic_family, other_family in HOST_TYPES:
+        for i in range(counts[bucket]):
+            if rnd.random() < 0.1:
+                doc.add(cls(new_id(), u'{} {}'.format(other_family, i), other_family))
+                continue
+            n_layers = rnd.randint(6, 10)
+            layers   = [db.CompoundStructureLayer(j, FUNCTIONS[j % len(FUNCTIONS)],
+                                                  rnd.choice(materials).Id if rnd.random() < 0.9
+                                                  else db.ElementId.InvalidElementId,
+                                                  rnd.choice([0.01, 0.0328, 0.05, 0.1, 0.3]))
+                        for j in range(n_layers)]
+            structure = db.CompoundStructure(layers, 2, n_layers - 3)
+            name      = u'{} {:04d}'.format(basic_family, i)
+            doc.add(cls(new_id(), name, basic_family, structure,
+                        params={db.BuiltInParameter.SYMBOL_NAME_PARAM:         db.Parameter(name),
+                                db.BuiltInParameter.FUNCTION_PARAM:            db.Parameter(0, u'Exterior'),
+                                db.BuiltInParameter.STRUCTURAL_MATERIAL_PARAM: db.Parameter(
+                                    layers[3].MaterialId, u'Material {}'.format(i % 7))}))
+
+    for i in range(counts['other']):
+        doc.add(db.Element(new_id(), u'Generic {}'.format(i), workset_id=workset(),
+                           category=db.BuiltInCategory.OST_GenericModel))
+    return doc
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Headless batch QC over a folder of MB_QC snapshots (.mbqc).
+Runs outside Revit with CPython. Snapshots are checked in parallel, one worker process per core.
+
+Usage (from the lib folder):
+    python -m Snippets._batch_qc <snapshots folder> [-o results.json] [-j 8] [-c levels,grids] [-r]"""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import traceback
+import multiprocessing
+
+# Custom Imports
+from Snippets._checks    import CHECKS
+from Snippets._qc_runner import QCSession
+from Snippets._snapshot  import load_snapshot, SNAPSHOT_EXT
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def find_snapshots(folder, recursive=False):
+    #type: (str, bool) -> list
+    """Sorted paths of all snapshot files in a folder."""
+    suffix = '.' + SNAPSHOT_EXT
+    if not recursive:
+        return sorted(os.path.join(folder, f) for f in os.listdir(folder) if f.lower().endswith(suffix))
+
+    paths = []
+    for root, _, files in os.walk(folder):
+        paths.extend(os.path.join(root, f) for f in files if f.lower().endswith(suffix))
+    return sorted(paths)
+
+
+def check_snapshot(job):
+    #type: (tuple) -> dict
+    """Worker: load one snapshot and run the checks on it.
+    :param job: (snapshot path, list of check names in the order they run, or None for all)
+    :return:    Serializable dict with the model meta data and every check result."""
+    path, names = job
+    start = time.time()
+    try:
+        session = QCSession(load_snapshot(path))
+        results = session.run(names)
+        return {'snapshot': path,
+                'meta':     session.data.meta,
+                'elapsed':  time.time() - start,
+                'error':    None,
+                'results':  [dict(r.to_dict(), name=name) for name, r in zip(names or list(CHECKS), results)]}
+    except Exception:
+        return {'snapshot': path, 'meta': {}, 'elapsed': time.time() - start,
+                'error': traceback.format_exc(), 'results': []}
+
+
+def run_batch(paths, names=None, processes=None):
+    #type: (list, list, int) -> list
+    """Check many snapshots on a process pool.
+    :param paths:     Snapshot file paths.
+    :param names:     Check names to run, in the order they run. All registered checks if None.
+    :param processes: Number of worker processes. One per core if None.
+    :return:          One dict per snapshot (see check_snapshot), in the order of paths."""
+    jobs      = [(path, names) for path in paths]
+    processes = min(processes or multiprocessing.cpu_count(), max(len(jobs), 1))
+
+    if processes == 1:
+        return [check_snapshot(job) for job in jobs]
+
+    pool = multiprocessing.Pool(processes)
+    try:
+        reports = pool.map(check_snapshot, jobs, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+    return reports
+
+
+def summarize(reports):
+    """Totals of a batch: models, failed models, failed checks and rows per check."""
+    rows_per_check = {}
+    for report in reports:
+        for result in report['results']:
+            rows_per_check[result['name']] = rows_per_check.get(result['name'], 0) + len(result['rows'])
+    return {'models':         len(reports),
+            'failed_models':  sum(1 for r in reports if r['error']),
+            'failed_checks':  sum(1 for r in reports for res in r['results'] if res['error']),
+            'rows_per_check': rows_per_check}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run MB_QC checks over a folder of model snapshots.')
+    parser.add_argument('folder',              help='Folder with .{} snapshot files.'.format(SNAPSHOT_EXT))
+    parser.add_argument('-o', '--output',      default='mbqc_results.json', help='Aggregated result file (JSON).')
+    parser.add_argument('-j', '--processes',   type=int, default=None, help='Worker processes. Default: one per core.')
+    parser.add_argument('-c', '--checks',      default=None,
+                        help='Comma separated check names. Default: all ({}).'.format(', '.join(CHECKS)))
+    parser.add_argument('-r', '--recursive',   action='store_true', help='Search sub-folders for snapshots.')
+    args = parser.parse_args(argv)
+
+    names = [n.strip() for n in args.checks.split(',')] if args.checks else None
+    for name in names or []:
+        if name not in CHECKS:
+            parser.error('Unknown check "{}". Available: {}'.format(name, ', '.join(CHECKS)))
+
+    paths = find_snapshots(args.folder, args.recursive)
+    if not paths:
+        parser.error('No .{} files found in {}'.format(SNAPSHOT_EXT, args.folder))
+
+    start   = time.time()
+    reports = run_batch(paths, names, args.processes)
+    summary = dict(summarize(reports), elapsed=time.time() - start)
+
+    with io.open(args.output, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'summary': summary, 'models': reports}, ensure_ascii=False, indent=1))
+
+    sys.stdout.write('Checked {models} models ({failed_models} failed) in {elapsed:.1f}s -> {output}\n'.format(
+        output=args.output, **summary))
+    return 1 if summary['failed_models'] or summary['failed_checks'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
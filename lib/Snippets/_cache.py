@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+# Process-level caches. With rocket mode (extension.json) lib modules stay loaded between
+# button clicks, so values kept here are reused by every later run in the same Revit session.
+# Entries are tied to a document state (document key + change stamp of Snippets._events)
+# and flushed when the document closes.
+from collections import OrderedDict
+
+# Custom Imports
+from Snippets._events import document_key, get_change_stamp, add_closing_listener
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+MAX_ENTRIES = 64        # Default size of a cache. The least recently used entry is evicted first.
+
+_caches = OrderedDict()  # name -> DocumentCache, flushed together on DocumentClosing
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+class LRUCache(object):
+    """Size-bounded dict. Reading or writing an entry makes it the most recently used one,
+    adding an entry to a full cache evicts the least recently used one."""
+
+    def __init__(self, max_size=MAX_ENTRIES):
+        self.max_size = max_size
+        self.hits     = 0
+        self.misses   = 0
+        self._data    = OrderedDict()
+
+    def get(self, key, default=None):
+        if key not in self._data:
+            self.misses += 1
+            return default
+        self.hits += 1
+        value = self._data.pop(key)
+        self._data[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._data.pop(key, None)
+        self._data[key] = value
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        return self._data.pop(key, default)
+
+    def remove_where(self, predicate):
+        """Remove every entry whose key matches predicate(key)."""
+        for key in [k for k in self._data if predicate(k)]:
+            del self._data[key]
+
+    def clear(self):
+        self._data.clear()
+
+    def keys(self):
+        return list(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+
+class DocumentCache(object):
+    """Values computed from a document, reused until the document changes or closes.
+
+    e.g.
+    _material_names = document_cache('material_names')
+    names           = _material_names.get(doc, dict)        # same dict on every click until doc changes"""
+
+    def __init__(self, name, max_size=MAX_ENTRIES):
+        self.name     = name
+        self.hits     = 0
+        self.misses   = 0
+        self._entries = LRUCache(max_size)    # (document key, key) -> (change stamp, value)
+
+    def get(self, doc, build, key=None):
+        """Cached value for the current state of doc, or build() stored as the new value.
+        :param doc:   Document the value is computed from.
+        :param build: Callable without arguments that computes the value.
+        :param key:   Optional key, for several values per document. e.g. a link type id"""
+        entry_key = (document_key(doc), key)
+        stamp     = get_change_stamp(doc)
+        cached    = self._entries.get(entry_key)
+        if cached is not None and cached[0] == stamp:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        value = build()
+        self._entries[entry_key] = (stamp, value)
+        return value
+
+    def forget(self, doc_key):
+        """Drop every value of a document."""
+        self._entries.remove_where(lambda entry_key: entry_key[0] == doc_key)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def document_cache(name, max_size=MAX_ENTRIES):
+    #type: (str, int) -> DocumentCache
+    """Get the process-level DocumentCache registered under name (created on first call)."""
+    if name not in _caches:
+        _caches[name] = DocumentCache(name, max_size)
+    return _caches[name]
+
+
+def clear_caches():
+    """Empty every cache. e.g. after a pyRevit reload or in benchmarks, to time a cold run."""
+    for cache in _caches.values():
+        cache.clear()
+
+
+def cache_stats():
+    #type: () -> list
+    """(name, entries, hits, misses) of every cache."""
+    return [(name, len(cache), cache.hits, cache.misses) for name, cache in _caches.items()]
+
+
+def _forget_document(doc_key):
+    for cache in _caches.values():
+        cache.forget(doc_key)
+
+add_closing_listener(_forget_document)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+# CAD instances ('import_instances' table) sorted out in a single pass: linked vs imported,
+# and instance counts per view and per CAD file. Pure Python, used by the CAD checks of Snippets._checks.
+from collections import OrderedDict
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+NOT_IN_VIEW = "Not Placed in a View"   # view_id None: 3D link or model import
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+class CadCount(object):
+    """Linked and imported instances of one view or one CAD file."""
+    __slots__ = ('name', 'linked', 'imported', 'names')
+
+    def __init__(self, name):
+        self.name     = name      # View or CAD file name, for display
+        self.linked   = 0
+        self.imported = 0
+        self.names    = set()     # CAD files of a view / ids of the views of a CAD file
+
+    @property
+    def total(self):
+        return self.linked + self.imported
+
+
+class CadAudit(object):
+    """Every CAD instance of a model, read once.
+
+    e.g.
+    audit = CadAudit(data.rows('import_instances'))
+    audit.linked                            # records of linked instances
+    audit.by_view[view_id].imported         # imported instances placed in that view (None: not in a view)"""
+
+    def __init__(self, records):
+        #type: (list) -> None
+        self.linked   = []
+        self.imported = []
+        self.by_view  = OrderedDict()     # view id (None: not in a view) -> CadCount
+        self.by_file  = OrderedDict()     # CAD file name -> CadCount
+
+        for cad in records:
+            # Views are told apart by id: a floor plan and a ceiling plan can share a name.
+            # (Snapshots written before view ids were extracted only have the name)
+            view_id   = cad.get('view_id', cad['view_name'])
+            view      = self._count(self.by_view, view_id, cad['view_name'] or NOT_IN_VIEW)
+            cad_file  = self._count(self.by_file, cad['name'], cad['name'])
+            if cad['is_linked']:
+                self.linked.append(cad)
+                view.linked     += 1
+                cad_file.linked += 1
+            else:
+                self.imported.append(cad)
+                view.imported     += 1
+                cad_file.imported += 1
+            view.names.add(cad['name'])
+            cad_file.names.add(view_id)
+
+    @staticmethod
+    def _count(counts, key, name):
+        count = counts.get(key)
+        if count is None:
+            count = counts[key] = CadCount(name)
+        return count
+
+    def __len__(self):
+        return len(self.linked) + len(self.imported)
@@ -0,0 +1,461 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+# Pure Python: checks read plain records from ModelData, so they run the same
+# on a live document (Snippets._extract.LiveModelData) and on an offline snapshot.
+from operator    import itemgetter
+from collections import OrderedDict
+
+# Custom Imports
+from Snippets._convert   import convert_from_internal
+from Snippets._profiling import phase
+# Snippets._spatial and Snippets._cad_audit are imported by the checks that use them.
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+CHECKS = OrderedDict()   # check name -> QCCheck, in registration order.
+
+MIN_CROP_OVERLAP = 0.5   # Crop regions covering a scope box at least this much (intersection / union) should match it.
+MAX_NAMES        = 5     # Scope box names listed in a cell, the rest are counted.
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+class QCResult(object):
+    """Table produced by a single check.
+    Rows hold plain values. The column at link_column holds element ids (int),
+    which the renderer turns into clickable links."""
+
+    def __init__(self, title, columns, rows, empty_message=None, link_column=None):
+        self.title         = title
+        self.columns       = columns
+        self.rows          = rows
+        self.empty_message = empty_message
+        self.link_column   = link_column
+        self.elapsed       = 0.0       # Wall-clock seconds, set by the runner.
+        self.error         = None      # Traceback text if the check failed.
+        self.cached        = False     # True if reused from a previous run on unchanged tables.
+
+    @property
+    def is_empty(self):
+        return not self.rows
+
+    def to_dict(self):
+        """Serializable form, used by the batch QC result file."""
+        return {'title':   self.title,
+                'columns': self.columns,
+                'rows':    self.rows,
+                'elapsed': self.elapsed,
+                'error':   self.error}
+
+
+class QCCheck(object):
+    """Registered QC check.
+    tables lists the ModelData tables the check reads, so a data source that tracks
+    changes (Snippets._incremental) can hand back the previous result when none of them changed."""
+
+    def __init__(self, name, title, func, tables=None):
+        self.name   = name
+        self.title  = title
+        self.func   = func
+        self.tables = tables
+
+    def run(self, data):
+        #type: (ModelData) -> QCResult
+        with phase('check.' + self.name) as p:
+            result = data.get_cached_result(self)
+            if result is not None:
+                result.cached = True
+            else:
+                result = self.func(data)
+                data.store_result(self, result)
+            p.count = len(result.rows)
+            p.extra = {'cached': result.cached}
+        return result
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def qc_check(name, title, tables=None):
+    """Decorator to register a check function in CHECKS.
+    :param name:   Unique name of the check. e.g. 'levels'
+    :param title:  Title displayed in reports.
+    :param tables: ModelData tables read by the check. Results are never reused if None."""
+    def decorator(func):
+        CHECKS[name] = QCCheck(name, title, func, tables)
+        return func
+    return decorator
+
+
+def get_check(name):
+    #type: (str) -> QCCheck
+    return CHECKS[name]
+
+
+def run_check(name, data):
+    #type: (str, ModelData) -> QCResult
+    """Run a single registered check. Used by the pushbuttons.
+    Only the tables of the check are scanned, in one traversal of a live model.
+    :param data: ModelData from a snapshot or LiveModelData(doc)."""
+    check = CHECKS[name]
+    if check.tables:
+        data.prepare(check.tables)
+    return check.run(data)
+
+
+#>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> HELPERS
+def _workset(record, not_workshared="N/A"):
+    workset = record['workset']
+    return not_workshared if workset is None else workset
+
+
+def _monitored(record):
+    return record['monitored_by'] or "Not Monitored"
+
+
+def _not_set(value):
+    return "Not Set" if value is None else value
+
+
+def _scope_box_index(data):
+    #type: (ModelData) -> ScopeBoxIndex
+    """ScopeBoxIndex of the 'scope_boxes' table, built once for all the scope box checks of a run."""
+    from Snippets._spatial import ScopeBoxIndex
+    return data.derived('scope_box_index', 'scope_boxes', ScopeBoxIndex)
+
+
+def _grid_segments(grid):
+    """[(x0, y0, x1, y1)] of a grid in plan: its line, or the chords along a curved grid."""
+    points = grid.get('curve_points') or [(grid['x0'], grid['y0']), (grid['x1'], grid['y1'])]
+    return [(a[0], a[1], b[0], b[1]) for a, b in zip(points, points[1:])]
+
+
+def _names(ids, names):
+    """Names of some ids joined in one cell. e.g. 'Box A, Box B (+3)'"""
+    if not ids:
+        return "None"
+    listed = sorted(names[i] for i in ids)
+    extra  = " (+{})".format(len(listed) - MAX_NAMES) if len(listed) > MAX_NAMES else ""
+    return ", ".join(listed[:MAX_NAMES]) + extra
+
+
+def _tree_label(depth, name):
+    """Name indented under its parent. e.g. depth 2 -> '   └ Furniture'"""
+    if not depth:
+        return name
+    return u'{}\u2514 {}'.format(u'\u00a0' * 3 * (depth - 1), name)
+
+
+# ╔═╗╦ ╦╔═╗╔═╗╦╔═╔═╗
+# ║  ╠═╣║╣ ║  ╠╩╗╚═╗
+# ╚═╝╩ ╩╚═╝╚═╝╩ ╩╚═╝ CHECKS
+# ==================================================
+@qc_check('base_point', 'Project Base Point', tables=['base_points'])
+def check_base_point(data):
+    rows = []
+    base_points = data.rows('base_points')
+    if base_points:
+        # Assuming there's only one Project Base Point
+        bp = base_points[0]
+        rows.append([_not_set(bp['north_south']), _not_set(bp['east_west']),
+                     _not_set(bp['elevation']),   _not_set(bp['angle']), bp['id']])
+
+    return QCResult("Project Base Point", ["N/S", "E/W", "Elevation", "Angle to True North", "Look up"], rows,
+                    empty_message="No Project Base Point found in the document.", link_column=4)
+
+
+@qc_check('levels', 'Project Levels', tables=['levels'])
+def check_levels(data):
+    levels     = data.rows('levels')
+    elevations = convert_from_internal([l['elevation'] for l in levels], 'm')
+
+    levels_info = []
+    for l, level_elevation_m in zip(levels, elevations):
+        if abs(level_elevation_m) < 1e-10:
+            level_elevation_m = 0.00
+        levels_info.append([l['name'], level_elevation_m, _workset(l), l['scope_box'], _monitored(l), l['id']])
+
+    levels_info.sort(key=lambda row: row[1])
+    return QCResult("Levels", ["Name", "Elevation", "Workset", "Scope Box", "Monitored By", "Look up"], levels_info,
+                    empty_message="There are no Levels in the project", link_column=5)
+
+
+@qc_check('grids', 'Project Grids', tables=['grids'])
+def check_grids(data):
+    grids_info = [[g['name'], _workset(g), g['scope_box'], _monitored(g), g['id']] for g in data.rows('grids')]
+    grids_info.sort(key=lambda row: row[0])
+    return QCResult("Grids", ["Name", "Workset", "Scope Box", "Monitored By", "Look up"], grids_info,
+                    empty_message="There are no Grids in the project", link_column=4)
+
+
+@qc_check('scope_boxes', 'Scope Boxes', tables=['scope_boxes'])
+def check_scope_boxes(data):
+    scope_box_worksets = [[sb['name'], _workset(sb, "Model is not Workshared"), sb['id']]
+                          for sb in data.rows('scope_boxes')]
+    return QCResult("Scope Box Worksets", ["Scope Box Name", "Workset Name", "Look up"], scope_box_worksets,
+                    empty_message="No scope Boxes were found in the document", link_column=2)
+
+
+@qc_check('datums_outside_scope_box', 'Datums outside Scope Box', tables=['levels', 'grids', 'scope_boxes'])
+def check_datums_outside_scope_box(data):
+    """Levels and grids assigned to a scope box they don't reach: a level above or below the box,
+    a grid that doesn't run through it in plan (curved grids along their arc). Lists the boxes the datum does reach."""
+    from Snippets._spatial import segment_crosses_rect, TOLERANCE
+    boxes = _scope_box_index(data)
+    names = dict((sb_id, sb['name']) for sb_id, sb in boxes.boxes.items())
+    rows  = []
+    for level in data.rows('levels'):
+        sb_id = level.get('scope_box_id')
+        if sb_id not in boxes:
+            continue
+        box = boxes.boxes[sb_id]
+        z   = level.get('z')            # None in snapshots saved before z was recorded
+        if z is not None and not box['min_z'] - TOLERANCE <= z <= box['max_z'] + TOLERANCE:
+            rows.append([level['name'], "Level", names[sb_id], "Elevation outside the Scope Box",
+                         _names(boxes.at_elevation(z), names), level['id']])
+    for grid in data.rows('grids'):
+        sb_id = grid.get('scope_box_id')
+        if sb_id not in boxes or grid.get('x0') is None:
+            continue
+        segments = _grid_segments(grid)
+        rect     = boxes.rect(sb_id)
+        if not any(segment_crosses_rect(x0, y0, x1, y1, rect) for x0, y0, x1, y1 in segments):
+            reached = set(sb for segment in segments for sb in boxes.crossed_by(*segment))
+            rows.append([grid['name'], "Grid", names[sb_id], "Grid line outside the Scope Box",
+                         _names(reached, names), grid['id']])
+
+    rows.sort(key=lambda row: (row[1], row[0]))
+    return QCResult("Datums outside their Scope Box",
+                    ["Name", "Datum", "Scope Box", "Issue", "Reaches Scope Boxes", "Look up"], rows,
+                    empty_message="Every Level and Grid reaches its Scope Box", link_column=5)
+
+
+@qc_check('scope_box_overlaps', 'Overlapping Scope Boxes', tables=['scope_boxes'])
+def check_scope_box_overlaps(data):
+    """Pairs of scope boxes that overlap in plan and in height. Boxes that only share an edge are fine."""
+    from Snippets._spatial import overlap_area
+    boxes = _scope_box_index(data)
+    pairs = boxes.overlaps()
+    areas = convert_from_internal([overlap_area(boxes.rect(a), boxes.rect(b)) for a, b in pairs], 'm2')
+
+    rows = [[boxes.boxes[a]['name'], boxes.boxes[b]['name'], round(area, 2), a] for (a, b), area in zip(pairs, areas)]
+    rows.sort(key=lambda row: (row[0], row[1]))
+    return QCResult("Overlapping Scope Boxes ({} boxes, {} overlaps)".format(len(boxes), len(rows)),
+                    ["Scope Box", "Overlaps", "Overlap Area (m2)", "Look up"], rows,
+                    empty_message="No Scope Boxes overlap", link_column=3)
+
+
+@qc_check('view_crop_alignment', 'View Crops vs Scope Boxes', tables=['view_crops', 'scope_boxes'])
+def check_view_crop_alignment(data):
+    """Cropped plan views whose crop region doesn't line up with a scope box:
+    - the view uses a scope box but its crop differs from it
+    - the view has no scope box but is cropped over one (mostly), off by some distance or exactly like it"""
+    from Snippets._spatial import max_edge_offset, TOLERANCE
+    boxes   = _scope_box_index(data)
+    found   = []    # (view, scope box id, issue, offset)
+    for view in data.rows('view_crops'):
+        if view.get('min_x') is None:
+            continue
+        rect  = view['min_x'], view['min_y'], view['max_x'], view['max_y']
+        sb_id = view['scope_box_id']
+        if sb_id in boxes:
+            offset = max_edge_offset(rect, boxes.rect(sb_id))
+            if offset > TOLERANCE:
+                found.append((view, sb_id, "Crop differs from its Scope Box", offset))
+            continue
+        sb_id, ratio = boxes.best_match(rect)
+        if sb_id is None or ratio < MIN_CROP_OVERLAP:
+            continue
+        offset = max_edge_offset(rect, boxes.rect(sb_id))
+        found.append((view, sb_id, "Offset from Scope Box" if offset > TOLERANCE else "Same as Scope Box, not assigned",
+                      offset))
+
+    offsets = convert_from_internal([offset for _, _, _, offset in found], 'm')
+    rows    = [[view['name'], view['view_type'], view['scope_box'], boxes.boxes[sb_id]['name'], issue,
+                round(offset_m, 3), view['id']]
+               for (view, sb_id, issue, _), offset_m in zip(found, offsets)]
+    rows.sort(key=lambda row: (row[4], row[0]))
+    return QCResult("View Crops not aligned with Scope Boxes",
+                    ["View", "View Type", "Scope Box", "Closest Scope Box", "Issue", "Offset (m)", "Look up"], rows,
+                    empty_message="Every cropped plan view lines up with its Scope Box", link_column=6)
+
+
+@qc_check('links', 'Revit Links', tables=['link_instances'])
+def check_links(data):
+    combined_data = []
+    for link in data.rows('link_instances'):
+        combined_data.append([link['name'], link['type_name'], link['shared_site'],
+                              _workset(link, "Model is not Workshared"),
+                              link['pbp_north_south'], link['pbp_east_west'],
+                              link['pbp_elevation'],   link['pbp_angle']])
+
+    combined_data.sort(key=lambda x: x[0])
+    return QCResult("Revit Links",
+                    ["Link Name", "Link Type", "Shared Site", "Workset", "N/S", "E/W", "Elevation", "Angle to True North"],
+                    combined_data, empty_message="There are no Links in the project")
+
+
+@qc_check('link_tree', 'Nested Links', tables=['link_tree'])
+def check_link_tree(data):
+    """Every link down through nested links, in tree order, placed in host coordinates."""
+    nodes  = data.rows('link_tree')
+    coords = convert_from_internal([n[axis] for n in nodes for axis in ('x', 'y', 'z')], 'm')
+
+    rows = []
+    for i, n in enumerate(nodes):
+        x, y, z = coords[3 * i:3 * i + 3]
+        rows.append([_tree_label(n['depth'], n['type_name']), n['parent'],
+                     _workset(n, "Model is not Workshared"), round(x, 3), round(y, 3), round(z, 3),
+                     round(n['rotation'], 2), n['pbp_north_south'], n['pbp_east_west'],
+                     n['pbp_elevation'], n['pbp_angle'], n['id']])
+
+    models = len(set(n['document'] for n in nodes if n['document']))
+    return QCResult("Link Tree ({} links, {} linked models)".format(len(nodes), models),
+                    ["Link", "Placed In", "Workset", "X (m)", "Y (m)", "Z (m)", "Rotation",
+                     "N/S", "E/W", "Elevation", "Angle to True North", "Host Link"],
+                    rows, empty_message="There are no Links in the project", link_column=11)
+
+
+@qc_check('external_refs', 'External References', tables=['external_refs'])
+def check_external_refs(data):
+    """Revit/CAD links and other external files with their path and load state, read without loading them."""
+    refs = data.rows('external_refs')
+    rows = [[r['name'], r['kind'], r['status'], r['path_type'], r['path'] or "No Path", r['id']] for r in refs]
+    rows.sort(key=lambda row: (row[1], row[0]))
+
+    not_loaded = len([r for r in refs if r['status'] != 'Loaded'])
+    return QCResult("External References ({} files, {} not loaded)".format(len(refs), not_loaded),
+                    ["File Name", "Reference Type", "Status", "Path Type", "Path", "Look up"], rows,
+                    empty_message="There are no external file references in the project", link_column=5)
+
+
+def _cad_audit(data):
+    #type: (ModelData) -> CadAudit
+    """CadAudit of the 'import_instances' table, built once for all the CAD checks of a run."""
+    from Snippets._cad_audit import CadAudit
+    return data.derived('cad_audit', 'import_instances', CadAudit)
+
+
+def _collect_cad_info(records, no_view_name):
+    """Get Name, View and Lookup of linked or imported CAD instances."""
+    return [[cad['name'], no_view_name if cad['view_name'] is None else cad['view_name'], cad['id']]
+            for cad in records]
+
+
+@qc_check('linked_cad', 'Linked CAD', tables=['import_instances'])
+def check_linked_cad(data):
+    rows = _collect_cad_info(_cad_audit(data).linked, "The instance was inserted as a 3D link")
+    return QCResult("LINKED CAD", ["File Name", "View Name", "Lookup"], rows,
+                    empty_message="There are no Linked CADs", link_column=2)
+
+
+@qc_check('imported_cad', 'Imported CAD', tables=['import_instances'])
+def check_imported_cad(data):
+    rows = _collect_cad_info(_cad_audit(data).imported, "Not Placed in a View")
+    return QCResult("IMPORTED CAD", ["File Name", "View Name", "Lookup"], rows,
+                    empty_message="There are no Imported CADs", link_column=2)
+
+
+@qc_check('cad_by_view', 'CAD per View', tables=['import_instances'])
+def check_cad_by_view(data):
+    """Linked and imported CAD instances counted per view, most crowded view first."""
+    audit = _cad_audit(data)
+    rows  = [[count.name, count.linked, count.imported, count.total, len(count.names)]
+             for count in audit.by_view.values()]
+    rows.sort(key=lambda row: (-row[3], row[0]))
+    return QCResult("CAD per View ({} instances in {} views)".format(len(audit), len(rows)),
+                    ["View Name", "Linked", "Imported", "Instances", "CAD Files"], rows,
+                    empty_message="There are no CADs in the project")
+
+
+@qc_check('cad_by_file', 'CAD per File', tables=['import_instances'])
+def check_cad_by_file(data):
+    """Linked and imported CAD instances counted per CAD file, most placed file first."""
+    audit = _cad_audit(data)
+    rows  = [[name, count.linked, count.imported, count.total, len(count.names)]
+             for name, count in audit.by_file.items()]
+    rows.sort(key=lambda row: (-row[3], row[0]))
+    return QCResult("CAD per File ({} instances of {} files)".format(len(audit), len(rows)),
+                    ["File Name", "Linked", "Imported", "Instances", "Views"], rows,
+                    empty_message="There are no CADs in the project")
+
+
+LAYERS_TABLE_HEADER = "<table border='1'><tr><th>Layer</th><th>Material</th><th>Thickness (cm)</th><th>Inside Core</th></tr>"
+STRUCTURE_COLUMNS   = ["Name", "Width (cm)", "Function", "Structural Material", "layers", "Look up"]
+
+
+def _layers_table(layers, widths_cm):
+    """HTML table of the layers of one type. Parts are collected in a list and joined once."""
+    parts = [LAYERS_TABLE_HEADER]
+    for layer, width_cm in zip(layers, widths_cm):
+        parts.extend(("<tr><td>", layer['function'],
+                      "</td><td>", layer['material'] or "No Material",
+                      "</td><td>", str(width_cm),
+                      "</td><td>", "✅" if layer['is_core'] else "",
+                      "</td></tr>"))
+    parts.append("</table>")
+    return "".join(parts)
+
+
+def _collect_structure_info(data, kind):
+    """Get Name, Width, Function, Structural Material and a layers table for each type of a kind."""
+    host_types = [t for t in data.rows('host_types') if t['kind'] == kind]
+    type_ids   = set(t['id'] for t in host_types)
+    layers     = [layer for layer in data.rows('layers') if layer['type_id'] in type_ids]
+
+    # Convert all widths in two batches instead of one call per type and layer.
+    type_widths_cm  = convert_from_internal([t['width'] for t in host_types], 'cm')
+    layer_widths_cm = convert_from_internal([layer['width'] for layer in layers], 'cm')
+
+    layers_by_type = {}
+    for layer, width_cm in zip(layers, layer_widths_cm):
+        type_layers, type_widths = layers_by_type.setdefault(layer['type_id'], ([], []))
+        type_layers.append(layer)
+        type_widths.append(width_cm)
+
+    keyed_rows = []
+    for host_type, width_cm in zip(host_types, type_widths_cm):
+        row = [host_type['name'],
+               width_cm,
+               _not_set(host_type['function']),
+               host_type['structural_material'] or "No Structural Material",
+               _layers_table(*layers_by_type.get(host_type['id'], ([], []))),
+               host_type['id']]
+        keyed_rows.append((row[0], row))
+
+    # Sort on the precomputed name only, never on the (large) HTML cells.
+    keyed_rows.sort(key=itemgetter(0))
+    return [row for _, row in keyed_rows]
+
+
+def _structure_result(data, kind, title, empty_message):
+    return QCResult(title, STRUCTURE_COLUMNS, _collect_structure_info(data, kind),
+                    empty_message=empty_message, link_column=5)
+
+
+@qc_check('wall_structure', 'Walls Structure', tables=['host_types', 'layers'])
+def check_wall_structure(data):
+    return _structure_result(data, 'wall', "Basic Wall Types", "There are no wall type in the project")
+
+
+@qc_check('floor_structure', 'Floors Structure', tables=['host_types', 'layers'])
+def check_floor_structure(data):
+    return _structure_result(data, 'floor', "Basic floor Types", "There are no floor type in the project")
+
+
+@qc_check('roof_structure', 'Roofs Structure', tables=['host_types', 'layers'])
+def check_roof_structure(data):
+    return _structure_result(data, 'roof', "Basic Roof Types", "There are no roof type in the project")
+
+
+@qc_check('ceiling_structure', 'Ceilings Structure', tables=['host_types', 'layers'])
+def check_ceiling_structure(data):
+    return _structure_result(data, 'ceiling', "Compound Ceiling Types", "There are no ceiling type in the project")
@@ -3,138 +3,145 @@
 # ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
 # ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
 # ==================================================
-from Autodesk.Revit.DB import *
+# RevitAPI and NumPy are imported on first use: offline (snapshot) mode only needs the FACTORS below,
+# and most button runs never convert a batch large enough for NumPy.
+
+# Custom Imports
+from Snippets._profiling import phase
 
 # ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
 # ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
 #  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
 # ==================================================
-app      = __revit__.Application
-rvt_year = int(app.VersionNumber)
+try:
+    app      = __revit__.Application
+    rvt_year = int(app.VersionNumber)
+except NameError:
+    app, rvt_year = None, None
+
+# Internal units are decimal feet, so these factors are exact and don't need RevitAPI.
+FACTORS_FROM_INTERNAL = {'m':  0.3048,
+                         'cm': 30.48,
+                         'mm': 304.8,
+                         'm2': 0.09290304}
+
+# units -> (UnitTypeId property for RVT 2021+, DisplayUnitType member for older versions)
+UNIT_IDS = {'m':  ('Meters',       'DUT_METERS'),
+            'cm': ('Centimeters',  'DUT_CENTIMETERS'),
+            'mm': ('Millimeters',  'DUT_MILLIMETERS'),
+            'm2': ('SquareMeters', 'DUT_SQUARE_METERS')}
+
+# Sequences at least this long are converted with NumPy (when available).
+NUMPY_MIN_SIZE = 1000
+
+_factors = {}       # units -> factor from internal units, resolved once per session
+_numpy   = []       # [numpy module or None] once the import was tried
 
 
 # ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
 # ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
 # ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
 # ==================================================
+def get_numpy():
+    """NumPy module, or None if it isn't installed (IronPython). Imported on the first large batch."""
+    if not _numpy:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None    # IronPython: batches are converted with plain Python.
+        _numpy.append(numpy)
+    return _numpy[0]
+
+
+def get_unit_id(units):
+    """ForgeTypeId (RVT 2021+) or DisplayUnitType of units. e.g. 'm' -> UnitTypeId.Meters"""
+    type_id_name, dut_name = UNIT_IDS[units]
+    if rvt_year >= 2021:
+        from Autodesk.Revit.DB import UnitTypeId
+        return getattr(UnitTypeId, type_id_name)
+    from Autodesk.Revit.DB import DisplayUnitType
+    return getattr(DisplayUnitType, dut_name)
+
+
+def get_factor(units):
+    #type: (str) -> float
+    """Multiplier from internal units to units. Resolved with UnitUtils once per session,
+    or taken from FACTORS_FROM_INTERNAL outside Revit.
+    :param units: One of UNIT_IDS: ['m', 'cm', 'mm', 'm2']"""
+    if units not in _factors:
+        if rvt_year is None:
+            _factors[units] = FACTORS_FROM_INTERNAL[units]
+        else:
+            # Length and area conversions are linear, so the factor is the conversion of 1.
+            from Autodesk.Revit.DB import UnitUtils
+            _factors[units] = UnitUtils.ConvertFromInternalUnits(1.0, get_unit_id(units))
+    return _factors[units]
+
+
+def _scale(values, factor):
+    """values * factor. NumPy arrays stay arrays, other sequences become lists."""
+    if len(values) >= NUMPY_MIN_SIZE or type(values).__module__ == 'numpy':
+        numpy = get_numpy()
+        if numpy is not None:
+            if isinstance(values, numpy.ndarray):
+                return values * factor
+            return (numpy.asarray(values, dtype=float) * factor).tolist()
+    return [v * factor for v in values]
+
+
+def convert_from_internal(values, units='m'):
+    #type: (list, str) -> list
+    """Convert a batch of values from internal units.
+    :param values: Sequence of floats or a NumPy array.
+    :param units:  Target units: ['m', 'cm', 'mm', 'm2']
+    :return:       List of converted values (NumPy array if values is one).
+
+    e.g. convert_from_internal([l.Elevation for l in levels], 'm')"""
+    with phase('convert.' + units, count=len(values)):
+        return _scale(values, get_factor(units))
+
+
+def convert_to_internal(values, units='m'):
+    #type: (list, str) -> list
+    """Convert a batch of values in units to internal units. See convert_from_internal."""
+    return _scale(values, 1.0 / get_factor(units))
+
+
 def convert_internal_units(value, get_internal = True, units='m'):
     #type: (float, bool, str) -> float
     """Function to convert Internal units to meters or vice versa.
     :param value:        Value to convert
     :param get_internal: True to get internal units, False to get Meters
-    :param units:        Select desired Units: ['m', 'm2']
+    :param units:        Select desired Units: ['m', 'm2', 'cm', 'mm']
     :return:             Length in Internal units or Meters."""
-
-    if rvt_year >= 2021:
-        from Autodesk.Revit.DB import UnitTypeId
-        if   units == 'm' : units = UnitTypeId.Meters
-        elif units == "m2": units = UnitTypeId.SquareMeters
-        elif units == 'cm': units = UnitTypeId.Centimeters
-    else:
-        from Autodesk.Revit.DB import DisplayUnitType
-        if   units == 'm' : units = DisplayUnitType.DUT_METERS
-        elif units == "m2": units = DisplayUnitType.DUT_SQUARE_METERS
-        elif units == "cm": units = DisplayUnitType.DUT_CENTIMETERS
-
     if get_internal:
-        return UnitUtils.ConvertToInternalUnits(value, units)
-    return UnitUtils.ConvertFromInternalUnits(value, units)
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+        return value / get_factor(units)
+    return value * get_factor(units)
 
 
 # ╔═╗╔╗ ╔═╗╔═╗╦  ╔═╗╔╦╗╔═╗
 # ║ ║╠╩╗╚═╗║ ║║  ║╣  ║ ║╣
-# ╚═╝╚═╝╚═╝╚═╝╩═╝╚═╝ ╩ ╚═╝ OBSOLETE ( still need to refactor the code)
+# ╚═╝╚═╝╚═╝╚═╝╩═╝╚═╝ ╩ ╚═╝ OBSOLETE (thin wrappers, use convert_from_internal / convert_to_internal)
 def convert_cm_to_feet(length):
     """Function to convert cm to feet."""
+    return length / get_factor('cm')
 
-    # RVT >= 2022
-    if rvt_year < 2022:
-        from Autodesk.Revit.DB import DisplayUnitType
-        return UnitUtils.Convert(length,
-                                DisplayUnitType.DUT_CENTIMETERS,
-                                DisplayUnitType.DUT_DECIMAL_FEET)
-    # RVT >= 2022
-    else:
-        from Autodesk.Revit.DB import UnitTypeId
-        return UnitUtils.ConvertToInternalUnits(length, UnitTypeId.Centimeters)
 
 def convert_m_to_feet(length):
-    """Function to convert cm to feet."""
-
-    # RVT >= 2022
-    if rvt_year < 2022:
-        from Autodesk.Revit.DB import DisplayUnitType
-        return UnitUtils.Convert(length,
-                                 DisplayUnitType.DUT_METERS,
-                                 DisplayUnitType.DUT_DECIMAL_FEET)
-    # RVT >= 2022
-    else:
-        from Autodesk.Revit.DB import UnitTypeId
-        return UnitUtils.ConvertToInternalUnits(length, UnitTypeId.Meters)
-
+    """Function to convert m to feet."""
+    return length / get_factor('m')
 
 
 def convert_internal_to_m(length):
     """Function to convert internal to meters."""
-
-    # RVT >= 2022
-    if rvt_year < 2022:
-        from Autodesk.Revit.DB import DisplayUnitType
-        return UnitUtils.Convert(length,
-                                 DisplayUnitType.DUT_DECIMAL_FEET,
-                                 DisplayUnitType.DUT_METERS)
-    # RVT >= 2022
-    else:
-        from Autodesk.Revit.DB import UnitTypeId
-        return UnitUtils.ConvertFromInternalUnits(length, UnitTypeId.Meters)
-
+    return length * get_factor('m')
 
 
 def convert_internal_to_cm(length):
     """Function to convert internal to centimeters."""
-
-    # RVT >= 2022
-    if rvt_year < 2022:
-        from Autodesk.Revit.DB import DisplayUnitType
-        return UnitUtils.Convert(length,
-                                 DisplayUnitType.DUT_DECIMAL_FEET,
-                                 DisplayUnitType.DUT_CENTIMETERS)
-    # RVT >= 2022
-    else:
-        from Autodesk.Revit.DB import UnitTypeId
-        return UnitUtils.ConvertFromInternalUnits(length, UnitTypeId.Centimeters)
-
-
+    return length * get_factor('cm')
 
 
 def convert_internal_to_m2(area):
-    """Function to convert internal to meters."""
-
-    # RVT >= 2022
-    if rvt_year < 2022:
-        from Autodesk.Revit.DB import DisplayUnitType
-        return UnitUtils.Convert(area,
-                                 DisplayUnitType.DUT_SQUARE_FEET,
-                                 DisplayUnitType.DUT_SQUARE_METERS)
-    # RVT >= 2022
-    else:
-        from Autodesk.Revit.DB import UnitTypeId
-        return UnitUtils.ConvertFromInternalUnits(area, UnitTypeId.SquareMeters)
\ No newline at end of file
+    """Function to convert internal to square meters."""
+    return area * get_factor('m2')
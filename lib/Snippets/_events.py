@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+from System import AppDomain
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+# Handlers are kept in AppDomain data, so a re-imported module (new engine or pyRevit reload)
+# replaces the previous subscription instead of stacking another one on the Application.
+APPDOMAIN_KEY = 'MB_QC.DocumentEvents'
+
+_stamps            = {}   # document key -> number of DocumentChanged events seen
+_change_listeners  = []   # callables (doc, args) called on DocumentChanged
+_closing_listeners = []   # callables (doc_key)   called on DocumentClosing
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def document_key(doc):
+    #type: (Document) -> str
+    """Identity of a document that survives between button clicks (Python wrappers don't).
+    Unsaved documents have no path and may share a Title (e.g. two detached "Project1"):
+    their key also has the hash code of the document, which Revit keeps for the whole session."""
+    if doc.PathName:
+        return doc.PathName
+    return u'{}#{}'.format(doc.Title, doc.GetHashCode())
+
+
+def get_change_stamp(doc):
+    #type: (Document) -> int
+    """Counter that increases every time the document changes.
+    Caches store the stamp they were built with and rebuild when it differs."""
+    subscribe(doc.Application)
+    return _stamps.get(document_key(doc), 0)
+
+
+def add_change_listener(callback):
+    """Register callback(doc, args) for every DocumentChanged event."""
+    if callback not in _change_listeners:
+        _change_listeners.append(callback)
+
+
+def add_closing_listener(callback):
+    """Register callback(doc_key) for every DocumentClosing event."""
+    if callback not in _closing_listeners:
+        _closing_listeners.append(callback)
+
+
+def _on_document_changed(sender, args):
+    doc = args.GetDocument()
+    key = document_key(doc)
+    _stamps[key] = _stamps.get(key, 0) + 1
+    for callback in _change_listeners:
+        try:
+            callback(doc, args)
+        except Exception:
+            pass     # Never let a cache listener break the user's transaction.
+
+
+def _on_document_closing(sender, args):
+    key = document_key(args.Document)
+    _stamps.pop(key, None)
+    for callback in _closing_listeners:
+        try:
+            callback(key)
+        except Exception:
+            pass
+
+
+def subscribe(app):
+    """Subscribe to DocumentChanged/DocumentClosing once per Application."""
+    handlers = AppDomain.CurrentDomain.GetData(APPDOMAIN_KEY)
+    if handlers is not None:
+        changed, closing = handlers
+        if changed is _on_document_changed:
+            return
+        # Handlers from a previous load of this module.
+        app.DocumentChanged -= changed
+        app.DocumentClosing -= closing
+
+    app.DocumentChanged += _on_document_changed
+    app.DocumentClosing += _on_document_closing
+    AppDomain.CurrentDomain.SetData(APPDOMAIN_KEY, (_on_document_changed, _on_document_closing))
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import datetime
+
+from Autodesk.Revit.DB import BuiltInParameter, ElementId, Line, XYZ
+
+# Custom Imports
+from Snippets._scanner    import ModelIndex, HOST_KINDS, classify, id_int
+from Snippets._snapshot   import ModelData, TABLES, save_snapshot
+from Snippets._profiling  import phase
+# Resolver, structure, link and reference readers are imported where they're used:
+# a button only loads the readers of the tables its check reads.
+
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+# ModelIndex bucket -> (table, LiveModelData method that builds the record of one element)
+RECORD_BUILDERS = {'base_points':      ('base_points',      'base_point_record'),
+                   'levels':           ('levels',           'level_record'),
+                   'grids':            ('grids',            'grid_record'),
+                   'scope_boxes':      ('scope_boxes',      'scope_box_record'),
+                   'link_instances':   ('link_instances',   'link_record'),
+                   'import_instances': ('import_instances', 'import_record'),
+                   'view_plans':       ('view_crops',       'view_crop_record')}
+
+# Table -> ModelIndex buckets its extractor reads. Tables that aren't listed don't use the index.
+TABLE_BUCKETS = {'base_points':      ['base_points'],
+                 'levels':           ['levels'],
+                 'grids':            ['grids'],
+                 'scope_boxes':      ['scope_boxes'],
+                 'link_instances':   ['link_instances'],
+                 'import_instances': ['import_instances'],
+                 'view_crops':       ['view_plans'],
+                 'host_types':       list(HOST_KINDS),
+                 'layers':           list(HOST_KINDS)}
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+class LiveModelData(ModelData):
+    """ModelData read from an open Revit document.
+    Tables are extracted on first use, so a single button only scans and reads what its check needs,
+    while several checks in one session share the same ModelIndex and DocumentResolver.
+
+    e.g.
+    data   = LiveModelData(doc)
+    result = run_check('levels', data)
+    save_snapshot(data, path)            # all tables -> offline snapshot"""
+
+    def __init__(self, doc):
+        ModelData.__init__(self, meta={'title':         doc.Title,
+                                       'path':          doc.PathName,
+                                       'revit_version': doc.Application.VersionNumber,
+                                       'is_workshared': doc.IsWorkshared,
+                                       'exported':      datetime.datetime.now().isoformat()})
+        self.doc         = doc
+        self._index      = None
+        self._structure  = None
+        self._link_types = {}       # link type id -> link_document_info() or None if not loaded
+
+    @property
+    def index(self):
+        #type: () -> ModelIndex
+        if self._index is None:
+            self._index = ModelIndex(self.doc, buckets=[])     # Buckets are scanned by prepare or on first use
+        return self._index
+
+    @property
+    def structure(self):
+        #type: () -> StructureReader
+        if self._structure is None:
+            from Snippets._structure import StructureReader
+            self._structure = StructureReader(self.doc)
+        return self._structure
+
+    @property
+    def resolver(self):
+        from Snippets._resolver import get_resolver
+        return get_resolver(self.doc, self._index)
+
+    def prepare(self, tables=None):
+        """Scan the buckets of the tables the checks will read, in a single traversal.
+        (The runner times this step separately)"""
+        buckets = set()
+        for table in (TABLES if tables is None else tables):
+            buckets.update(TABLE_BUCKETS.get(table, []))
+        self.index.scan(buckets)
+
+    def rows(self, table):
+        if table not in self.tables:
+            extractor = getattr(self, '_extract_' + table, None)
+            if table in TABLE_BUCKETS:
+                self.index.scan(TABLE_BUCKETS[table])     # All the buckets of a table in one traversal
+            with phase('extract.' + table) as p:
+                self.tables[table] = extractor() if extractor else []
+                p.count = len(self.tables[table])
+        return self.tables[table]
+
+    def extract_all(self):
+        """Read every snapshot table. Returns self."""
+        for table in TABLES:
+            self.rows(table)
+        return self
+
+    # ╦═╗╔═╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+    # ╠╦╝║╣ ║  ║ ║╠╦╝ ║║╚═╗
+    # ╩╚═╚═╝╚═╝╚═╝╩╚══╩╝╚═╝ RECORDS (one element -> one record)
+    # ==================================================
+    def base_point_record(self, bp):
+        from Snippets._links import read_base_points
+        return read_base_points([bp])[0]
+
+    def level_record(self, level):
+        resolver = self.resolver
+        return {'id':           id_int(level.Id),
+                'name':         level.Name,
+                'elevation':    level.Elevation,
+                'z':            level.ProjectElevation,
+                'workset':      resolver.workset_name(level, not_workshared=None),
+                'scope_box':    resolver.scope_box_name(level),
+                'scope_box_id': _id_or_none(resolver.scope_box_id(level)),
+                'monitored_by': resolver.monitored_by(level)}
+
+    def grid_record(self, grid):
+        resolver = self.resolver
+        curve    = grid.Curve
+        start, end = curve.GetEndPoint(0), curve.GetEndPoint(1)
+        points   = None if isinstance(curve, Line) else [[p.X, p.Y] for p in curve.Tessellate()]
+        return {'id':           id_int(grid.Id),
+                'name':         grid.Name,
+                'workset':      resolver.workset_name(grid, not_workshared=None),
+                'scope_box':    resolver.scope_box_name(grid),
+                'scope_box_id': _id_or_none(resolver.scope_box_id(grid)),
+                'monitored_by': resolver.monitored_by(grid),
+                'x0': start.X, 'y0': start.Y, 'x1': end.X, 'y1': end.Y, 'curve_points': points}
+
+    def scope_box_record(self, sb):
+        record = {'id':      id_int(sb.Id),
+                  'name':    sb.Name,
+                  'workset': self.resolver.workset_name(sb, not_workshared=None)}
+        bbox = sb.get_BoundingBox(None)
+        if bbox is not None:
+            record.update({'min_x': bbox.Min.X, 'min_y': bbox.Min.Y, 'min_z': bbox.Min.Z,
+                           'max_x': bbox.Max.X, 'max_y': bbox.Max.Y, 'max_z': bbox.Max.Z})
+        return record
+
+    def view_crop_record(self, view):
+        """Crop region of a plan view in model coordinates, as the rectangle around its (maybe rotated) corners.
+        None for view templates and views that aren't cropped."""
+        if view.IsTemplate or not view.CropBoxActive:
+            return None
+        crop      = view.CropBox
+        transform = crop.Transform
+        corners   = [transform.OfPoint(XYZ(x, y, crop.Min.Z)) for x in (crop.Min.X, crop.Max.X)
+                                                               for y in (crop.Min.Y, crop.Max.Y)]
+        resolver  = self.resolver
+        bip       = BuiltInParameter.VIEWER_VOLUME_OF_INTEREST_CROP
+        return {'id':           id_int(view.Id),
+                'name':         view.Name,
+                'view_type':    str(view.ViewType),
+                'scope_box':    resolver.scope_box_name(view, bip),
+                'scope_box_id': _id_or_none(resolver.scope_box_id(view, bip)),
+                'min_x': min(c.X for c in corners), 'min_y': min(c.Y for c in corners),
+                'max_x': max(c.X for c in corners), 'max_y': max(c.Y for c in corners)}
+
+    def link_document_info(self, link):
+        """link_document_info() of the link document of an instance, or None if it isn't loaded.
+        Resolved once per RevitLinkType (all its instances share the document) and kept
+        across clicks per link document."""
+        type_id = id_int(link.GetTypeId())
+        if type_id not in self._link_types:
+            from Snippets._links import get_link_document_info
+            link_doc = link.GetLinkDocument()
+            self._link_types[type_id] = get_link_document_info(link_doc) if link_doc else None
+        return self._link_types[type_id]
+
+    def link_record(self, link):
+        link_name = link.Name
+        record    = {'id':              id_int(link.Id),
+                     'name':            link_name,
+                     'type_name':       link_name.split(".rvt")[0],
+                     'shared_site':     "Not Loaded",
+                     'workset':         self.resolver.workset_name(link, not_workshared=None),
+                     'pbp_north_south': "N/A",
+                     'pbp_east_west':   "N/A",
+                     'pbp_elevation':   "N/A",
+                     'pbp_angle':       "N/A"}
+
+        info = self.link_document_info(link)
+        if info:
+            record.update(info)
+            parts = link_name.split("location")
+            record['shared_site'] = parts[1] if len(parts) > 1 else "Not Loaded"
+        return record
+
+    def import_record(self, cad):
+        resolver = self.resolver
+        view_id  = cad.OwnerViewId
+        return {'id':        id_int(cad.Id),
+                'name':      resolver.cad_type_name(cad.GetTypeId()),
+                'is_linked': cad.IsLinked,
+                'view_id':   id_int(view_id) if view_id != ElementId.InvalidElementId else None,
+                'view_name': resolver.view_name(view_id, not_placed=None)}
+
+    def host_type_records(self, bucket, host_type):
+        #type: (str, HostObjAttributes) -> tuple
+        """Record of a type reported by a structure check and the records of its layers.
+        :return: (type record, [layer records]) or (None, []) if the type isn't reported."""
+        return self.structure.read(bucket, host_type)
+
+    def records_for(self, element):
+        #type: (Element) -> dict
+        """Records of a single element, by table. Empty if no check reads the element.
+        e.g. {'host_types': [record], 'layers': [layer records]}"""
+        bucket = classify(element)
+        if bucket in HOST_KINDS:
+            record, layers = self.host_type_records(bucket, element)
+            return {'host_types': [record], 'layers': layers} if record else {}
+        if bucket in RECORD_BUILDERS:
+            table, builder = RECORD_BUILDERS[bucket]
+            record = getattr(self, builder)(element)
+            return {table: [record]} if record else {}
+        return {}
+
+    # ╔═╗═╗ ╦╔╦╗╦═╗╔═╗╔═╗╔╦╗╔═╗╦═╗╔═╗
+    # ║╣ ╔╩╦╝ ║ ╠╦╝╠═╣║   ║ ║ ║╠╦╝╚═╗
+    # ╚═╝╩ ╚═ ╩ ╩╚═╩ ╩╚═╝ ╩ ╚═╝╩╚═╚═╝ EXTRACTORS (whole tables)
+    # ==================================================
+    def _extract_base_points(self):
+        from Snippets._links import read_base_points
+        return read_base_points(self.index.base_points)
+
+    def _extract_levels(self):
+        return [self.level_record(l) for l in self.index.levels]
+
+    def _extract_grids(self):
+        return [self.grid_record(g) for g in self.index.grids]
+
+    def _extract_scope_boxes(self):
+        return [self.scope_box_record(sb) for sb in self.index.scope_boxes]
+
+    def _extract_view_crops(self):
+        return [r for r in (self.view_crop_record(v) for v in self.index.view_plans) if r]
+
+    def _extract_link_instances(self):
+        return [self.link_record(link) for link in self.index.link_instances]
+
+    def _extract_link_tree(self):
+        from Snippets._links import LinkTreeWalker
+        return LinkTreeWalker(self.doc).records()
+
+    def _extract_external_refs(self):
+        from Snippets._references import read_external_references
+        return read_external_references(self.doc)
+
+    def _extract_import_instances(self):
+        return [self.import_record(cad) for cad in self.index.import_instances]
+
+    def _extract_host_types(self):
+        records, layers = [], []
+        for bucket in HOST_KINDS:
+            for record, type_layers in self.structure.read_all(bucket, self.index.get(bucket)):
+                records.append(record)
+                layers.extend(type_layers)
+
+        # Layers are read in the same pass as their types.
+        self.tables['layers'] = layers
+        return records
+
+    def _extract_layers(self):
+        self.rows('host_types')
+        return self.tables['layers']
+
+
+def _id_or_none(element_id):
+    return id_int(element_id) if element_id is not None else None
+
+
+def export_snapshot(doc, path):
+    #type: (Document, str) -> str
+    """Dump everything the checks read from a document into an offline snapshot file."""
+    return save_snapshot(LiveModelData(doc).extract_all(), path)
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""Stamp a manifest of shared parameters (Snippets._shared_params) into a folder of families.
+Families are opened in the background one at a time, changed in a single transaction, saved and closed,
+so memory stays flat however many families there are. Every family is written to a checkpoint file
+(one JSON line) as soon as it's done: a run that stops half way is resumed by running it again.
+
+e.g.
+batch   = FamilyBatch(app, SharedParameterFile(app), load_manifest(manifest_path),
+                      checkpoint=os.path.join(folder, CHECKPOINT_NAME))
+summary = batch.run(find_families(folder))         # {'Saved': 120, 'Unchanged': 3, 'Failed': 1, ...}"""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import io
+import os
+import re
+import json
+import time
+import traceback
+from collections import OrderedDict
+
+# Custom Imports
+from Snippets._shared_params import add_family_parameters, CHANGED
+from Snippets._profiling     import phase
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+CHECKPOINT_NAME = 'mbqc_family_batch.jsonl'
+BACKUP_PATTERN  = re.compile(r'\.\d{4}\.rfa$', re.IGNORECASE)     # Revit backups: 'Door.0001.rfa'
+PURGE_EVERY     = 25     # Families between two PurgeReleasedAPIObjects calls.
+
+# Status of a family
+SAVED, UNCHANGED, WOULD_CHANGE, SKIPPED, FAILED = "Saved", "Unchanged", "Would Change", "Skipped", "Failed"
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def find_families(folder, recursive=True):
+    #type: (str, bool) -> list
+    """Sorted paths of the .rfa files in a folder, without Revit backups."""
+    paths = []
+    for root, _, files in os.walk(folder):
+        paths.extend(os.path.join(root, f) for f in files
+                     if f.lower().endswith('.rfa') and not BACKUP_PATTERN.search(f))
+        if not recursive:
+            break
+    return sorted(paths)
+
+
+def read_checkpoint(path):
+    #type: (str) -> OrderedDict
+    """Family path -> last record written for it. Empty if there is no checkpoint yet.
+    A line cut off by a crash is ignored."""
+    records = OrderedDict()
+    if not path or not os.path.exists(path):
+        return records
+    with io.open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            records[record['path']] = record
+    return records
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+class FamilyBatch(object):
+    """Apply a parameter manifest to many family files.
+    :param app:          Autodesk.Revit.ApplicationServices.Application
+    :param index:        SharedParameterFile, read once for the whole batch.
+    :param manifest:     List of ParameterSpec.
+    :param checkpoint:   JSON lines file of finished families. None: no resume.
+    :param dry_run:      Open and check every family, but don't change or save anything. (Nor write the checkpoint)
+    :param retry_failed: Process families that failed in a previous run again."""
+
+    def __init__(self, app, index, manifest, checkpoint=None, dry_run=False, retry_failed=True):
+        self.app          = app
+        self.index        = index
+        self.manifest     = manifest
+        self.checkpoint   = checkpoint
+        self.dry_run      = dry_run
+        self.retry_failed = retry_failed
+        self.failures     = []     # Records of the families that failed, kept for the report.
+
+    def pending(self, paths):
+        #type: (list) -> list
+        """Paths not finished in a previous run of the same checkpoint."""
+        done = read_checkpoint(self.checkpoint)
+        return [p for p in paths if p not in done or (self.retry_failed and done[p]['status'] == FAILED)]
+
+    def run(self, paths, limit=None, progress=None):
+        #type: (list, int, callable) -> OrderedDict
+        """Process every pending family.
+        :param limit:    Stop after this many families. (e.g. to split a library over several sessions)
+        :param progress: Optional callback(done, total), e.g. to update a progress bar. Returning True stops the run.
+        :return:         Status -> number of families processed in this run."""
+        todo    = self.pending(paths)[:limit]
+        summary = OrderedDict((status, 0) for status in (SAVED, UNCHANGED, WOULD_CHANGE, SKIPPED, FAILED))
+        with phase('family_batch', count=len(todo), dry_run=self.dry_run):
+            for i, path in enumerate(todo):
+                record = self.process(path)
+                summary[record['status']] += 1
+                if record['status'] == FAILED:
+                    self.failures.append(record)
+                self._write(record)
+                if (i + 1) % PURGE_EVERY == 0:
+                    self._purge()
+                if progress and progress(i + 1, len(todo)):
+                    break
+        return summary
+
+    def process(self, path):
+        #type: (str) -> dict
+        """Open one family, apply the manifest, save and close it. Never raises: errors are in the record."""
+        start  = time.time()
+        record = {'path': path, 'status': FAILED, 'parameters': [], 'error': None}
+        if self._is_open(path):
+            record['status'] = SKIPPED
+            record['error']  = "Open in Revit"
+            return self._done(record, start)
+
+        doc = None
+        try:
+            doc = self.app.OpenDocumentFile(path)
+            if not doc.IsFamilyDocument:
+                record['status'], record['error'] = SKIPPED, "Not a family"
+                return self._done(record, start)
+
+            report  = add_family_parameters(doc, self.index, self.manifest, dry_run=self.dry_run)
+            changed = any(status in CHANGED for _, status in report)
+            record['parameters'] = [list(row) for row in report]
+            if self.dry_run:
+                record['status'] = WOULD_CHANGE if changed else UNCHANGED
+            elif changed:
+                doc.Save()
+                record['status'] = SAVED
+            else:
+                record['status'] = UNCHANGED
+        except Exception:
+            record['error'] = traceback.format_exc()
+        finally:
+            if doc is not None:
+                try:
+                    doc.Close(False)
+                except Exception:
+                    record['error'] = (record['error'] or '') + traceback.format_exc()
+        return self._done(record, start)
+
+    # >>>>>>>>>> HELPERS
+    @staticmethod
+    def _done(record, start):
+        record['elapsed'] = round(time.time() - start, 3)
+        return record
+
+    def _is_open(self, path):
+        norm = os.path.normcase(os.path.abspath(path))
+        return any(os.path.normcase(os.path.abspath(d.PathName)) == norm
+                   for d in self.app.Documents if d.PathName)
+
+    def _write(self, record):
+        if not self.checkpoint or self.dry_run:
+            return
+        with io.open(self.checkpoint, 'a', encoding='utf-8') as f:
+            f.write(u'{}\n'.format(json.dumps(record, ensure_ascii=False)))
+
+    def _purge(self):
+        """Let Revit free the API objects of the closed families."""
+        purge = getattr(self.app, 'PurgeReleasedAPIObjects', None)
+        if purge:
+            purge()
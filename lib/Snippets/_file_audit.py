@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""Filesystem audit of the external files of a model (see the 'external_refs' table).
+Every path is stat-ed on a pool of threads, so a slow file server costs the slowest file
+instead of the sum of all of them. A file that doesn't answer within the timeout is reported
+as such and the audit moves on. Pure Python: threads work the same in IronPython and CPython.
+
+e.g.
+result = audit_external_files(get_model_data(doc))      # QCResult, Lookup selects the link type"""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import os
+import time
+import errno
+import ntpath
+import datetime
+import threading
+
+try:
+    from Queue import Queue, Empty      # IronPython 2.7
+except ImportError:
+    from queue import Queue, Empty      # CPython 3
+
+# Custom Imports
+from Snippets._checks    import QCResult
+from Snippets._profiling import phase
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+WORKERS       = 16      # Threads stat-ing files at the same time.
+FILE_TIMEOUT  = 10.0    # Seconds a single file may take before it is reported as "Timed Out".
+LARGE_FILE_MB = 200     # Files at least this big are reported as "Large".
+
+# Status of a file, most important first (the report is sorted on it).
+MISSING, TIMED_OUT, ERROR, NEWER, LARGE, OK, NOT_ON_DISK = ("Missing", "Timed Out", "Error", "Newer than Model",
+                                                           "Large", "OK", "Not a File Path")
+STATUS_ORDER = [MISSING, TIMED_OUT, ERROR, NEWER, LARGE, OK, NOT_ON_DISK]
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+class FileStat(object):
+    """Result of stat-ing one path. size in bytes, modified as a POSIX timestamp."""
+    __slots__ = ('path', 'exists', 'size', 'modified', 'error', 'timed_out')
+
+    def __init__(self, path, exists=False, size=None, modified=None, error=None, timed_out=False):
+        self.path      = path
+        self.exists    = exists
+        self.size      = size
+        self.modified  = modified
+        self.error     = error
+        self.timed_out = timed_out
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def stat_file(path, stat=os.stat):
+    #type: (str, callable) -> FileStat
+    try:
+        st = stat(path)
+        return FileStat(path, True, st.st_size, st.st_mtime)
+    except (IOError, OSError) as e:
+        if getattr(e, 'errno', None) in (errno.ENOENT, errno.ENOTDIR):
+            return FileStat(path)
+        return FileStat(path, error=str(e))
+
+
+def stat_files(paths, workers=WORKERS, timeout=FILE_TIMEOUT, stat=os.stat):
+    #type: (list, int, float, callable) -> dict
+    """Stat many paths concurrently.
+    :param paths:   File paths. Duplicates are stat-ed once.
+    :param workers: Number of threads.
+    :param timeout: Seconds per file. A file that takes longer is returned as timed_out. Its thread is
+                    left behind (a blocked stat can't be cancelled) and a new one takes its place.
+    :param stat:    Function used to stat a path. (Benchmarks pass a slowed down os.stat)
+    :return:        {path: FileStat}"""
+    paths = list(dict.fromkeys(paths))
+    if not paths:
+        return {}
+
+    tasks, done = Queue(), Queue()
+    for path in paths:
+        tasks.put(path)
+    started = {}            # path -> time its stat started. Written by workers, read by this thread.
+    lock    = threading.Lock()
+
+    def worker():
+        while True:
+            try:
+                path = tasks.get_nowait()
+            except Empty:
+                return
+            with lock:
+                started[path] = time.time()
+            done.put(stat_file(path, stat))
+
+    def start_worker():
+        thread = threading.Thread(target=worker)
+        thread.daemon = True     # A thread stuck on a dead share must not keep Revit/Python from closing.
+        thread.start()
+
+    for _ in range(min(workers, len(paths))):
+        start_worker()
+
+    results = {}
+    while len(results) < len(paths):
+        try:
+            file_stat = done.get(timeout=0.05)
+            if file_stat.path not in results:
+                results[file_stat.path] = file_stat
+        except Empty:
+            pass
+        now = time.time()
+        with lock:
+            running = list(started.items())
+        for path, start in running:
+            if path not in results and now - start > timeout:
+                results[path] = FileStat(path, timed_out=True)
+                start_worker()
+    return results
+
+
+def resolve_path(record, model_folder):
+    """Absolute file path of an 'external_refs' record, or None if it isn't on a file system (server, cloud)."""
+    path = record.get('absolute_path') or record['path']
+    if not path or '://' in path:
+        return None
+    if record['path_type'] == 'Relative' and not ntpath.isabs(path) and model_folder:
+        path = ntpath.join(model_folder, path)
+    return path
+
+
+def file_status(file_stat, model_modified):
+    if file_stat is None:
+        return NOT_ON_DISK
+    if file_stat.timed_out:
+        return TIMED_OUT
+    if file_stat.error:
+        return ERROR
+    if not file_stat.exists:
+        return MISSING
+    if model_modified is not None and file_stat.modified > model_modified:
+        return NEWER
+    if file_stat.size >= LARGE_FILE_MB * 1048576:
+        return LARGE
+    return OK
+
+
+def _format_time(timestamp):
+    return datetime.datetime.fromtimestamp(timestamp).strftime('%d.%m.%Y %H:%M') if timestamp else "-"
+
+
+def audit_external_files(data, kinds=('RevitLink', 'CADLink'), workers=WORKERS, timeout=FILE_TIMEOUT):
+    #type: (ModelData, tuple, int, float) -> QCResult
+    """Check that the source files of the model's links exist, how big they are and whether they changed
+    after the model was last saved.
+    Revit doesn't tell when a model or its links were loaded, so the model file's last save stands in for it:
+    a model is opened after its last save, so every link changed since the model was loaded is reported,
+    as well as links changed between that save and the model being opened. (Reload them to be sure)
+    :param data:  ModelData with the 'external_refs' table. meta['path'] is the model file.
+    :param kinds: Reference types to audit. None for every external file."""
+    refs       = [r for r in data.rows('external_refs') if kinds is None or r['kind'] in kinds]
+    model_path = data.meta.get('path')
+    folder     = ntpath.dirname(model_path) if model_path else None
+
+    # The model file goes through the pool too: it can sit on the same slow share as its links.
+    paths = dict((r['id'], resolve_path(r, folder)) for r in refs)
+    with phase('file_audit', count=len(refs)):
+        stats = stat_files(([model_path] if model_path else []) + [p for p in paths.values() if p], workers, timeout)
+    model_stat = stats.get(model_path) if model_path else None
+    model_time = model_stat.modified if model_stat and model_stat.exists else None
+
+    rows = []
+    for r in refs:
+        path      = paths[r['id']]
+        file_stat = stats.get(path) if path else None
+        size      = file_stat.size if file_stat and file_stat.size is not None else None
+        rows.append([r['name'], r['kind'], file_status(file_stat, model_time),
+                     round(size / 1048576.0, 2) if size is not None else "-",
+                     _format_time(file_stat.modified if file_stat else None), path or r['path'] or "No Path", r['id']])
+    rows.sort(key=lambda row: (STATUS_ORDER.index(row[2]), row[1], row[0]))
+
+    problems = len([row for row in rows if row[2] not in (OK, NOT_ON_DISK)])
+    return QCResult("Link Source Files ({} files, {} to review)".format(len(rows), problems),
+                    ["File Name", "Reference Type", "Status", "Size (MB)", "Modified", "Path", "Look up"], rows,
+                    empty_message="There are no linked files in the project", link_column=6)
@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+"""Group audit: group types, their instances and members, read in one pass over the Group instances.
+Membership comes from Group.GetMemberIds, so no element is asked for its GroupId: which group an element
+belongs to (and the group that group is nested in) is a dictionary lookup, for one element or fifty thousand.
+
+Ungrouped copies are elements that repeat the layout of a group without being in one, e.g. a group that was
+ungrouped and copied. They are found with a hash of the ungrouped elements by (type, position), see find_copies.
+
+e.g.
+index   = GroupIndex(doc)
+index.group_of(element_id, top=True)         # outermost group of an element, or None
+index.members([group_id], nested=True)       # every member id, members of nested groups included
+copies  = find_copies(doc, index)            # [GroupCopy]"""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import math
+from collections import OrderedDict
+
+from Autodesk.Revit.DB import (FilteredElementCollector, ElementFilter, ElementCategoryFilter, LogicalOrFilter,
+                               ElementId, Group)
+
+# .NET Imports
+import clr
+clr.AddReference('System')
+from System.Collections.Generic import List
+
+# Custom Imports
+from Snippets._scanner   import id_int
+from Snippets._checks    import QCResult
+from Snippets._spatial   import TOLERANCE         # Positions closer than this are the same position.
+from Snippets._profiling import phase
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+MIN_MEMBERS = 2            # Group types with fewer placed members are not searched for copies.
+
+_NEIGHBOURS = [(dx, dy, dz) for dx in (0, -1, 1) for dy in (0, -1, 1) for dz in (0, -1, 1)]
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+class GroupRecord(object):
+    """One group instance."""
+    __slots__ = ('id', 'name', 'type_id', 'parent_id', 'member_ids', 'nested_ids', 'origin')
+
+    def __init__(self, group_id, name, type_id, member_ids, origin):
+        self.id         = group_id
+        self.name       = name
+        self.type_id    = type_id
+        self.member_ids = member_ids     # Direct members, nested groups included
+        self.nested_ids = []             # Direct members that are groups
+        self.parent_id  = None           # Group this one is nested in
+        self.origin     = origin         # (x, y, z) of the group location, or None
+
+
+class GroupTypeRecord(object):
+    """One group type and its placed instances."""
+    __slots__ = ('id', 'name', 'instance_ids')
+
+    def __init__(self, type_id, name):
+        self.id           = type_id
+        self.name         = name
+        self.instance_ids = []
+
+
+class GroupCopy(object):
+    """Ungrouped elements that repeat the members of a group type."""
+    __slots__ = ('type_id', 'element_ids')
+
+    def __init__(self, type_id, element_ids):
+        self.type_id     = type_id
+        self.element_ids = element_ids   # In the member order of the group it matches, anchor first
+
+
+class GroupIndex(object):
+    """Group type -> instances -> members of a document, from a single pass over its groups.
+    Model and detail groups are both included."""
+
+    def __init__(self, doc):
+        self.doc       = doc
+        self.groups    = OrderedDict()   # group id      -> GroupRecord
+        self.types     = OrderedDict()   # group type id -> GroupTypeRecord
+        self.parent_of = {}              # member id     -> id of the group it's a direct member of
+
+        with phase('groups.index') as p:
+            for group in FilteredElementCollector(doc).OfClass(Group):
+                group_type = group.GroupType
+                record     = GroupRecord(id_int(group.Id), group.Name, id_int(group_type.Id),
+                                         [id_int(m) for m in group.GetMemberIds()], location_point(group))
+                self.groups[record.id] = record
+                for member_id in record.member_ids:
+                    self.parent_of[member_id] = record.id
+
+                type_record = self.types.get(record.type_id)
+                if type_record is None:
+                    type_record = self.types[record.type_id] = GroupTypeRecord(record.type_id, group_type.Name)
+                type_record.instance_ids.append(record.id)
+
+            for record in self.groups.values():
+                record.parent_id  = self.parent_of.get(record.id)
+                record.nested_ids = [m for m in record.member_ids if m in self.groups]
+            p.count = len(self.parent_of)
+
+    # >>>>>>>>>> MEMBERSHIP
+    def group_of(self, element_id, top=False):
+        #type: (int, bool) -> int
+        """Id of the group an element is a member of, or None.
+        :param top: The outermost group instead of the direct one, for members of nested groups."""
+        group_id = self.parent_of.get(element_id)
+        while top and group_id is not None and self.groups[group_id].parent_id is not None:
+            group_id = self.groups[group_id].parent_id
+        return group_id
+
+    def groups_of(self, element_ids, top=True):
+        #type: (list, bool) -> list
+        """Ids of the groups of many elements, in order, without repeats. A selected group counts as itself."""
+        found = OrderedDict()
+        for element_id in element_ids:
+            group_id = self.group_of(element_id, top)
+            if group_id is None and element_id in self.groups:
+                group_id = element_id
+            if group_id is not None:
+                found[group_id] = None
+        return list(found)
+
+    def members(self, group_ids, nested=True):
+        #type: (list, bool) -> list
+        """Member ids of groups, without repeats.
+        :param nested: Also the members of nested groups (and of theirs)."""
+        found = OrderedDict()
+        todo  = list(reversed(group_ids))
+        while todo:
+            for member_id in self.groups[todo.pop()].member_ids:
+                if member_id in found:
+                    continue
+                found[member_id] = None
+                if nested and member_id in self.groups:
+                    todo.append(member_id)
+        return list(found)
+
+    def total_members(self, group_id):
+        #type: (int) -> int
+        """Members of a group, nested groups replaced by their own members."""
+        record = self.groups[group_id]
+        return len(record.member_ids) - len(record.nested_ids) + sum(self.total_members(n) for n in record.nested_ids)
+
+    def __len__(self):
+        return len(self.groups)
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def location_point(element):
+    """(x, y, z) of an element's location point, or the middle of its location curve. None if it has neither."""
+    location = element.Location
+    point    = getattr(location, 'Point', None)
+    if point is None:
+        curve = getattr(location, 'Curve', None)
+        if curve is None:
+            return None
+        point = curve.Evaluate(0.5, True)
+    return point.X, point.Y, point.Z
+
+
+def _cell(type_id, point):
+    return (type_id, int(math.floor(point[0] / TOLERANCE)), int(math.floor(point[1] / TOLERANCE)),
+            int(math.floor(point[2] / TOLERANCE)))
+
+
+def _find_near(cells, type_id, point, skip):
+    #type: (dict, int, tuple, callable) -> int
+    """Id of an element of a type within TOLERANCE of a point, or None.
+    Cells are TOLERANCE wide, so a close enough element is in the point's cell or one of the 26 around it."""
+    (_, x, y, z), limit = _cell(type_id, point), TOLERANCE * TOLERANCE
+    for dx, dy, dz in _NEIGHBOURS:
+        for element_id, other in cells.get((type_id, x + dx, y + dy, z + dz), ()):
+            if not skip(element_id) and sum((a - b) ** 2 for a, b in zip(point, other)) <= limit:
+                return element_id
+    return None
+
+
+def _signature(doc, index, type_record):
+    """[(member type id, position relative to the group origin, category id)] of the first instance
+    of a group type whose members all have a location. None if there is no such instance."""
+    for group_id in type_record.instance_ids:
+        record = index.groups[group_id]
+        if record.origin is None or len(record.member_ids) < MIN_MEMBERS:
+            continue
+        signature = []
+        for member_id in record.member_ids:
+            member = doc.GetElement(ElementId(member_id))
+            point  = location_point(member) if member is not None and member.Category is not None else None
+            if point is None:
+                break
+            signature.append((id_int(member.GetTypeId()), tuple(p - o for p, o in zip(point, record.origin)),
+                              id_int(member.Category.Id)))
+        else:
+            return signature
+    return None
+
+
+def find_copies(doc, index, type_ids=None):
+    #type: (Document, GroupIndex, list) -> list
+    """Ungrouped elements laid out like the members of a group type: same types at the same relative positions.
+    Every ungrouped element of the member categories is hashed once by (type, position). Each group type is then
+    matched from its rarest member type: the other members are looked up at the same offset, not compared in pairs.
+    Only copies moved (not rotated) from the first instance of the group type are found.
+    :param type_ids: Group type ids to look for. All by default.
+    :return:         [GroupCopy], each element in at most one copy."""
+    signatures = OrderedDict()
+    for type_record in index.types.values():
+        if type_ids is None or type_record.id in type_ids:
+            signature = _signature(doc, index, type_record)
+            if signature:
+                signatures[type_record.id] = signature
+    if not signatures:
+        return []
+
+    with phase('groups.copies', types=len(signatures)) as p:
+        # Ungrouped candidates, hashed by (type id, position cell).
+        member_types = set(member[0] for signature in signatures.values() for member in signature)
+        categories   = set(member[2] for signature in signatures.values() for member in signature)
+        filters      = List[ElementFilter]()
+        for category_id in categories:
+            filters.Add(ElementCategoryFilter(ElementId(category_id)))
+
+        cells   = {}     # (type id, x, y, z) -> [(element id, point)]
+        by_type = {}     # type id -> [(element id, point)]
+        for element in FilteredElementCollector(doc).WherePasses(LogicalOrFilter(filters)).WhereElementIsNotElementType():
+            element_id = id_int(element.Id)
+            if element_id in index.parent_of:
+                continue
+            type_id = id_int(element.GetTypeId())
+            if type_id not in member_types:
+                continue
+            point = location_point(element)
+            if point is None:
+                continue
+            cells.setdefault(_cell(type_id, point), []).append((element_id, point))
+            by_type.setdefault(type_id, []).append((element_id, point))
+        p.count = sum(len(v) for v in by_type.values())
+
+        used   = set()
+        copies = []
+        for type_id, signature in signatures.items():
+            anchor = min(signature, key=lambda member: len(by_type.get(member[0], ())))
+            others = [member for member in signature if member is not anchor]
+            for element_id, point in by_type.get(anchor[0], ()):
+                if element_id in used:
+                    continue
+                offset = tuple(c - r for c, r in zip(point, anchor[1]))
+                found  = [element_id]
+                for member_type, relative, _ in others:
+                    match = _find_near(cells, member_type, tuple(r + o for r, o in zip(relative, offset)),
+                                       lambda e: e in used or e in found)
+                    if match is None:
+                        break
+                    found.append(match)
+                else:
+                    used.update(found)
+                    copies.append(GroupCopy(type_id, found))
+    return copies
+
+
+#>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> REPORTS
+def group_types_result(index, group_ids=None):
+    #type: (GroupIndex, list) -> QCResult
+    """One row per group type: instances, members per instance and in total.
+    :param group_ids: Only count these group instances. All by default."""
+    wanted = set(group_ids) if group_ids is not None else None
+    rows   = []
+    for type_record in index.types.values():
+        instances = [i for i in type_record.instance_ids if wanted is None or i in wanted]
+        if not instances:
+            continue
+        first = index.groups[instances[0]]
+        rows.append([type_record.name, len(instances), len(first.member_ids), len(first.nested_ids),
+                     sum(index.total_members(i) for i in instances)])
+    return QCResult("Group Types",
+                    ["Group Type", "Instances", "Members", "Nested Groups", "Total Members"],
+                    rows, "There are no Groups.")
+
+
+def group_instances_result(index, group_ids=None):
+    #type: (GroupIndex, list) -> QCResult
+    """One row per group instance, with the group it's nested in. Linked to the group."""
+    rows = []
+    for group_id in (group_ids if group_ids is not None else index.groups):
+        record = index.groups[group_id]
+        parent = index.groups[record.parent_id].name if record.parent_id is not None else "-"
+        rows.append([record.name, len(record.member_ids), len(record.nested_ids), index.total_members(group_id),
+                     parent, record.id])
+    return QCResult("Group Instances",
+                    ["Group", "Members", "Nested Groups", "Total Members", "Nested In", "Group Id"],
+                    rows, "There are no Groups.", link_column=5)
+
+
+def copies_result(index, copies):
+    #type: (GroupIndex, list) -> QCResult
+    """One row per ungrouped copy, linked to its first element."""
+    rows = [[index.types[c.type_id].name, len(c.element_ids), c.element_ids[0]] for c in copies]
+    return QCResult("Ungrouped Copies of Groups",
+                    ["Matches Group Type", "Elements", "First Element"],
+                    rows, "No ungrouped copies of Groups were found.", link_column=2)
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+# Incremental QC: the extracted tables of a document are kept between button clicks
+# (pyRevit rocket mode keeps lib modules loaded) and only the elements reported by
+# DocumentChanged since the previous run are read again.
+from Autodesk.Revit.DB import Material, View, CADLinkType, RevitLinkType
+
+# Custom Imports
+from Snippets._events   import document_key, subscribe, add_change_listener, add_closing_listener
+from Snippets._extract  import LiveModelData, id_int
+from Snippets._cache    import LRUCache
+from Snippets._scanner  import classify
+from Snippets._snapshot  import TABLES
+from Snippets._profiling import phase
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+# Above this many changed elements it is faster to extract everything again.
+FULL_REBUILD_THRESHOLD = 5000
+
+# Column holding the element id of each record, if it isn't 'id'.
+ID_COLUMNS = {'layers': 'type_id'}
+
+# Elements that are not stored in any table but are read while building other records.
+# A change to one of them makes the listed tables stale, so they are extracted again.
+DEPENDENCIES = [(Material,      ['host_types', 'layers']),                          # layer and material names
+                (View,          ['import_instances']),                              # owner view names
+                (CADLinkType,   ['import_instances', 'external_refs']),             # CAD file names and paths
+                (RevitLinkType, ['link_instances', 'link_tree', 'external_refs'])]  # link type, path, load state
+
+# Buckets read by other records: scope box name of levels, grids and views, link instances of the link tree
+# and of the "Monitored By" names of levels and grids.
+BUCKET_DEPENDENCIES = {'scope_boxes':    ['levels', 'grids', 'view_crops'],
+                       'link_instances': ['link_tree', 'levels', 'grids']}
+
+# Open documents whose model data is kept. The least recently checked one is dropped first.
+MAX_DOCUMENTS = 8
+
+_models = LRUCache(MAX_DOCUMENTS)   # document key -> IncrementalModelData
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+class ChangeSet(object):
+    """Element ids added, modified and deleted since the last refresh."""
+
+    def __init__(self):
+        self.changed = {}      # int -> ElementId  (added or modified)
+        self.deleted = set()   # int
+
+    def record(self, args):
+        #type: (DocumentChangedEventArgs) -> None
+        for elem_id in args.GetAddedElementIds():
+            self.changed[id_int(elem_id)] = elem_id
+        for elem_id in args.GetModifiedElementIds():
+            self.changed[id_int(elem_id)] = elem_id
+        for elem_id in args.GetDeletedElementIds():
+            key = id_int(elem_id)
+            self.changed.pop(key, None)
+            self.deleted.add(key)
+
+    def __len__(self):
+        return len(self.changed) + len(self.deleted)
+
+
+class IncrementalModelData(LiveModelData):
+    """LiveModelData that survives between runs and is patched with the document changes.
+    Tables that were already extracted get the records of changed elements replaced,
+    tables that weren't are extracted on first use as usual.
+    Check results are reused while none of the tables they read has changed.
+
+    e.g.
+    data   = get_model_data(doc)
+    result = run_check('wall_structure', data)      # 2nd click: only edited wall types are read"""
+
+    def __init__(self, doc):
+        LiveModelData.__init__(self, doc)
+        self.changes   = ChangeSet()
+        self._versions = {}     # table      -> number of times it changed
+        self._results  = {}     # check name -> (table versions, QCResult)
+
+    def prepare(self, tables=None):
+        """Scan the model only for the tables that haven't been extracted yet."""
+        LiveModelData.prepare(self, [table for table in (TABLES if tables is None else tables)
+                                     if table not in self.tables])
+
+    # >>>>>>>>>> RESULT CACHE
+    def _table_versions(self, check):
+        return tuple(self.table_version(table) for table in check.tables)
+
+    def get_cached_result(self, check):
+        if not check.tables or check.name not in self._results:
+            return None
+        versions, result = self._results[check.name]
+        return result if versions == self._table_versions(check) else None
+
+    def store_result(self, check, result):
+        if check.tables:
+            self._results[check.name] = (self._table_versions(check), result)
+
+    def table_version(self, table):
+        return self._versions.get(table, 0)
+
+    def _touch(self, table):
+        self._versions[table] = self._versions.get(table, 0) + 1
+
+    # >>>>>>>>>> REFRESH
+    def refresh(self, doc):
+        """Apply the changes recorded since the previous run.
+        :param doc: Current Document. (Python wrappers change between clicks)
+        :return:    Number of changed elements that were applied."""
+        self.doc     = doc
+        changes      = self.changes
+        self.changes = ChangeSet()
+        if not changes:
+            return 0
+
+        # The index, material names and link types no longer match the document. Tables extracted later scan again.
+        self._index      = None
+        self._structure  = None
+        self._link_types = {}
+
+        with phase('refresh', count=len(changes)):
+            elements = [el for el in (doc.GetElement(elem_id) for elem_id in changes.changed.values()) if el]
+            self._invalidate(self._stale_tables(elements))
+            self._remove_records(set(changes.changed) | changes.deleted)
+            self._add_records(elements)
+        return len(changes)
+
+    def _stale_tables(self, elements):
+        """Tables to extract again because an element they depend on has changed."""
+        stale = set()
+        for el in elements:
+            for cls, tables in DEPENDENCIES:
+                if isinstance(el, cls):
+                    stale.update(tables)
+            stale.update(BUCKET_DEPENDENCIES.get(classify(el), []))
+        return stale
+
+    def _invalidate(self, tables):
+        for table in tables:
+            if self.tables.pop(table, None) is not None:
+                self._touch(table)
+
+    def _remove_records(self, ids):
+        for table, records in list(self.tables.items()):
+            column = ID_COLUMNS.get(table, 'id')
+            kept   = [r for r in records if r[column] not in ids]
+            if len(kept) != len(records):
+                self.tables[table] = kept
+                self._touch(table)
+
+    def _add_records(self, elements):
+        for el in elements:
+            for table, records in self.records_for(el).items():
+                if table in self.tables:
+                    self.tables[table].extend(records)
+                    self._touch(table)
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def get_model_data(doc, rebuild=False):
+    #type: (Document, bool) -> IncrementalModelData
+    """Model data of a document, kept up to date between runs.
+    :param doc:     Document to check.
+    :param rebuild: Drop everything cached for the document and extract it again.
+    :return:        IncrementalModelData with the changes since the previous run applied."""
+    subscribe(doc.Application)
+
+    key  = document_key(doc)
+    data = _models.get(key)
+    if data is not None and not rebuild and len(data.changes) <= FULL_REBUILD_THRESHOLD:
+        data.refresh(doc)
+        return data
+
+    data = _models[key] = IncrementalModelData(doc)
+    return data
+
+
+def _record_changes(doc, args):
+    """DocumentChanged listener. Only ids are stored, elements are read on the next run."""
+    data = _models.get(document_key(doc))
+    if data is not None:
+        data.changes.record(args)
+
+
+def _forget_document(doc_key):
+    _models.pop(doc_key, None)
+
+
+add_change_listener(_record_changes)
+add_closing_listener(_forget_document)
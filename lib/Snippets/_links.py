@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+# Linked Revit models: values read from a link document ('link_instances' table)
+# and the tree of nested links ('link_tree' table of Snippets._snapshot).
+import math
+from collections import OrderedDict
+
+from Autodesk.Revit.DB import (FilteredElementCollector, BuiltInCategory, BuiltInParameter, ElementClassFilter,
+                               RevitLinkInstance, RevitLinkType)
+
+# Custom Imports
+from Snippets._scanner  import id_int
+from Snippets._events   import document_key, add_change_listener
+from Snippets._cache    import document_cache
+from Snippets._resolver import get_resolver
+from Snippets._params   import read_parameters, table_rows
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+# Base point column -> built-in parameter. (Display names differ between host and link: "Elev" / "Elevation")
+BASE_POINT_PARAMS = OrderedDict([('north_south', BuiltInParameter.BASEPOINT_NORTHSOUTH_PARAM),
+                                 ('east_west',   BuiltInParameter.BASEPOINT_EASTWEST_PARAM),
+                                 ('elevation',   BuiltInParameter.BASEPOINT_ELEVATION_PARAM),
+                                 ('angle',       BuiltInParameter.BASEPOINT_ANGLETON_PARAM)])
+
+PBP_NOT_LOADED = dict(('pbp_' + column, "N/A") for column in BASE_POINT_PARAMS)
+
+# Nested links deeper than this are not followed. (Revit itself only shows attached links this deep in practice)
+MAX_DEPTH = 10
+
+_link_documents = document_cache('link_documents')             # link document -> link_document_info()
+_link_children  = document_cache('link_children', max_size=256) # document -> [LinkEntry] of its own links
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def read_base_points(base_points):
+    #type: (list) -> list
+    """Records of base points as shown in their properties, read in one pass.
+    e.g. [{'id': 101, 'north_south': '12.500', ...}]"""
+    return table_rows(read_parameters(base_points, list(BASE_POINT_PARAMS.items())))
+
+
+def base_point_values(bp):
+    #type: (Element) -> dict
+    """Values of a Project Base Point as shown in its properties. e.g. {'north_south': '12.500', ...}"""
+    values = read_base_points([bp])[0]
+    del values['id']
+    return values
+
+
+def link_document_info(link_doc):
+    #type: (Document) -> dict
+    """Columns of 'link_instances' that only depend on the linked document: type_name and pbp_*.
+    Shared by every instance of the link."""
+    info = {'type_name': link_doc.Title}
+    project_base_points = FilteredElementCollector(link_doc).OfCategory(BuiltInCategory.OST_ProjectBasePoint)\
+                                                           .WhereElementIsNotElementType().ToElements()
+    if project_base_points:
+        for column, value in base_point_values(project_base_points[0]).items():
+            info['pbp_' + column] = value or "Not Set"
+    return info
+
+
+def get_link_document_info(link_doc):
+    """link_document_info() kept across clicks per link document."""
+    return _link_documents.get(link_doc, lambda: link_document_info(link_doc))
+
+
+def read_links(doc):
+    #type: (Document) -> list
+    """First-level link instances placed in a document (host or linked). See get_links."""
+    resolver = get_resolver(doc)
+    return [LinkEntry(link, resolver) for link in FilteredElementCollector(doc).OfClass(RevitLinkInstance)]
+
+
+def get_links(doc):
+    #type: (Document) -> list
+    """read_links() kept across clicks per document state. Link documents shared by several
+    parents (or placed many times) are only read once."""
+    return _link_children.get(doc, lambda: read_links(doc))
+
+
+def rotation_degrees(transform):
+    """Rotation of a transform about Z, in degrees."""
+    return math.degrees(math.atan2(transform.BasisX.Y, transform.BasisX.X))
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+class LinkEntry(object):
+    """A RevitLinkInstance as seen from the document it's placed in. Plain values plus its link document."""
+    __slots__ = ('id', 'name', 'workset', 'link_doc', 'transform')
+
+    def __init__(self, link, resolver):
+        self.id        = id_int(link.Id)
+        self.name      = link.Name
+        self.workset   = resolver.workset_name(link, not_workshared=None)
+        self.link_doc  = link.GetLinkDocument()
+        self.transform = link.GetTotalTransform()
+
+    @property
+    def type_name(self):
+        if self.link_doc:
+            return self.link_doc.Title
+        return self.name.split(".rvt")[0]
+
+
+class LinkTreeWalker(object):
+    """Walk the links of a document down through nested links.
+    The links of each unique document are read once (get_links), however many times it is placed
+    or nested, and transforms are composed along each path to get host coordinates.
+
+    e.g.
+    walker  = LinkTreeWalker(doc)
+    records = walker.records()          # 'link_tree' table
+    walker.documents                    # number of unique documents whose links were read"""
+
+    def __init__(self, doc, max_depth=MAX_DEPTH):
+        self.doc       = doc
+        self.max_depth = max_depth
+        self._links    = {}     # document key -> [LinkEntry], memo of this walk
+
+    @property
+    def documents(self):
+        return len(self._links)
+
+    def links(self, doc):
+        key = document_key(doc)
+        if key not in self._links:
+            self._links[key] = get_links(doc)
+        return self._links[key]
+
+    def walk(self):
+        """Yield (root id, path of type names, parent name, LinkEntry, host transform) depth first.
+        A document already on the path isn't entered again (circular attachments)."""
+        stack = [(entry, entry.id, [], [document_key(self.doc)], None, self.doc.Title)
+                 for entry in reversed(self.links(self.doc))]
+        while stack:
+            entry, root_id, path, doc_keys, parent_transform, parent_name = stack.pop()
+            transform = entry.transform if parent_transform is None else parent_transform.Multiply(entry.transform)
+            node_path = path + [entry.type_name]
+            yield root_id, node_path, parent_name, entry, transform
+
+            link_doc = entry.link_doc
+            if not link_doc or len(node_path) >= self.max_depth:
+                continue
+            key = document_key(link_doc)
+            if key in doc_keys:
+                continue
+            for child in reversed(self.links(link_doc)):
+                stack.append((child, root_id, node_path, doc_keys + [key], transform, entry.type_name))
+
+    def records(self):
+        #type: () -> list
+        """Records of the 'link_tree' table, in tree order."""
+        records = []
+        for root_id, path, parent_name, entry, transform in self.walk():
+            origin = transform.Origin
+            record = {'id':        root_id,
+                      'path':      path,
+                      'depth':     len(path) - 1,
+                      'name':      entry.name,
+                      'type_name': entry.type_name,
+                      'parent':    parent_name,
+                      'document':  document_key(entry.link_doc) if entry.link_doc else None,
+                      'workset':   entry.workset,
+                      'x':         origin.X,
+                      'y':         origin.Y,
+                      'z':         origin.Z,
+                      'rotation':  rotation_degrees(transform)}
+            record.update(get_link_document_info(entry.link_doc) if entry.link_doc else PBP_NOT_LOADED)
+            records.append(record)
+        return records
+
+
+def _forget_link_documents(doc, args):
+    """DocumentChanged listener. A linked document never raises DocumentChanged in the host, so what was
+    read from link documents is dropped when a link type of the host is added, reloaded, unloaded or moved."""
+    link_types = ElementClassFilter(RevitLinkType)
+    if args.GetModifiedElementIds(link_types).Count or args.GetAddedElementIds(link_types).Count:
+        _link_documents.clear()
+        _link_children.clear()
+
+add_change_listener(_forget_link_documents)
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+# Paged tables for the pyRevit output window.
+# output.print_table writes the whole table into the page at once, which freezes the
+# window on tens of thousands of rows. Here the rows are streamed in chunks as compact
+# JSON and only the current page is turned into HTML, so the page size bounds the DOM.
+# Element links are deferred: cells only carry the element id and a single click handler
+# builds the pyRevit select url, instead of one output.linkify per row.
+# The script runs in the output window (IE engine): keep it ES5.
+import json
+import itertools
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+PAGE_SIZE  = 200       # Rows rendered at a time.
+CHUNK_SIZE = 2000      # Rows sent to the window per injected script.
+MAX_ROWS   = 20000     # Rows kept in the window per table, all held in its memory. The rest is dropped with a note.
+
+# pyRevit discards select urls whose element part is 2000 characters or longer (pyrevit.output.linkmaker).
+SELECT_URL     = 'revit://outputhelpers?&command=select&'
+MAX_URL_LENGTH = 2000
+
+PAGER_CSS = """
+.mbqc-bar {margin: 4px 0;}
+.mbqc-bar input {width: 200px; margin-right: 8px;}
+.mbqc-bar button {min-width: 28px;}
+.mbqc-info {margin: 0 8px;}
+"""
+
+PAGER_JS = """
+if (!window.MBQC) { window.MBQC = {
+    tables: {},
+    select: function (ids) {
+        var query = [], length = 0, i, part;
+        for (i = 0; i < ids.length; i++) {
+            part = 'element[]=' + ids[i];
+            if (length + part.length + 1 >= %(max_url)d) {
+                alert('Only the first ' + i + ' of ' + ids.length + ' elements can be selected at once. Filter the table to select the rest.');
+                break;
+            }
+            query.push(part);
+            length += part.length + 1;
+        }
+        if (query.length) { window.location.href = '%(select_url)s' + query.join('&') + '&show=false'; }
+    },
+    click: function (e) {
+        var target = (e || window.event).target || window.event.srcElement;
+        if (target && /\bmbqc-id\b/.test(target.className)) { MBQC.select([target.innerText || target.textContent]); return false; }
+    },
+    link: function (id) { return '<a class="elementlink mbqc-id" href="#">' + id + '</a>'; },
+    create: function (id, head, pageSize, linkColumn) {
+        this.tables[id] = {head: head, rows: [], texts: null, view: null, page: 0, pageSize: pageSize, timer: null,
+                           link: linkColumn};
+    },
+    selectTable: function (id) {
+        var t = this.tables[id], n = this.visible(t), ids = [], i;
+        if (t.link === null) { return; }
+        for (i = 0; i < n; i++) { ids.push(t.rows[t.view === null ? i : t.view[i]][t.link]); }
+        this.select(ids);
+    },
+    add: function (id, rows) {
+        var t = this.tables[id];
+        Array.prototype.push.apply(t.rows, rows);
+        t.texts = null;
+        if (t.view === null && t.rows.length - rows.length < (t.page + 1) * t.pageSize) { this.render(id); }
+        else { this.info(id); }
+    },
+    visible: function (t) { return t.view === null ? t.rows.length : t.view.length; },
+    info: function (id) {
+        var t = this.tables[id], n = this.visible(t), pages = Math.max(1, Math.ceil(n / t.pageSize));
+        document.getElementById(id + '-info').innerHTML =
+            'Page ' + (t.page + 1) + ' / ' + pages + ' (' + n + (t.view === null ? '' : ' of ' + t.rows.length) + ' rows)';
+    },
+    render: function (id) {
+        var t = this.tables[id], start = t.page * t.pageSize, end = Math.min(start + t.pageSize, this.visible(t));
+        var html = [t.head], i, c, row, cells;
+        for (i = start; i < end; i++) {
+            row   = t.rows[t.view === null ? i : t.view[i]];
+            cells = [];
+            for (c = 0; c < row.length; c++) { cells.push(c === t.link ? this.link(row[c]) : row[c]); }
+            html.push('<tr><td>' + cells.join('</td><td>') + '</td></tr>');
+        }
+        html.push('</tbody></table>');
+        document.getElementById(id + '-rows').innerHTML = html.join('');
+        this.info(id);
+    },
+    page: function (id, step) {
+        var t = this.tables[id], last = Math.max(0, Math.ceil(this.visible(t) / t.pageSize) - 1);
+        t.page = Math.min(Math.max(t.page + step, 0), last);
+        this.render(id);
+    },
+    filter: function (id, text) {
+        var self = this, t = this.tables[id];
+        clearTimeout(t.timer);
+        t.timer = setTimeout(function () { self.applyFilter(id, text); }, 250);
+    },
+    applyFilter: function (id, text) {
+        var t = this.tables[id], i, view = [];
+        text = text.toLowerCase();
+        if (!text) { t.view = null; }
+        else {
+            if (t.texts === null) {
+                t.texts = [];
+                for (i = 0; i < t.rows.length; i++) { t.texts.push(t.rows[i].join(' ').replace(/<[^>]*>/g, '').toLowerCase()); }
+            }
+            for (i = 0; i < t.texts.length; i++) { if (t.texts[i].indexOf(text) !== -1) { view.push(i); } }
+            t.view = view;
+        }
+        t.page = 0;
+        this.render(id);
+    }
+};
+if (document.addEventListener) { document.addEventListener('click', function (e) { if (MBQC.click(e) === false) { e.preventDefault(); } }); }
+else { document.attachEvent('onclick', MBQC.click); }
+}
+""" % {'select_url': SELECT_URL, 'max_url': MAX_URL_LENGTH}
+
+_table_ids = itertools.count(1)   # Unique per session, so tables never clash in an output window.
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def _cell(value):
+    return value if isinstance(value, (int, float)) else u'{}'.format(value)
+
+
+def _to_js(value):
+    """JSON that is safe inside a <script> element."""
+    return json.dumps(value).replace('</', '<\\/')
+
+
+def inject_helpers(output):
+    """Add the pager/link script to the output window, once per window: Run All prints many linked tables."""
+    if getattr(output, '_mbqc_helpers', False):
+        return
+    output.add_style(PAGER_CSS)
+    output.inject_script(PAGER_JS)
+    output._mbqc_helpers = True
+
+
+def link_cell(element_id):
+    #type: (int) -> str
+    """Deferred element link: only the id, the click handler in PAGER_JS selects the element."""
+    return u'<a class="elementlink mbqc-id" href="#">{}</a>'.format(element_id)
+
+
+def _select_ids(element_ids):
+    #type: (list) -> list
+    """The first element ids that fit in one select url, the same limit as MBQC.select."""
+    ids, length = [], 0
+    for element_id in element_ids:
+        part = len(u'element[]={}'.format(element_id)) + 1
+        if length + part >= MAX_URL_LENGTH:
+            break
+        ids.append(element_id)
+        length += part
+    return ids
+
+
+def print_select_all(output, element_ids, label='Select all'):
+    """Button that selects the given elements in Revit. Only the ids a select url can carry are written
+    into the page. (See MBQC.select for the url length limit)"""
+    ids   = _select_ids(element_ids)
+    count = len(ids) if len(ids) == len(element_ids) else u'first {} of {}'.format(len(ids), len(element_ids))
+    output.print_html(u'<div class="mbqc-bar"><button onclick="MBQC.select({})">{} ({})</button></div>'.format(
+        _to_js(ids), label, count))
+
+
+def print_paged_table(output, rows, columns, title=None, page_size=PAGE_SIZE, link_column=None):
+    """Print a table that is rendered one page at a time, with a filter box and page buttons.
+    Cells are written as HTML, like output.print_table.
+    :param output:      pyRevit output window. script.get_output()
+    :param rows:        List of rows (lists of cells).
+    :param columns:     Column headers.
+    :param title:       Optional title printed above the table.
+    :param page_size:   Rows per page.
+    :param link_column: Index of a column of element ids (int) rendered as deferred links,
+                        with a button to select every row that passes the filter."""
+    table_id = 'mbqc{}'.format(next(_table_ids))
+    total    = len(rows)
+    rows     = rows[:MAX_ROWS]
+
+    # Counts first: the user sees what is coming before any row is sent.
+    if title:
+        output.print_md('### {}'.format(title))
+    note = '*{} rows, {} per page.*'.format(total, page_size)
+    if total > MAX_ROWS:
+        note += ' *Only the first {} rows are kept in this window.*'.format(MAX_ROWS)
+    output.print_md(note)
+
+    head = (u'<table class="mbqc"><thead><tr><th>' + u'</th><th>'.join(u'{}'.format(c) for c in columns) +
+            u'</th></tr></thead><tbody>')
+    select_button = u'' if link_column is None else \
+        u'<button onclick="MBQC.selectTable(\'{id}\')">Select all</button>'
+
+    inject_helpers(output)
+    output.print_html(
+        (u'<div class="mbqc-bar">'
+         u'<input type="text" placeholder="Filter..." onkeyup="MBQC.filter(\'{id}\', this.value)">'
+         u'<button onclick="MBQC.page(\'{id}\', -1)">&lt;</button>'
+         u'<span class="mbqc-info" id="{id}-info"></span>'
+         u'<button onclick="MBQC.page(\'{id}\', 1)">&gt;</button>' + select_button +
+         u'</div><div id="{id}-rows"></div>').format(id=table_id))
+
+    output.inject_script('MBQC.create({}, {}, {}, {});'.format(_to_js(table_id), _to_js(head), int(page_size),
+                                                               _to_js(link_column)))
+    for start in range(0, len(rows), CHUNK_SIZE):
+        chunk = [[_cell(v) for v in row] for row in rows[start:start + CHUNK_SIZE]]
+        output.inject_script('MBQC.add({}, {});'.format(_to_js(table_id), _to_js(chunk)))
+    if not rows:
+        output.inject_script('MBQC.render({});'.format(_to_js(table_id)))
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""Bulk parameter reader: the same parameters of many elements, as columns.
+Each requested parameter is resolved once per category to the fastest key Revit offers:
+built-in parameters and shared parameter GUIDs are used as they are, a name is looked up
+on the first element of each category (LookupParameter) and replaced by its built-in
+parameter, GUID or Definition for the rest of the category.
+
+e.g.
+table = read_parameters(walls, [BuiltInParameter.WALL_BASE_OFFSET, 'Fire Rating',
+                                 ('Cost Code', '6f1c8a90-1111-4e3b-9a27-0c3d2e1f4b55')], raw=True)
+table['id']               # [element ids]
+table['Fire Rating']      # [values, None where the element doesn't have the parameter]"""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import re
+from collections import OrderedDict
+
+from Autodesk.Revit.DB import BuiltInParameter, StorageType
+
+# Custom Imports
+from Snippets._scanner   import id_int
+from Snippets._profiling import phase
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+GUID_PATTERN = re.compile(r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')
+
+try:
+    STRING_TYPES = (str, unicode)       # IronPython 2.7
+except NameError:
+    STRING_TYPES = (str,)               # CPython 3
+
+_NOT_FOUND = object()    # Cached key of a name that isn't found on the elements of a category.
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def to_guid(value):
+    """System.Guid from a GUID string."""
+    from System import Guid
+    return Guid(value)
+
+
+def parameter_value(param, raw=False):
+    """Value of a Parameter, or None.
+    :param raw: False: AsValueString (as shown in Properties, in project units).
+                True:  AsDouble in internal units, AsInteger, ElementId as int.
+                Text parameters are always AsString."""
+    if param is None:
+        return None
+    storage = param.StorageType
+    if storage == StorageType.String:
+        return param.AsString()
+    if not raw:
+        return param.AsValueString()
+    if storage == StorageType.Double:
+        return param.AsDouble()
+    if storage == StorageType.Integer:
+        return param.AsInteger()
+    if storage == StorageType.ElementId:
+        return id_int(param.AsElementId())
+    return None
+
+
+def read_parameters(elements, parameters, raw=False):
+    #type: (list, list, bool) -> OrderedDict
+    """Read parameters of many elements in one pass.
+    :param elements:   Elements to read. Any mix of categories.
+    :param parameters: BuiltInParameter, shared parameter GUID (System.Guid or string) or parameter name,
+                       or (column label, parameter) to choose the column name.
+    :param raw:        See parameter_value.
+    :return:           OrderedDict column -> list, one value per element: 'id' first, then one column per parameter.
+                       e.g. {'id': [101, 102], 'Fire Rating': ['60', None]}"""
+    readers = [ParameterReader(p) for p in parameters]
+    table   = OrderedDict([('id', [])])
+    columns = []
+    for reader in readers:
+        table[reader.label] = []
+        columns.append((reader, table[reader.label]))
+
+    ids = table['id']
+    with phase('params.read', parameters=len(readers)) as p:
+        for element in elements:     # Any iterable: a list, a FilteredElementCollector, a generator
+            ids.append(id_int(element.Id))
+            category = element.Category
+            category = id_int(category.Id) if category is not None else None
+            for reader, column in columns:
+                column.append(parameter_value(reader.get(element, category), raw))
+        p.count = len(ids)
+    return table
+
+
+def table_rows(table):
+    #type: (OrderedDict) -> list
+    """Records of a read_parameters table. e.g. [{'id': 101, 'Fire Rating': '60'}, ...]"""
+    names = list(table.keys())
+    return [dict(zip(names, values)) for values in zip(*table.values())]
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+class ParameterReader(object):
+    """One requested parameter, with the key to read it resolved per category.
+    :param parameter: BuiltInParameter, System.Guid, GUID string or name, or (label, parameter)."""
+
+    def __init__(self, parameter):
+        label = None
+        if isinstance(parameter, tuple):
+            label, parameter = parameter
+
+        self.name = None
+        self.key  = None         # Same key for every category: built-in parameter or GUID
+        if isinstance(parameter, BuiltInParameter):
+            self.key = parameter
+        elif isinstance(parameter, STRING_TYPES) and GUID_PATTERN.match(parameter):
+            self.key = to_guid(parameter)
+        elif isinstance(parameter, STRING_TYPES):
+            self.name = parameter
+        else:
+            self.key = parameter    # System.Guid
+
+        self.label       = label or self.name or str(parameter)
+        self._categories = {}   # category id -> (key, is_definition) found on the first element of the category
+
+    def get(self, element, category):
+        """Parameter of an element, or None."""
+        if self.key is not None:
+            return element.get_Parameter(self.key)
+
+        key = self._categories.get(category)
+        if key is None:
+            param = element.LookupParameter(self.name)
+            self._categories[category] = self._key_of(param) if param is not None else _NOT_FOUND
+            return param
+        if key is _NOT_FOUND:
+            # Not found on the category so far: it may only exist in some families of it.
+            param = element.LookupParameter(self.name)
+            if param is not None:
+                self._categories[category] = self._key_of(param)
+            return param
+        key, is_definition = key
+        param = element.get_Parameter(key)
+        if param is None and is_definition:
+            # A family parameter has its own Definition in every family: look it up by name.
+            param = element.LookupParameter(self.name)
+        return param
+
+    @staticmethod
+    def _key_of(param):
+        """(key, is_definition): fastest key to read the same parameter from other elements."""
+        definition = param.Definition
+        bip        = getattr(definition, 'BuiltInParameter', BuiltInParameter.INVALID)
+        if bip != BuiltInParameter.INVALID:
+            return bip, False
+        if param.IsShared:
+            return param.GUID, False
+        return definition, True
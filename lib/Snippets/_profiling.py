@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""Lightweight profiling of QC runs: per-phase duration, element count and peak memory,
+appended as JSON lines to a local trace file.
+
+Off by default. Switch it on without editing code, either:
+- set the environment variable MBQC_PROFILE=1, or
+- create the marker file <trace folder>/profile.on  (delete it to switch off)
+The trace folder is %TEMP%/MB_QC unless MBQC_PROFILE_DIR is set.
+
+e.g.
+with profile_script('Project Levels'):          # button script: one run
+    with phase('extract.levels') as p:          # lib: one phase
+        rows = ...
+        p.count = len(rows)"""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import io
+import os
+import json
+import time
+import tempfile
+import datetime
+from functools import wraps
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+ENV_SWITCH  = 'MBQC_PROFILE'
+ENV_DIR     = 'MBQC_PROFILE_DIR'
+MARKER_FILE = 'profile.on'
+TRACE_FILE  = 'trace.jsonl'
+
+_state = {'enabled': None,   # None = not read yet
+          'run':     None,   # Label of the current profile_script run
+          'stack':   []}     # Names of the open phases
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def trace_dir():
+    return os.environ.get(ENV_DIR) or os.path.join(tempfile.gettempdir(), 'MB_QC')
+
+
+def trace_path():
+    return os.path.join(trace_dir(), TRACE_FILE)
+
+
+def refresh_switch():
+    #type: () -> bool
+    """Read the environment variable and marker file again. Called at the start of every run."""
+    _state['enabled'] = (os.environ.get(ENV_SWITCH, '').lower() in ('1', 'true', 'on') or
+                         os.path.exists(os.path.join(trace_dir(), MARKER_FILE)))
+    return _state['enabled']
+
+
+def is_enabled():
+    if _state['enabled'] is None:
+        refresh_switch()
+    return _state['enabled']
+
+
+def peak_memory_mb():
+    """Peak memory of the process in MB, or None if it can't be read."""
+    try:
+        from System.Diagnostics import Process          # IronPython (Revit)
+        return Process.GetCurrentProcess().PeakWorkingSet64 / 1048576.0
+    except ImportError:
+        pass
+    try:
+        import resource                                 # CPython on Linux/macOS (ru_maxrss in KB on Linux)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    except ImportError:
+        return None
+
+
+def write_record(record):
+    """Append one record to the trace file. Profiling must never break a check, so errors are ignored."""
+    try:
+        folder = trace_dir()
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+        with io.open(trace_path(), 'a', encoding='utf-8') as f:
+            f.write(u'{}\n'.format(json.dumps(record, default=str)))
+    except (IOError, OSError):
+        pass
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+class _NoPhase(object):
+    """Returned by phase() while profiling is off: nothing is measured."""
+    count = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+_NO_PHASE = _NoPhase()
+
+
+class Phase(object):
+    """Timed phase. Set .count (elements, rows...) and add .extra before it closes."""
+
+    def __init__(self, name, count=None, **extra):
+        self.name  = name
+        self.count = count
+        self.extra = extra
+
+    def __enter__(self):
+        self.parent = _state['stack'][-1] if _state['stack'] else None
+        _state['stack'].append(self.name)
+        self.start = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        duration = time.time() - self.start
+        _state['stack'].pop()
+        record = {'ts':             datetime.datetime.now().isoformat(),
+                  'run':            _state['run'],
+                  'phase':          self.name,
+                  'parent':         self.parent,
+                  'duration':       round(duration, 6),
+                  'count':          self.count,
+                  'peak_memory_mb': peak_memory_mb()}
+        if exc_type is not None:
+            record['error'] = exc_type.__name__
+        record.update(self.extra)
+        write_record(record)
+        return False
+
+
+def phase(name, count=None, **extra):
+    """Context manager timing a phase. Cheap no-op while profiling is off.
+    :param name:  Phase name. e.g. 'extract.levels', 'check.grids', 'render'
+    :param count: Number of elements/rows handled, if known up front.
+    :param extra: Any other JSON-serializable values to store with the record."""
+    if not is_enabled():
+        return _NO_PHASE
+    return Phase(name, count, **extra)
+
+
+def profiled(name=None):
+    """Decorator: time every call of a function as a phase (named after the function by default)."""
+    def decorator(func):
+        phase_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with phase(phase_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class profile_script(object):
+    """Wrap a whole button run. Reads the on/off switch, labels every phase with the run name
+    and records the total as phase 'total'.
+
+    e.g.
+    with profile_script(__title__):
+        ..."""
+
+    def __init__(self, run_name):
+        self.run_name = run_name
+        self._total   = None
+
+    def __enter__(self):
+        if refresh_switch():
+            _state['run']   = u'{} {}'.format(self.run_name, datetime.datetime.now().strftime('%H:%M:%S'))
+            _state['stack'] = []
+            self._total     = Phase('total')
+            self._total.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if self._total is not None:
+            self._total.__exit__(exc_type, exc_value, tb)
+            _state['run'] = None
+        return False
+
+
+def summarize_trace(path=None):
+    #type: (str) -> list
+    """Total duration and count per phase of a trace file, slowest first.
+    :return: List of (phase, calls, total seconds, total count)."""
+    totals = {}
+    with io.open(path or trace_path(), encoding='utf-8') as f:
+        for line in f:
+            record = json.loads(line)
+            calls, duration, count = totals.get(record['phase'], (0, 0.0, 0))
+            totals[record['phase']] = (calls + 1, duration + record['duration'], count + (record['count'] or 0))
+    return sorted(((name,) + values for name, values in totals.items()), key=lambda row: -row[2])
+
+
+if __name__ == '__main__':
+    # python -m Snippets._profiling [trace.jsonl]
+    import sys
+    print(u'{:<30} {:>6} {:>10} {:>10}'.format('Phase', 'Calls', 'Total (s)', 'Count'))
+    for name, calls, duration, count in summarize_trace(sys.argv[1] if len(sys.argv) > 1 else None):
+        print(u'{:<30} {:>6} {:>10.4f} {:>10}'.format(name, calls, duration, count))
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import time
+import traceback
+
+# Custom Imports
+from Snippets._checks import CHECKS, QCResult
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+class QCSession(object):
+    """Run several registered checks against the same model data.
+    A live model is scanned once up front, for the tables of the checks that run, and every check reuses that index.
+
+    e.g.
+    session = QCSession(LiveModelData(doc))          # or QCSession(load_snapshot(path))
+    results = session.run()                          # all registered checks
+    results = session.run(['levels', 'grids'])"""
+
+    def __init__(self, data):
+        self.data      = data
+        self.scan_time = None
+        self.results   = []
+
+    def scan(self, checks=None):
+        """Prepare the data source (model scan for live documents) and record how long it took.
+        :param checks: QCChecks about to run. The tables of every check if None."""
+        tables = None
+        if checks is not None and all(check.tables is not None for check in checks):
+            tables = sorted(set(table for check in checks for table in check.tables))
+        start          = time.time()
+        self.data.prepare(tables)
+        self.scan_time = time.time() - start
+
+    def run(self, names=None):
+        #type: (list) -> list
+        """Run checks in the order of names, or every registered check in registration order.
+        :param names: Names of the checks to run, in the order they run. All registered checks if None.
+        :return:      List of QCResult with elapsed time set."""
+        checks = [CHECKS[name] for name in names] if names else list(CHECKS.values())
+        if self.scan_time is None:
+            self.scan(checks)
+        self.results = [self._run_one(check) for check in checks]
+        return self.results
+
+    def _run_one(self, check):
+        """Run a check and time it. A failing check is reported, not raised."""
+        start = time.time()
+        try:
+            result = check.run(self.data)
+        except Exception:
+            result       = QCResult(check.title, [], [])
+            result.error = traceback.format_exc()
+        result.elapsed = time.time() - start
+        return result
+
+    @property
+    def total_time(self):
+        return (self.scan_time or 0.0) + sum(r.elapsed for r in self.results)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+# External file references (Revit links, CAD links, keynote tables...) read from their metadata,
+# into the 'external_refs' table of Snippets._snapshot. Nothing is loaded: the same records come
+# from a model opened with all links unloaded.
+from Autodesk.Revit.DB import Element, ExternalFileUtils, ModelPathUtils
+
+# Custom Imports
+from Snippets._scanner import id_int
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def user_visible_path(model_path):
+    """ModelPath -> path as shown in Manage Links, or None."""
+    if model_path is None or model_path.Empty:
+        return None
+    return ModelPathUtils.ConvertModelPathToUserVisiblePath(model_path)
+
+
+def reference_record(element_id, name, ref):
+    #type: (ElementId, str, ExternalFileReference) -> dict
+    """Record of the 'external_refs' table."""
+    return {'id':            id_int(element_id),
+            'name':          name,
+            'kind':          str(ref.ExternalFileReferenceType),
+            'path':          user_visible_path(ref.GetPath()),
+            'absolute_path': user_visible_path(ref.GetAbsolutePath()),
+            'path_type':     str(ref.PathType),
+            'status':        str(ref.GetLinkedFileStatus())}
+
+
+def read_external_references(doc):
+    #type: (Document) -> list
+    """External file references of an open document. Linked documents are never opened,
+    so this works the same with every link unloaded."""
+    records = []
+    for element_id in ExternalFileUtils.GetAllExternalFileReferences(doc):
+        element = doc.GetElement(element_id)
+        if element is not None and element.IsExternalFileReference():
+            # Element.Name: ElementType.Name (RevitLinkType, CADLinkType) is hidden in IronPython.
+            records.append(reference_record(element_id, Element.Name.GetValue(element),
+                                            element.GetExternalFileReference()))
+    return records
+
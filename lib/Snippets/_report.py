@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+# pyrevit.forms (WPF) is only imported when an alert is shown.
+
+# Custom Imports
+from Snippets._profiling   import phase
+from Snippets._paged_table import print_paged_table, print_select_all, inject_helpers, link_cell, PAGE_SIZE
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+FOOTER = 'Tool has been developed by Miss BIM.'
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def print_footer():
+    print("-" * 50)
+    print(FOOTER)
+
+
+def link_rows(result):
+    """Rows of a QCResult with the element ids of its link_column turned into deferred links.
+    (A short anchor per row, the select url is only built when it's clicked)"""
+    col = result.link_column
+    if col is None:
+        return result.rows
+    return [row[:col] + [link_cell(row[col])] + row[col + 1:] for row in result.rows]
+
+
+def print_result(output, result, alert_title=None):
+    """Print a single QCResult as a table.
+    :param output:      pyRevit output window. script.get_output()
+    :param result:      QCResult of a check.
+    :param alert_title: If given, an empty result shows an alert with this title
+                        instead of a message in the output window."""
+    with phase('render', count=len(result.rows), title=result.title):
+        _print_result(output, result, alert_title)
+
+
+def _print_result(output, result, alert_title):
+    if result.error:
+        output.print_md('**{} failed:**'.format(result.title))
+        print(result.error)
+        return
+
+    if result.is_empty:
+        if alert_title:
+            from pyrevit import forms
+            forms.alert(result.empty_message, alert_title, FOOTER)
+        else:
+            output.print_md('*{}*'.format(result.empty_message))
+        return
+
+    # Large tables are streamed and shown one page at a time, so the output window stays responsive.
+    if len(result.rows) > PAGE_SIZE:
+        print_paged_table(output, result.rows, result.columns, title=result.title, link_column=result.link_column)
+        return
+
+    with phase('linkify', count=len(result.rows)):
+        rows = link_rows(result)
+    output.print_table(table_data=rows, title=result.title, columns=result.columns)
+    if result.link_column is not None:
+        inject_helpers(output)
+        print_select_all(output, [row[result.link_column] for row in result.rows])
+
+
+def print_summary(output, results, scan_time=None):
+    """Print one row per check with its row count and wall-clock time.
+    :param output:    pyRevit output window.
+    :param results:   List of QCResults returned by the runner.
+    :param scan_time: Seconds spent on the shared model scan."""
+    table_data = []
+    if scan_time is not None:
+        table_data.append(['Model Scan', '-', '{:.3f}'.format(scan_time), ''])
+
+    for result in results:
+        if result.error:
+            status = 'Failed'
+        elif result.cached:
+            status = 'Cached'
+        else:
+            status = 'Empty' if result.is_empty else 'OK'
+        table_data.append([result.title, len(result.rows), '{:.3f}'.format(result.elapsed), status])
+
+    total = sum(r.elapsed for r in results) + (scan_time or 0.0)
+    table_data.append(['**Total**', sum(len(r.rows) for r in results), '{:.3f}'.format(total), ''])
+    output.print_table(table_data=table_data, title='QC Summary', columns=['Check', 'Rows', 'Time (s)', 'Status'])
+
+
+def print_report(output, results, scan_time=None):
+    """Combined output of a multi-check QC session: summary first, then every table."""
+    print_summary(output, results, scan_time)
+    for result in results:
+        print_result(output, result)
+    print_footer()
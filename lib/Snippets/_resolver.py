@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+from Autodesk.Revit.DB import (FilteredElementCollector, FilteredWorksetCollector, BuiltInCategory,
+                               BuiltInParameter, ElementId, View, CADLinkType, RevitLinkInstance)
+
+# Custom Imports
+from Snippets._cache import document_cache
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+_resolvers = document_cache('resolvers', max_size=8)   # DocumentResolver per document state
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+class DocumentResolver(object):
+    """Name lookups shared by all checks of a document.
+    Workset, scope box, view, CAD type and link names are read once into dicts,
+    so resolving a name per element is a dict hit instead of a RevitAPI call.
+
+    Use get_resolver(doc) to get a cached instance."""
+
+    def __init__(self, doc, index=None):
+        """:param doc:   Document to resolve names in.
+        :param index: Optional ModelIndex, to reuse its scope boxes instead of collecting them."""
+        self.doc           = doc
+        self.is_workshared = doc.IsWorkshared
+        self._index        = index
+        self._worksets     = None
+        self._scope_boxes  = None
+        self._views        = None
+        self._cad_types    = None
+        self._links        = None
+
+    # >>>>>>>>>> MAPS (built on first use)
+    @property
+    def workset_names(self):
+        #type: () -> dict
+        """WorksetId -> Workset Name"""
+        if self._worksets is None:
+            self._worksets = {}
+            if self.is_workshared:
+                self._worksets = {ws.Id: ws.Name for ws in FilteredWorksetCollector(self.doc)}
+        return self._worksets
+
+    @property
+    def scope_box_names(self):
+        #type: () -> dict
+        """Scope Box ElementId -> Scope Box Name"""
+        if self._scope_boxes is None:
+            if self._index is not None:
+                scope_boxes = self._index.scope_boxes
+            else:
+                scope_boxes = FilteredElementCollector(self.doc).OfCategory(BuiltInCategory.OST_VolumeOfInterest)\
+                                                                .WhereElementIsNotElementType().ToElements()
+            self._scope_boxes = {sb.Id: sb.Name for sb in scope_boxes}
+            self._index       = None    # Don't keep the index alive while the resolver is cached.
+        return self._scope_boxes
+
+    @property
+    def view_names(self):
+        #type: () -> dict
+        """View ElementId -> View Name"""
+        if self._views is None:
+            self._views = {v.Id: v.Name for v in FilteredElementCollector(self.doc).OfClass(View)}
+        return self._views
+
+    @property
+    def cad_type_names(self):
+        #type: () -> dict
+        """CAD type ElementId -> Name (file name of a linked or imported CAD)"""
+        if self._cad_types is None:
+            self._cad_types = {t.Id: t.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString()
+                               for t in FilteredElementCollector(self.doc).OfClass(CADLinkType)}
+        return self._cad_types
+
+    @property
+    def link_names(self):
+        #type: () -> dict
+        """RevitLinkInstance ElementId -> Link Name without ".rvt" and location. e.g. 'Structure'"""
+        if self._links is None:
+            self._links = {link.Id: link.Name.split(".rvt")[0]
+                           for link in FilteredElementCollector(self.doc).OfClass(RevitLinkInstance)}
+        return self._links
+
+    # >>>>>>>>>> LOOKUPS
+    def workset_name(self, element, not_workshared="N/A"):
+        """Get the workset name of an element.
+        :param not_workshared: Value returned when the model is not workshared."""
+        if not self.is_workshared:
+            return not_workshared
+        return self.workset_names.get(element.WorksetId, "Unknown Workset")
+
+    def scope_box_id(self, element, bip=BuiltInParameter.DATUM_VOLUME_OF_INTEREST):
+        """Get the ElementId of the scope box assigned to an element, or None.
+        :param bip: DATUM_VOLUME_OF_INTEREST for datums, VIEWER_VOLUME_OF_INTEREST_CROP for views."""
+        param = element.get_Parameter(bip)
+        if param:
+            scope_box_id = param.AsElementId()
+            if scope_box_id != ElementId.InvalidElementId:
+                return scope_box_id
+        return None
+
+    def scope_box_name(self, element, bip=BuiltInParameter.DATUM_VOLUME_OF_INTEREST):
+        """Get the name of the scope box assigned to a datum element (or a view, see scope_box_id)."""
+        scope_box_id = self.scope_box_id(element, bip)
+        if scope_box_id is None:
+            return "No Scope Box"
+        return self.scope_box_names.get(scope_box_id, "No Scope Box")
+
+    def view_name(self, view_id, not_placed="Not Placed in a View"):
+        """Get the name of a view by its id. e.g. OwnerViewId of an ImportInstance.
+        :param not_placed: Value returned for InvalidElementId."""
+        if view_id == ElementId.InvalidElementId:
+            return not_placed
+        return self.view_names.get(view_id, "Unknown View")
+
+    def monitored_by(self, datum):
+        """Get the names of the links a Level or Grid follows (Copy/Monitor).
+        GetMonitoredLinkElementIds (an Element method) returns link instance ids, resolved through link_names."""
+        names = self.link_names
+        return [names[link_id] for link_id in datum.GetMonitoredLinkElementIds() if link_id in names]
+
+    def cad_type_name(self, type_id):
+        """Get the name of the type of an ImportInstance by its id.
+        A type missing from cad_type_names is read once and added to it."""
+        names = self.cad_type_names
+        if type_id not in names:
+            names[type_id] = self.doc.GetElement(type_id).get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString()
+        return names[type_id]
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def get_resolver(doc, index=None):
+    #type: (Document, object) -> DocumentResolver
+    """Get the DocumentResolver of a document.
+    The same instance is returned until the document changes (DocumentChanged)
+    or closes, then it's rebuilt on the next call."""
+    return _resolvers.get(doc, lambda: DocumentResolver(doc, index))
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+from Autodesk.Revit.DB import (FilteredElementCollector, BuiltInCategory, ElementFilter,
+                               ElementCategoryFilter, ElementClassFilter, LogicalOrFilter,
+                               Level, Grid, RevitLinkInstance, ImportInstance, ViewPlan,
+                               WallType, FloorType, RoofType, CeilingType)
+from collections import OrderedDict
+
+# Custom Imports
+from Snippets._profiling import phase
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+# Buckets filled by class. Checked in order, so keep subclasses before their base classes.
+CLASS_BUCKETS = [('levels',           Level),
+                 ('grids',            Grid),
+                 ('link_instances',   RevitLinkInstance),
+                 ('import_instances', ImportInstance),
+                 ('view_plans',       ViewPlan),
+                 ('wall_types',       WallType),
+                 ('floor_types',      FloorType),
+                 ('roof_types',       RoofType),
+                 ('ceiling_types',    CeilingType)]
+
+# Buckets filled by category, for elements that have no dedicated API class.
+CATEGORY_BUCKETS = [('scope_boxes', BuiltInCategory.OST_VolumeOfInterest),
+                    ('base_points', BuiltInCategory.OST_ProjectBasePoint)]
+
+BUCKETS = [name for name, _ in CLASS_BUCKETS + CATEGORY_BUCKETS]
+
+# System family reported by the structure checks, per type bucket.
+BASIC_FAMILIES = {'wall_types':    "Basic Wall",
+                  'floor_types':   "Floor",
+                  'roof_types':    "Basic Roof",
+                  'ceiling_types': "Compound Ceiling"}
+
+# Host type bucket -> kind stored in the 'host_types' table.
+HOST_KINDS = OrderedDict([('wall_types',    'wall'),
+                          ('floor_types',   'floor'),
+                          ('roof_types',    'roof'),
+                          ('ceiling_types', 'ceiling')])
+
+
+_CATEGORY_IDS = {int(bic): name for name, bic in CATEGORY_BUCKETS}
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def id_int(element_id):
+    #type: (ElementId) -> int
+    """ElementId as int. (IntegerValue is replaced by Value in Revit 2024+)"""
+    try:
+        return element_id.Value
+    except AttributeError:
+        return element_id.IntegerValue
+
+
+def classify(element):
+    #type: (Element) -> str
+    """Name of the bucket an element belongs to, or None."""
+    for name, cls in CLASS_BUCKETS:
+        if isinstance(element, cls):
+            return name
+    if element.Category:
+        return _CATEGORY_IDS.get(id_int(element.Category.Id))
+    return None
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+class ModelIndex(object):
+    """In-memory index of the elements read by the QC checks.
+    The document is traversed once with a multi-category/multiclass filter and
+    every element is bucketed by class or category, so each check reads its slice
+    instead of running its own FilteredElementCollector.
+    Only the buckets asked for are scanned: a single check doesn't pay for the whole model.
+
+    e.g.
+    index  = ModelIndex(doc, ['levels', 'grids'])      # one traversal for both
+    levels = index.levels
+    walls  = index.wall_types                          # not scanned yet: one more traversal, for walls only"""
+
+    def __init__(self, doc, buckets=None):
+        """:param buckets: Buckets to fill in the first traversal. All of BUCKETS if None."""
+        self.doc     = doc
+        self.buckets = {}
+        self.scan(BUCKETS if buckets is None else buckets)
+
+    @staticmethod
+    def _create_filter(buckets):
+        #type: (list) -> ElementFilter
+        """Combine the class and category quick filters of some buckets into a single filter."""
+        from System.Collections.Generic import List
+        classes    = dict(CLASS_BUCKETS)
+        categories = dict(CATEGORY_BUCKETS)
+        filters    = List[ElementFilter]()
+        for name in buckets:
+            filters.Add(ElementClassFilter(classes[name]) if name in classes else ElementCategoryFilter(categories[name]))
+        return LogicalOrFilter(filters) if filters.Count > 1 else filters[0]
+
+    def scan(self, buckets):
+        #type: (list) -> None
+        """Walk the document once and fill the buckets that aren't filled yet."""
+        missing = [name for name in BUCKETS if name in buckets and name not in self.buckets]
+        if not missing:
+            return
+
+        found = dict((name, []) for name in missing)
+        with phase('scan', buckets=len(missing)) as p:
+            for el in FilteredElementCollector(self.doc).WherePasses(self._create_filter(missing)):
+                elements = found.get(classify(el))
+                if elements is not None:
+                    elements.append(el)
+            p.count = sum(len(elements) for elements in found.values())
+        self.buckets.update(found)
+
+    def get(self, bucket):
+        #type: (str) -> list
+        """Get the elements of a single bucket. It's scanned on first use if it wasn't yet.
+        :param bucket: Name of the bucket. One of BUCKETS.
+        :return:       List of elements in that bucket."""
+        if bucket not in self.buckets:
+            self.scan([bucket])
+        return self.buckets[bucket]
+
+    def __len__(self):
+        return sum(len(elements) for elements in self.buckets.values())
+
+    # >>>>>>>>>> SLICES
+    @property
+    def levels(self):           return self.get('levels')
+
+    @property
+    def grids(self):            return self.get('grids')
+
+    @property
+    def scope_boxes(self):      return self.get('scope_boxes')
+
+    @property
+    def base_points(self):      return self.get('base_points')
+
+    @property
+    def link_instances(self):   return self.get('link_instances')
+
+    @property
+    def import_instances(self): return self.get('import_instances')
+
+    @property
+    def view_plans(self):       return self.get('view_plans')
+
+    @property
+    def wall_types(self):       return self.get('wall_types')
+
+    @property
+    def floor_types(self):      return self.get('floor_types')
+
+    @property
+    def roof_types(self):       return self.get('roof_types')
+
+    @property
+    def ceiling_types(self):    return self.get('ceiling_types')
+
+    def basic_types(self, bucket):
+        #type: (str) -> list
+        """Types of a host type bucket that belong to its basic (layered) system family.
+        e.g. index.basic_types('roof_types') -> RoofTypes of the 'Basic Roof' family"""
+        family = BASIC_FAMILIES[bucket]
+        return [t for t in self.get(bucket) if t.FamilyName == family]
+
+    def basic_wall_types(self):
+        """WallTypes of the 'Basic Wall' family (no curtain or stacked walls)."""
+        return self.basic_types('wall_types')
+
+    def basic_floor_types(self):
+        """FloorTypes of the 'Floor' family."""
+        return self.basic_types('floor_types')
@@ -3,46 +3,44 @@
 # ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
 # ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝
 #==================================================
-import sys, clr
-import traceback
-
-from Autodesk.Revit.UI.Selection    import ISelectionFilter, ObjectType, Selection
-from Autodesk.Revit.DB.Architecture import Room
-from Autodesk.Revit.DB import *
-
-# pyRevit IMPORTS
-from pyrevit.forms import SelectFromList
-from pyrevit import forms
-
-#.NET
-clr.AddReference('System')
-from System.Collections.Generic import List
-
-# CUSTOM IMPORTS
-from Snippets._variables import ALL_VIEW_TYPES
-from GUI.forms           import select_from_dict
+# Only what the classes below need at import time. pyRevit forms (WPF), GUI.forms and .NET generics
+# are imported inside the functions that use them, so importing a single helper stays cheap.
+from Autodesk.Revit.UI.Selection import ISelectionFilter, ObjectType
+from Autodesk.Revit.DB import (FilteredElementCollector, BuiltInCategory, BuiltInParameter, Element,
+                               FilledRegionType, Reference, ViewSheet)
 
 # ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
 # ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
 #  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝
 #==================================================
-uidoc     = __revit__.ActiveUIDocument
-doc       = __revit__.ActiveUIDocument.Document
-selection = uidoc.Selection                          # type: Selection
+def _active_uidoc(uidoc=None):
+    """Given UIDocument, or the active one. (Read per call: in rocket mode this module outlives documents)"""
+    return uidoc or __revit__.ActiveUIDocument
+
+
+def _forms():
+    from pyrevit import forms
+    return forms
+
+
+def select_from_dict(*args, **kwargs):
+    from GUI.forms import select_from_dict
+    return select_from_dict(*args, **kwargs)
 
 # ╔═╗╔═╗╔╦╗  ╔═╗╔═╗╦  ╔═╗╔═╗╔╦╗╔═╗╔╦╗
 # ║ ╦║╣  ║   ╚═╗║╣ ║  ║╣ ║   ║ ║╣  ║║
 # ╚═╝╚═╝ ╩   ╚═╝╚═╝╩═╝╚═╝╚═╝ ╩ ╚═╝═╩╝
 #==================================================
-def get_selected_elements(uidoc = uidoc, exitscript=True):
+def get_selected_elements(uidoc = None, exitscript=True):
     """Property that retrieves selected views or promt user to select some from the dialog box."""
+    uidoc     = _active_uidoc(uidoc)
     doc       = uidoc.Document
     selection = uidoc.Selection  # type: Selection
 
     try:
         selected_elements = [doc.GetElement(e_id) for e_id in selection.GetElementIds()]
         if not selected_elements:
-            forms.alert("No elements  were selected.\nPlease, try again.", exitscript=exitscript)
+            _forms().alert("No elements  were selected.\nPlease, try again.", exitscript=exitscript)
     except:
         return
 
@@ -50,9 +48,13 @@ def get_selected_elements(uidoc = uidoc, exitscript=True):
 
 #>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> GET ROOMS
 
-def get_selected_rooms(uidoc=uidoc, exitscript = True):
+def get_selected_rooms(uidoc=None, exitscript = True):
     """Function to Pick Rooms.
     Previously selected rooms will be pre-selected."""
+    from Autodesk.Revit.DB.Architecture import Room
+    from System.Collections.Generic import List
+    forms     = _forms()
+    uidoc     = _active_uidoc(uidoc)
     doc       = uidoc.Document
     selection = uidoc.Selection  # type: Selection
 
@@ -85,14 +87,17 @@ def get_selected_rooms(uidoc=uidoc, exitscript = True):
 
 
 #>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> GET VIEWS
-def get_selected_views(given_uidoc = uidoc, exit_if_none = False, title = '__title__', version = 'Version: _'):
+def get_selected_views(given_uidoc = None, exit_if_none = False, title = '__title__', version = 'Version: _'):
     """Function to get selected views. If none selected give a menu for a user to select views.
     ALL_VIEW_TYPES = [ViewPlan, ViewSection, View3D , ViewSchedule, View, ViewDrafting]
     LastUpdates:
     [15.02.2022] - If no views selected -> Select from DialogBox
     :return: list of selected views."""
 
+    from Snippets._variables import ALL_VIEW_TYPES
+
     # GET SELECTED ELEMENTS
+    given_uidoc = _active_uidoc(given_uidoc)
     doc         = given_uidoc.Document
     UI_selected = given_uidoc.Selection.GetElementIds()
 
@@ -107,18 +112,19 @@ def get_selected_views(given_uidoc = uidoc, exit_if_none = False, title = '__tit
 
     # EXIT IF STILL NONE SELECTED
     if not selected_views and exit_if_none:
-        forms.alert("No views were selected. Please try again.", exitscript=True)
+        _forms().alert("No views were selected. Please try again.", exitscript=True)
 
     return selected_views
 
 #>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> GET SHEETS
-def get_selected_sheets(given_uidoc = uidoc, exit_if_none = False, title='__title__', label='Select Sheets',
+def get_selected_sheets(given_uidoc = None, exit_if_none = False, title='__title__', label='Select Sheets',
                         btn_name = 'Select Sheets',  version = 'Version: _'):
     """Function to get selected views. return list of selected views.
     LastUpdates:
     [15.02.2022] - If no sheets selected -> Select from DialogBox
     [01.06.2022] - Bug Fixed + added more controls(label, btn_name)"""
     #>>>>>>>>>> GET SELECTED ELEMENTS
+    given_uidoc = _active_uidoc(given_uidoc)
     doc         = given_uidoc.Document
     UI_selected = given_uidoc.Selection.GetElementIds()
 
@@ -133,19 +139,29 @@ def get_selected_sheets(given_uidoc = uidoc, exit_if_none = False, title='__titl
 
     #>>>>>>>>>> EXIT IF STILL NONE SELECTED
     if not selected_sheets and exit_if_none:
-        forms.alert("No sheets were selected. Please try again.", exitscript=True)
+        _forms().alert("No sheets were selected. Please try again.", exitscript=True)
     return selected_sheets
 
 # ╔═╗╔═╗╦  ╔═╗╔═╗╔╦╗
 # ╚═╗║╣ ║  ║╣ ║   ║
 # ╚═╝╚═╝╩═╝╚═╝╚═╝ ╩
 #==================================================
+#>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> SET SELECTION
+def set_selection(element_ids, given_uidoc = None):
+    """Replace the selection in Revit UI with many elements in a single call.
+    (Output window links are limited by the url length, this isn't)
+    :param element_ids: Element ids as int."""
+    from Autodesk.Revit.DB import ElementId
+    from System.Collections.Generic import List
+    given_uidoc = _active_uidoc(given_uidoc)
+    given_uidoc.Selection.SetElementIds(List[ElementId]([ElementId(e_id) for e_id in element_ids]))
+
 #>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> SELECT TITLEBLOCK
-def select_title_block(given_uidoc = uidoc, exitscript = True):
+def select_title_block(given_uidoc = None, exitscript = True):
     """Function to let user select a title block.
     LastUpdates:
     [15.02.2022] - SelectFromList -> select_from_dict()"""
-    doc = given_uidoc.Document
+    doc = _active_uidoc(given_uidoc).Document
     #>>>>>>>>>> SELECT TITLE BLOCK
     all_title_blocks = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_TitleBlocks).WhereElementIsElementType().ToElements()
     unique_title_blocks = {}
@@ -159,13 +175,14 @@ def select_title_block(given_uidoc = uidoc, exitscript = True):
 
     # VERIFY SOMETHING IS SELECTED
     if not selected_title_block and exitscript:
-        forms.alert("No TitleBlock was selected. Please try again.", exitscript = exitscript)
+        _forms().alert("No TitleBlock was selected. Please try again.", exitscript = exitscript)
 
     return selected_title_block[0]
 
 #>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> GET RegionType
-def select_region_type(given_uidoc = uidoc):
-    all_filled_regions = FilteredElementCollector(given_uidoc.Document).OfClass(FilledRegionType)
+def select_region_type(given_uidoc = None):
+    forms              = _forms()
+    all_filled_regions = FilteredElementCollector(_active_uidoc(given_uidoc).Document).OfClass(FilledRegionType)
     dict_filled_regions = {Element.Name.GetValue(fr):fr for fr in all_filled_regions}
 
     #>>>>>>>>>> PROMT USER TO SELECT FilledRegion TYPE
@@ -174,8 +191,9 @@ def select_region_type(given_uidoc = uidoc):
     return dict_filled_regions[selection]
 
 #>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>> GET FloorType
-def select_floor_type(given_uidoc = uidoc):
-    all_floor_types = FilteredElementCollector(given_uidoc.Document).OfCategory(BuiltInCategory.OST_Floors).WhereElementIsElementType().ToElements()
+def select_floor_type(given_uidoc = None):
+    forms           = _forms()
+    all_floor_types = FilteredElementCollector(_active_uidoc(given_uidoc).Document).OfCategory(BuiltInCategory.OST_Floors).WhereElementIsElementType().ToElements()
     dict_floor_types = {Element.Name.GetValue(fr):fr for fr in all_floor_types}
 
 
@@ -215,14 +233,16 @@ class ISelectionFilter_Classes(ISelectionFilter):
 # ╩  ╩╚═╝╩ ╩  ╚═╝╩═╝╚═╝╩ ╩╚═╝╝╚╝ ╩ ╚═╝
 #==================================================
 #>>>>>>>>>> PICK WALL
-def pick_wall(given_uidoc = uidoc):
+def pick_wall(given_uidoc = None):
     """Function to promt user to select a wall element in Revit UI."""
+    given_uidoc = _active_uidoc(given_uidoc)
     wall_ref = given_uidoc.Selection.PickObject(ObjectType.Element, CustomISelectionFilter("-2000011"), "Select a Wall")    # -2000011 <- Id of OST_Walls
     wall     = given_uidoc.Document.GetElement(wall_ref)
     return wall
 
-def pick_curve(given_uidoc = uidoc):
+def pick_curve(given_uidoc = None):
     """Function to promt user to select a curve element in Revit UI."""
+    given_uidoc = _active_uidoc(given_uidoc)
     curve_ref = given_uidoc.Selection.PickObject(ObjectType.Element, CustomISelectionFilter("-2000051"), "Select a Curve")
     selected_curve = given_uidoc.Document.GetElement(curve_ref)
     curve = selected_curve.GeometryCurve
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""Shared parameters: the shared parameter file read once into an index, and a manifest of
+parameters bound to a document in a single TransactionGroup (one Undo item, all or nothing).
+The same index is reused for every document, e.g. to roll a standard set of parameters into many files.
+
+e.g.
+index    = SharedParameterFile(app, r'C:\\Standards\\Shared Parameters.txt')
+manifest = [ParameterSpec("Copy Rights", ['OST_ProjectInformation'], 'PG_IDENTITY_DATA', is_instance=True),
+            ParameterSpec("Fire Rating", ['Walls', 'Doors'], 'PG_FIRE_PROTECTION', formula=None)]
+report   = bind_parameters(doc, index, manifest)    # [(name, status), ...]"""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import io
+import json
+
+from Autodesk.Revit.DB import BuiltInCategory, BuiltInParameterGroup, InstanceBinding, Transaction, TransactionGroup
+
+# Custom Imports
+from Snippets._profiling import phase
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+DEFAULT_GROUP = 'PG_IDENTITY_DATA'
+
+# Status of a parameter in the report of bind_parameters
+ADDED, CATEGORIES_ADDED, FORMULA_SET, ALREADY_BOUND, KIND_CONFLICT, NOT_IN_FILE, NO_CATEGORIES, FAILED = (
+    "Added", "Categories Added", "Formula Set", "Already Bound", "Bound as the Other Kind (Instance/Type)",
+    "Not in Shared Parameter File", "No Categories Found", "Failed")
+CHANGED = (ADDED, CATEGORIES_ADDED, FORMULA_SET)     # Statuses of a parameter that was (or would be) changed
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+class SharedParameterFile(object):
+    """Every definition of a shared parameter file, indexed by name and GUID. The file is read once.
+    :param app:  Autodesk.Revit.ApplicationServices.Application
+    :param path: Shared parameter file. None for the file currently set in Revit.
+                 The file set in Revit is restored after reading another one."""
+
+    def __init__(self, app, path=None):
+        self.path    = path or app.SharedParametersFilename
+        self.by_name = {}     # name -> ExternalDefinition
+        self.by_guid = {}     # guid string (lower case) -> ExternalDefinition
+
+        previous = app.SharedParametersFilename
+        try:
+            app.SharedParametersFilename = self.path
+            definition_file = app.OpenSharedParameterFile()
+        finally:
+            app.SharedParametersFilename = previous
+        if definition_file is None:
+            raise IOError("Shared parameter file not found: {}".format(self.path))
+
+        with phase('shared_params.index') as p:
+            for group in definition_file.Groups:
+                for definition in group.Definitions:
+                    self.by_name.setdefault(definition.Name, definition)
+                    self.by_guid[str(definition.GUID).lower()] = definition
+            p.count = len(self.by_guid)
+        self.file = definition_file     # Keeps the definitions valid while the index is used.
+
+    def get(self, name_or_guid):
+        """ExternalDefinition by name or GUID string, or None."""
+        return self.by_name.get(name_or_guid) or self.by_guid.get(str(name_or_guid).lower())
+
+    def __contains__(self, name_or_guid):
+        return self.get(name_or_guid) is not None
+
+    def __len__(self):
+        return len(self.by_guid)
+
+
+class ParameterSpec(object):
+    """One entry of a manifest: a shared parameter and how to bind it.
+    :param name:        Name or GUID in the shared parameter file.
+    :param categories:  Categories of a project binding, as BuiltInCategory or names ('OST_Walls' or 'Walls').
+                        Not used in family documents.
+    :param group:       BuiltInParameterGroup or its name. e.g. 'PG_IDENTITY_DATA'
+    :param is_instance: Instance or Type parameter.
+    :param formula:     Formula, set in family documents only. (Projects have no parameter formulas)"""
+    __slots__ = ('name', 'categories', 'group', 'is_instance', 'formula')
+
+    def __init__(self, name, categories=None, group=DEFAULT_GROUP, is_instance=True, formula=None):
+        self.name        = name
+        self.categories  = list(categories or [])
+        self.group       = getattr(BuiltInParameterGroup, group) if isinstance(group, str) else group
+        self.is_instance = is_instance
+        self.formula     = formula
+
+    @classmethod
+    def from_dict(cls, entry):
+        """e.g. {"name": "Fire Rating", "categories": ["Walls"], "group": "PG_FIRE_PROTECTION", "is_instance": true}"""
+        return cls(entry['name'], entry.get('categories'), entry.get('group', DEFAULT_GROUP),
+                   entry.get('is_instance', True), entry.get('formula'))
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def load_manifest(path):
+    #type: (str) -> list
+    """ParameterSpecs of a JSON manifest: a list of ParameterSpec.from_dict entries."""
+    with io.open(path, encoding='utf-8') as f:
+        return [ParameterSpec.from_dict(entry) for entry in json.load(f)]
+
+
+def category_finder(doc):
+    """Function: category name or BuiltInCategory (member or name, e.g. 'OST_Walls') -> Category or None.
+    Only categories that take bound parameters are returned. Category names are read once."""
+    categories = doc.Settings.Categories
+    by_name    = dict((c.Name, c) for c in categories if c.AllowsBoundParameters)
+
+    def find(category):
+        key = str(category)
+        if key not in by_name and key.startswith('OST_'):
+            try:
+                found = categories.get_Item(getattr(BuiltInCategory, key))
+            except Exception:   # Unknown in this Revit version
+                found = None
+            by_name[key] = found if found is not None and found.AllowsBoundParameters else None
+        return by_name.get(key)
+    return find
+
+
+def existing_bindings(doc):
+    #type: (Document) -> dict
+    """Parameter name -> (Definition, ElementBinding) of every parameter bound in a project."""
+    bindings = {}
+    iterator = doc.ParameterBindings.ForwardIterator()
+    while iterator.MoveNext():
+        bindings[iterator.Key.Name] = (iterator.Key, iterator.Current)
+    return bindings
+
+
+def bind_parameters(doc, index, manifest, name="Bind Shared Parameters"):
+    #type: (Document, SharedParameterFile, list, str) -> list
+    """Add every parameter of a manifest to a document in one TransactionGroup.
+    Projects: parameters are bound to their categories. A parameter that's already bound gets
+    the missing categories added. One bound as the other kind (Instance/Type) is reported, not re-bound.
+    Families: see add_family_parameters.
+    :param index:    SharedParameterFile the parameters are taken from.
+    :param manifest: List of ParameterSpec.
+    :return:         [(parameter name, status)] in manifest order. Nothing is changed if a step fails."""
+    report = []
+    group  = TransactionGroup(doc, name)
+    group.Start()
+    try:
+        with phase('shared_params.bind', count=len(manifest)):
+            if doc.IsFamilyDocument:
+                report = add_family_parameters(doc, index, manifest)
+            else:
+                _bind_project_parameters(doc, index, manifest, report)
+        group.Assimilate()
+    except Exception:
+        if group.HasStarted():
+            group.RollBack()
+        raise
+    return report
+
+
+def _run_transaction(doc, name, action):
+    t = Transaction(doc, name)
+    t.Start()
+    try:
+        action()
+        t.Commit()
+    except Exception:
+        t.RollBack()
+        raise
+
+
+def _bind_project_parameters(doc, index, manifest, report):
+    find       = category_finder(doc)
+    bindings   = existing_bindings(doc)
+    create     = doc.Application.Create
+
+    def bind():
+        for spec in manifest:
+            definition = index.get(spec.name)
+            if definition is None:
+                report.append((spec.name, NOT_IN_FILE))
+                continue
+            wanted = [c for c in (find(c) for c in spec.categories) if c is not None]
+            if not wanted:
+                report.append((spec.name, NO_CATEGORIES))
+                continue
+
+            category_set = create.NewCategorySet()
+            existing     = bindings.get(definition.Name)
+            if existing and isinstance(existing[1], InstanceBinding) != spec.is_instance:
+                # ReInsert would switch the parameter between Instance and Type.
+                report.append((spec.name, KIND_CONFLICT))
+                continue
+            if existing:
+                for category in existing[1].Categories:
+                    category_set.Insert(category)
+            missing = [c for c in wanted if not category_set.Contains(c)]
+            if existing and not missing:
+                report.append((spec.name, ALREADY_BOUND))
+                continue
+            for category in missing:
+                category_set.Insert(category)
+
+            binding = create.NewInstanceBinding(category_set) if spec.is_instance else create.NewTypeBinding(category_set)
+            if existing:
+                done, status = doc.ParameterBindings.ReInsert(definition, binding, spec.group), CATEGORIES_ADDED
+            else:
+                done, status = doc.ParameterBindings.Insert(definition, binding, spec.group), ADDED
+            report.append((spec.name, status if done else FAILED))
+            if done:
+                bindings[definition.Name] = (definition, binding)
+
+    _run_transaction(doc, "Bind Shared Parameters", bind)
+
+
+def add_family_parameters(doc, index, manifest, dry_run=False):
+    #type: (Document, SharedParameterFile, list, bool) -> list
+    """Add the parameters of a manifest to a family document and set their formulas, in a single transaction.
+    :param dry_run: Only report what would change. No transaction is started.
+    :return:        [(parameter name, status)] in manifest order."""
+    manager = doc.FamilyManager
+    report  = []
+    planned = []    # (spec, definition, existing FamilyParameter or None, set formula)
+    for spec in manifest:
+        definition = index.get(spec.name)
+        if definition is None:
+            report.append((spec.name, NOT_IN_FILE))
+            continue
+        param       = manager.get_Parameter(definition.Name)
+        set_formula = spec.formula is not None and (param is None or param.Formula != spec.formula)
+        report.append((spec.name, ADDED if param is None else FORMULA_SET if set_formula else ALREADY_BOUND))
+        if param is None or set_formula:
+            planned.append((spec, definition, param, set_formula))
+    if dry_run or not planned:
+        return report
+
+    def add():
+        formulas = []
+        for spec, definition, param, set_formula in planned:
+            if param is None:
+                param = manager.AddParameter(definition, spec.group, spec.is_instance)
+            if set_formula:
+                formulas.append((param, spec.formula))
+        # After every parameter exists: a formula may refer to a parameter added later in the manifest.
+        for param, formula in formulas:
+            manager.SetFormula(param, formula)
+
+    _run_transaction(doc, "Add Shared Parameters", add)
+    return report
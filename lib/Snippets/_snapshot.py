@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Offline model snapshot format.
+Pure Python (no RevitAPI), so the same checks run inside Revit and on a plain CPython box.
+
+A snapshot is a gzip-compressed JSON file with one columnar table per element kind:
+{"format": "MB_QC snapshot", "version": 1, "meta": {...},
+ "tables": {"levels": {"count": 2, "columns": {"id": [311, 694], "name": ["L0", "L1"], ...}}}}"""
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+import io
+import json
+from collections import OrderedDict
+
+try:
+    import gzip
+except ImportError:     # IronPython builds without zlib -> plain JSON snapshots.
+    gzip = None
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+SNAPSHOT_FORMAT  = "MB_QC snapshot"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_EXT     = "mbqc"
+
+# Table -> Columns. Lengths are in internal units (decimal feet).
+# workset is None when the model is not workshared, view_name is None when not placed in a view.
+# link_tree has one record per link instance along every nested path: id is the host instance at the
+# top of the path, x/y/z/rotation place it in host coordinates (degrees), document is None if not loaded.
+# external_refs: kind, path_type and status are the names of the RevitAPI enums. e.g. 'RevitLink', 'Relative', 'Unloaded'
+# Extents are in model coordinates: scope box bounding boxes, grid line ends (x0, y0)-(x1, y1), and the rectangle
+# around the crop region of cropped plan views. scope_box_id is None when no scope box is assigned.
+# Level elevation is measured from its Elevation Base (as shown in Revit), z is the same height in model coordinates.
+# curve_points of a curved grid are [[x, y]] along its tessellated arc, None for a straight grid.
+TABLES = OrderedDict([
+    ('base_points',      ['id', 'north_south', 'east_west', 'elevation', 'angle']),
+    ('levels',           ['id', 'name', 'elevation', 'z', 'workset', 'scope_box', 'scope_box_id', 'monitored_by']),
+    ('grids',            ['id', 'name', 'workset', 'scope_box', 'scope_box_id', 'monitored_by',
+                          'x0', 'y0', 'x1', 'y1', 'curve_points']),
+    ('scope_boxes',      ['id', 'name', 'workset', 'min_x', 'min_y', 'min_z', 'max_x', 'max_y', 'max_z']),
+    ('view_crops',       ['id', 'name', 'view_type', 'scope_box', 'scope_box_id', 'min_x', 'min_y', 'max_x', 'max_y']),
+    ('link_instances',   ['id', 'name', 'type_name', 'shared_site', 'workset',
+                          'pbp_north_south', 'pbp_east_west', 'pbp_elevation', 'pbp_angle']),
+    ('link_tree',        ['id', 'path', 'depth', 'name', 'type_name', 'parent', 'document', 'workset',
+                          'x', 'y', 'z', 'rotation',
+                          'pbp_north_south', 'pbp_east_west', 'pbp_elevation', 'pbp_angle']),
+    ('import_instances', ['id', 'name', 'is_linked', 'view_id', 'view_name']),
+    ('external_refs',    ['id', 'name', 'kind', 'path', 'absolute_path', 'path_type', 'status']),
+    ('host_types',       ['id', 'kind', 'name', 'width', 'function', 'structural_material']),
+    ('layers',           ['type_id', 'function', 'material', 'width', 'is_core']),
+])
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+class ModelData(object):
+    """Tables of plain records (dicts) read by the checks.
+    Snapshot-backed by default. LiveModelData (Snippets._extract) fills the same
+    tables from an open Revit document."""
+
+    def __init__(self, tables=None, meta=None):
+        self.tables   = tables if tables is not None else {}
+        self.meta     = meta   if meta   is not None else {}
+        self._derived = {}      # name -> (table version, value), see derived
+
+    def rows(self, table):
+        #type: (str) -> list
+        """Records of a table. Unknown/missing tables are empty."""
+        return self.tables.get(table, [])
+
+    def prepare(self, tables=None):
+        """Hook for sources that need a setup step before the checks run.
+        :param tables: Tables the checks about to run will read. All if None."""
+        pass
+
+    def table_version(self, table):
+        """Changes every time the records of a table change. Snapshot tables never do."""
+        return 0
+
+    def derived(self, name, table, build):
+        """Value built from the records of a table (e.g. an index), shared by every check that reads it.
+        Built again only after the table has changed.
+        e.g. audit = data.derived('cad_audit', 'import_instances', CadAudit)"""
+        cached = self._derived.get(name)
+        if cached is None or cached[0] != self.table_version(table):
+            records = self.rows(table)
+            cached  = self._derived[name] = (self.table_version(table), build(records))
+        return cached[1]
+
+    def get_cached_result(self, check):
+        #type: (QCCheck) -> QCResult
+        """Hook for sources that can reuse the result of a previous run. None = run the check."""
+        return None
+
+    def store_result(self, check, result):
+        """Hook called with every fresh result, see get_cached_result."""
+        pass
+
+    @property
+    def is_workshared(self):
+        return bool(self.meta.get('is_workshared'))
+
+    def to_dict(self):
+        """Serializable columnar form of all tables."""
+        tables = OrderedDict()
+        for name, columns in TABLES.items():
+            records = self.rows(name)
+            tables[name] = {'count':   len(records),
+                            'columns': OrderedDict((col, [r.get(col) for r in records]) for col in columns)}
+        return OrderedDict([('format',  SNAPSHOT_FORMAT),
+                            ('version', SNAPSHOT_VERSION),
+                            ('meta',    self.meta),
+                            ('tables',  tables)])
+
+    @classmethod
+    def from_dict(cls, content):
+        """Create ModelData from the columnar form. See to_dict()."""
+        if content.get('format') != SNAPSHOT_FORMAT:
+            raise ValueError('Not an MB_QC snapshot.')
+        if content.get('version', 0) > SNAPSHOT_VERSION:
+            raise ValueError('Snapshot version {} is newer than supported ({}).'.format(content['version'], SNAPSHOT_VERSION))
+
+        tables = {}
+        for name, table in content.get('tables', {}).items():
+            columns = table['columns']
+            names   = list(columns.keys())
+            tables[name] = [dict(zip(names, values)) for values in zip(*[columns[c] for c in names])]
+        return cls(tables, content.get('meta', {}))
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def save_snapshot(data, path, compress=True):
+    #type: (ModelData, str, bool) -> str
+    """Write ModelData to a snapshot file.
+    :param data:     ModelData (or LiveModelData) to write. All tables are read.
+    :param path:     Destination file path.
+    :param compress: gzip the file if gzip is available.
+    :return:         path"""
+    content = json.dumps(data.to_dict(), separators=(',', ':')).encode('utf-8')
+    if compress and gzip is not None:
+        f = gzip.open(path, 'wb')
+    else:
+        f = io.open(path, 'wb')
+    try:
+        f.write(content)
+    finally:
+        f.close()
+    return path
+
+
+def load_snapshot(path):
+    #type: (str) -> ModelData
+    """Read a snapshot file written by save_snapshot (compressed or not)."""
+    with io.open(path, 'rb') as f:
+        content = f.read()
+
+    if content[:2] == b'\x1f\x8b':
+        if gzip is None:
+            raise IOError('Snapshot is gzip-compressed but gzip is not available: {}'.format(path))
+        f = gzip.GzipFile(fileobj=io.BytesIO(content))
+        try:
+            content = f.read()
+        finally:
+            f.close()
+
+    return ModelData.from_dict(json.loads(content.decode('utf-8'), object_pairs_hook=OrderedDict))
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+# Grid hash of scope box extents in plan, so "which boxes does this grid line / crop region touch"
+# and "which boxes overlap" only compare boxes that share a cell instead of every pair.
+# Pure Python, used by the scope box checks of Snippets._checks on live and snapshot data.
+# Boxes are the axis-aligned bounding boxes of the scope boxes: a rotated box is taken a bit larger.
+from collections import OrderedDict
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+TOLERANCE         = 1.0 / 256     # ft (~1.2 mm). Closer than this counts as touching / aligned.
+MAX_CELLS_PER_BOX = 4096          # Larger boxes are kept aside and compared with every query.
+
+
+# ╔═╗╦ ╦╔╗╔╔═╗╔╦╗╦╔═╗╔╗╔╔═╗
+# ╠╣ ║ ║║║║║   ║ ║║ ║║║║╚═╗
+# ╚  ╚═╝╝╚╝╚═╝ ╩ ╩╚═╝╝╚╝╚═╝ FUNCTIONS
+# ==================================================
+def rects_overlap(a, b, tolerance=TOLERANCE):
+    """True if two (min_x, min_y, max_x, max_y) rectangles overlap by more than tolerance.
+    Boxes that only share an edge don't overlap."""
+    return (a[0] < b[2] - tolerance and b[0] < a[2] - tolerance and
+            a[1] < b[3] - tolerance and b[1] < a[3] - tolerance)
+
+
+def overlap_area(a, b):
+    return max(0.0, min(a[2], b[2]) - max(a[0], b[0])) * max(0.0, min(a[3], b[3]) - max(a[1], b[1]))
+
+
+def segment_crosses_rect(x0, y0, x1, y1, rect, tolerance=TOLERANCE):
+    """True if the segment (x0, y0)-(x1, y1) has a point inside the rectangle (Liang-Barsky clipping)."""
+    min_x, min_y, max_x, max_y = rect[0] - tolerance, rect[1] - tolerance, rect[2] + tolerance, rect[3] + tolerance
+    dx, dy = x1 - x0, y1 - y0
+    t0, t1 = 0.0, 1.0
+    for p, q in ((-dx, x0 - min_x), (dx, max_x - x0), (-dy, y0 - min_y), (dy, max_y - y0)):
+        if p == 0:
+            if q < 0:
+                return False
+            continue
+        t = q / p
+        if p < 0:
+            t0 = max(t0, t)
+        else:
+            t1 = min(t1, t)
+        if t0 > t1:
+            return False
+    return True
+
+
+def max_edge_offset(a, b):
+    """Largest distance between matching edges of two rectangles."""
+    return max(abs(a[i] - b[i]) for i in range(4))
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+class GridHash(object):
+    """Rectangles bucketed in square cells. A query only looks at the rectangles of the cells it covers.
+    :param cell_size: Side of a cell. About the size of a typical rectangle works best."""
+
+    def __init__(self, cell_size):
+        self.cell_size = float(cell_size)
+        self.rects     = OrderedDict()   # key -> (min_x, min_y, max_x, max_y)
+        self.cells     = {}              # (i, j) -> [key]
+        self.large     = []              # keys of rectangles spanning more than MAX_CELLS_PER_BOX cells
+
+    @classmethod
+    def build(cls, rects):
+        #type: (dict) -> GridHash
+        """GridHash of key -> rectangle, with the median rectangle size as cell size."""
+        sizes = sorted(max(r[2] - r[0], r[3] - r[1]) for r in rects.values())
+        grid  = cls(max(sizes[len(sizes) // 2], 1.0) if sizes else 1.0)
+        for key, rect in rects.items():
+            grid.insert(key, rect)
+        return grid
+
+    def _range(self, rect):
+        size = self.cell_size
+        return (int(rect[0] // size), int(rect[1] // size), int(rect[2] // size), int(rect[3] // size))
+
+    def insert(self, key, rect):
+        self.rects[key] = rect
+        i0, j0, i1, j1 = self._range(rect)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > MAX_CELLS_PER_BOX:
+            self.large.append(key)
+            return
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                self.cells.setdefault((i, j), []).append(key)
+
+    def candidates(self, rect):
+        #type: (tuple) -> set
+        """Keys of the rectangles that may touch rect. Callers test the exact geometry."""
+        i0, j0, i1, j1 = self._range((rect[0] - TOLERANCE, rect[1] - TOLERANCE,
+                                      rect[2] + TOLERANCE, rect[3] + TOLERANCE))
+        found = set(self.large)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > MAX_CELLS_PER_BOX:
+            return set(self.rects)
+        cells = self.cells
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                found.update(cells.get((i, j), ()))
+        return found
+
+    def overlapping_pairs(self, tolerance=TOLERANCE):
+        #type: (float) -> list
+        """[(key a, key b)] of every pair of overlapping rectangles, each pair once."""
+        rects = self.rects
+        pairs = set()
+        for keys in self.cells.values():
+            for n, a in enumerate(keys):
+                for b in keys[n + 1:]:
+                    if rects_overlap(rects[a], rects[b], tolerance):
+                        pairs.add((a, b))
+        for a in self.large:
+            for b in self.candidates(rects[a]):
+                if a != b and (b, a) not in pairs and rects_overlap(rects[a], rects[b], tolerance):
+                    pairs.add((a, b))
+        order = dict((key, n) for n, key in enumerate(rects))
+        return sorted((a, b) if order[a] < order[b] else (b, a) for a, b in pairs)
+
+    def __len__(self):
+        return len(self.rects)
+
+
+class ScopeBoxIndex(object):
+    """Scope boxes of a model ('scope_boxes' table) in a GridHash of their plan extents.
+    Records without extents (snapshots written before they were extracted) are left out.
+
+    e.g.
+    boxes = ScopeBoxIndex(data.rows('scope_boxes'))
+    boxes.crossed_by(0, 0, 100, 0)      # ids of the boxes a grid line runs through
+    boxes.overlaps()                    # [(id a, id b)]"""
+
+    def __init__(self, records):
+        #type: (list) -> None
+        self.boxes = OrderedDict((sb['id'], sb) for sb in records if sb.get('min_x') is not None)
+        self.grid  = GridHash.build(OrderedDict((sb_id, self.rect(sb_id)) for sb_id in self.boxes))
+
+    def rect(self, sb_id):
+        sb = self.boxes[sb_id]
+        return sb['min_x'], sb['min_y'], sb['max_x'], sb['max_y']
+
+    def crossed_by(self, x0, y0, x1, y1):
+        #type: (float, float, float, float) -> list
+        """Ids of the boxes a segment runs through, in plan."""
+        rect = (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+        return [sb_id for sb_id in self.grid.candidates(rect)
+                if segment_crosses_rect(x0, y0, x1, y1, self.rect(sb_id))]
+
+    def at_elevation(self, z):
+        #type: (float) -> list
+        """Ids of the boxes whose height contains an elevation."""
+        return [sb_id for sb_id, sb in self.boxes.items()
+                if sb['min_z'] - TOLERANCE <= z <= sb['max_z'] + TOLERANCE]
+
+    def overlaps(self):
+        #type: () -> list
+        """[(id a, id b)] of boxes that overlap in plan and in height."""
+        boxes = self.boxes
+        return [(a, b) for a, b in self.grid.overlapping_pairs()
+                if boxes[a]['min_z'] < boxes[b]['max_z'] - TOLERANCE and
+                boxes[b]['min_z'] < boxes[a]['max_z'] - TOLERANCE]
+
+    def best_match(self, rect):
+        #type: (tuple) -> tuple
+        """(box id, overlap ratio) of the box that overlaps rect the most, by intersection over union.
+        (None, 0.0) if none overlaps."""
+        best, best_ratio = None, 0.0
+        area = (rect[2] - rect[0]) * (rect[3] - rect[1])
+        for sb_id in self.grid.candidates(rect):
+            box    = self.rect(sb_id)
+            common = overlap_area(rect, box)
+            union  = area + (box[2] - box[0]) * (box[3] - box[1]) - common
+            ratio  = common / union if union > 0 else 0.0
+            if ratio > best_ratio:
+                best, best_ratio = sb_id, ratio
+        return best, best_ratio
+
+    def __contains__(self, sb_id):
+        return sb_id in self.boxes
+
+    def __len__(self):
+        return len(self.boxes)
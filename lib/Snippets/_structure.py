@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# ╦╔╦╗╔═╗╔═╗╦═╗╔╦╗╔═╗
+# ║║║║╠═╝║ ║╠╦╝ ║ ╚═╗
+# ╩╩ ╩╩  ╚═╝╩╚═ ╩ ╚═╝ IMPORTS
+# ==================================================
+# Compound structure of any HostObjAttributes type (walls, floors, roofs, ceilings)
+# read into the 'host_types' and 'layers' tables of Snippets._snapshot.
+from Autodesk.Revit.DB import BuiltInParameter
+
+# Custom Imports
+from Snippets._scanner import BASIC_FAMILIES, HOST_KINDS, id_int
+from Snippets._cache   import document_cache
+from Snippets._params  import read_parameters, table_rows
+
+# ╦  ╦╔═╗╦═╗╦╔═╗╔╗ ╦  ╔═╗╔═╗
+# ╚╗╔╝╠═╣╠╦╝║╠═╣╠╩╗║  ║╣ ╚═╗
+#  ╚╝ ╩ ╩╩╚═╩╩ ╩╚═╝╩═╝╚═╝╚═╝ VARIABLES
+# ==================================================
+# 'host_types' column -> parameter of the type. (Name as text, the others as shown in Properties)
+TYPE_PARAMS = [('name',                BuiltInParameter.SYMBOL_NAME_PARAM),
+               ('function',            BuiltInParameter.FUNCTION_PARAM),
+               ('structural_material', BuiltInParameter.STRUCTURAL_MATERIAL_PARAM)]
+
+_material_names = document_cache('material_names', max_size=8)   # {material id: name} per document state
+
+
+# ╔═╗╦  ╔═╗╔═╗╔═╗╔═╗╔═╗
+# ║  ║  ╠═╣╚═╗╚═╗║╣ ╚═╗
+# ╚═╝╩═╝╩ ╩╚═╝╚═╝╚═╝╚═╝ CLASSES
+# ==================================================
+class MaterialCache(object):
+    """Material names by id. Types share a handful of materials,
+    so each one is fetched from the document only once per document state, across button clicks."""
+
+    def __init__(self, doc):
+        self.doc    = doc
+        self._names = _material_names.get(doc, dict)
+
+    def name(self, material_id):
+        #type: (ElementId) -> str
+        """Name of a material, or None for <By Category>/missing materials."""
+        key = id_int(material_id)
+        if key not in self._names:
+            material = self.doc.GetElement(material_id)
+            self._names[key] = material.Name if material else None
+        return self._names[key]
+
+
+class StructureReader(object):
+    """Read host types and their layers into plain records.
+    The parameters of the types are read in one pass (Snippets._params).
+
+    e.g.
+    reader         = StructureReader(doc)
+    record, layers = reader.read('roof_types', roof_type)
+    for record, layers in reader.read_all('wall_types', wall_types): ..."""
+
+    def __init__(self, doc):
+        self.materials = MaterialCache(doc)
+
+    def read(self, bucket, host_type):
+        #type: (str, HostObjAttributes) -> tuple
+        """Record of a type reported by a structure check and the records of its layers.
+        :param bucket:    ModelIndex bucket of the type. One of HOST_KINDS.
+        :param host_type: WallType, FloorType, RoofType or CeilingType.
+        :return:          (type record, [layer records]) or (None, []) if the type isn't reported."""
+        found = self.read_all(bucket, [host_type])
+        return found[0] if found else (None, [])
+
+    def read_all(self, bucket, host_types):
+        #type: (str, list) -> list
+        """[(type record, [layer records])] of the types of a bucket reported by a structure check."""
+        family     = BASIC_FAMILIES.get(bucket)
+        host_types = [t for t in host_types if t.FamilyName == family]
+        values     = table_rows(read_parameters(host_types, TYPE_PARAMS))
+
+        found = []
+        for host_type, record in zip(host_types, values):
+            structure = host_type.GetCompoundStructure()
+            record['kind']  = HOST_KINDS[bucket]
+            record['width'] = structure.GetWidth() if structure else 0.0
+            found.append((record, self._read_layers(record['id'], structure)))
+        return found
+
+    def _read_layers(self, type_id, structure):
+        if not structure:
+            return []
+
+        first_core = structure.GetFirstCoreLayerIndex()
+        last_core  = structure.GetLastCoreLayerIndex()
+        material   = self.materials.name
+        return [{'type_id':  type_id,
+                 'function': layer.Function.ToString(),
+                 'material': material(layer.MaterialId),
+                 'width':    layer.Width,
+                 'is_core':  first_core <= int(layer.LayerId) <= last_core}
+                for layer in structure.GetLayers()]